@@ -39,7 +39,8 @@ SQL_CREATE_TABLE_STATEMENT = (
     f" PRIMARY INDEX id;"
 )
 SQL_INSERT_STATEMENT = f"INSERT INTO {FIREBOLT_SAMPLE_TABLE} values (%(id)s, 'name');"
-SQL_LIST = [SQL_INSERT_STATEMENT % {"id": n} for n in range(0, 10)]
+SQL_INSERT_PARAMETERIZED = f"INSERT INTO {FIREBOLT_SAMPLE_TABLE} values (?, 'name');"
+PARAMETERS_BATCH = [[n] for n in range(0, 10)]
 SELECT_STATEMENT_SQL_STRING = f"SELECT * FROM {FIREBOLT_SAMPLE_TABLE} LIMIT 10;"
 SQL_DROP_TABLE_STATEMENT = f"DROP TABLE IF EXISTS {FIREBOLT_SAMPLE_TABLE};"
 
@@ -60,9 +61,10 @@ with DAG(
         sql=SQL_CREATE_TABLE_STATEMENT,
     )
 
-    firebolt_op_sql_list = FireboltOperator(
-        task_id="firebolt_op_sql_list",
-        sql=SQL_LIST,
+    firebolt_op_parameters_batch = FireboltOperator(
+        task_id="firebolt_op_parameters_batch",
+        sql=SQL_INSERT_PARAMETERIZED,
+        parameters_batch=PARAMETERS_BATCH,
     )
 
     firebolt_op_with_params = FireboltOperator(
@@ -94,7 +96,7 @@ with DAG(
     (
         firebolt_start_engine
         >> firebolt_op_sql_create_table
-        >> firebolt_op_sql_list
+        >> firebolt_op_parameters_batch
         >> firebolt_op_with_params
         >> firebolt_op_sql_str
         >> firebolt_op_sql_drop_table
@@ -17,20 +17,90 @@
 # under the License.
 #
 
+import asyncio
+import hashlib
+import inspect
 import logging
+import time
 from collections import namedtuple
-from typing import Any, Dict, List, Optional, Tuple, Union
+from contextlib import ExitStack, closing, contextmanager
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+from airflow.stats import Stats
 from airflow.version import version as airflow_version
+from firebolt.async_db import Connection as AsyncConnection
+from firebolt.async_db import Cursor as AsyncCursor
+from firebolt.async_db import connect as async_connect
 from firebolt.client import DEFAULT_API_URL
 from firebolt.client.auth import Auth, ClientCredentials, UsernamePassword
 from firebolt.db import Connection, Cursor, connect
 from firebolt.model.V1.engine import Engine as EngineV1
 from firebolt.model.V2.engine import Engine as EngineV2
 from firebolt.service.manager import ResourceManager
-from firebolt.utils.exception import FireboltError, QueryTimeoutError
+from firebolt.service.V1.types import (
+    EngineStatusSummary as EngineStatusSummaryV1,
+)
+from firebolt.service.V2.types import EngineStatus as EngineStatusV2
+from firebolt.utils.exception import (
+    FireboltEngineError,
+    FireboltError,
+    QueryTimeoutError,
+)
+
+from firebolt_provider.utils.cache import QueryResultCache
+from firebolt_provider.utils.concurrency import EngineSlotLimiter
+from firebolt_provider.utils.engine_pool import get_router
+from firebolt_provider.utils.profiling import parse_plan
+from firebolt_provider.utils.registry import Registry
+from firebolt_provider.utils.retry import backoff_delay, is_transient
+from firebolt_provider.utils.schema import (
+    SCHEMA_QUERY,
+    Column,
+    SchemaCache,
+    Schemas,
+    get_schema_cache,
+    parse_schema_rows,
+)
+from firebolt_provider.utils.sql import (
+    DDL_KEYWORDS,
+    is_cacheable,
+    is_idempotent,
+    is_read_only,
+    iter_statements,
+    join_statements,
+    modified_table,
+    referenced_tables,
+    statement_keyword,
+)
+from firebolt_provider.utils.sql_log import (
+    StatementTimings,
+    fingerprint,
+    preview,
+)
+from firebolt_provider.utils.transport import (
+    SharedTransport,
+    client_verify,
+    get_transport,
+    share_transport,
+)
 
 if airflow_version.startswith("1.10"):
+    from airflow.hooks.base_hook import BaseHook  # type: ignore
     from airflow.hooks.dbapi_hook import DbApiHook  # type: ignore
     from airflow.models.connection import Connection as AirflowConnection
 
@@ -39,12 +109,20 @@ if airflow_version.startswith("1.10"):
         AirflowConnection._types.append(("firebolt", "Firebolt"))
 else:
     # Airflow 2.0 path for the base class
+    from airflow.hooks.base import BaseHook
     from airflow.hooks.dbapi import DbApiHook
 
 # Reduce noise from httpx logger
 httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
 
+# Bulk inserts with executemany are only supported by newer SDK versions
+_EXECUTEMANY_BULK_INSERT = (
+    "bulk_insert" in inspect.signature(Cursor.executemany).parameters
+)
+
+T = TypeVar("T")
+
 
 class FireboltHook(DbApiHook):
     """
@@ -60,8 +138,64 @@ class FireboltHook(DbApiHook):
     :type database: Optional[str]
     :param engine_name: name of firebolt engine
     :type engine_name: Optional[str]
+    :param engine_pool: names of engines to spread the queries across.
+        Every ``run`` goes to the running engine with the fewest statements
+        in flight, a stopped engine is skipped. When no engine is running,
+        the first one is used and starts on connection. A run failing with
+        an engine error before any of its statements completed is moved to
+        another engine. Can also be set with the ``engine_pool`` connection
+        extra, as a list or a comma-separated string. Ignored when
+        ``engine_name`` is given.
+    :type engine_pool: Optional[List[str]]
+    :param primary_engine: engine to run all the non read-only statements on
+        when ``engine_pool`` is used. Can also be set with the
+        ``primary_engine`` connection extra.
+    :type primary_engine: Optional[str]
+    :param max_concurrent_statements: maximum number of runs executing on an
+        engine at the same time, across all the processes sharing
+        ``concurrency_lock_dir``. Runs above the limit wait for a free slot
+        in FIFO order. Can also be set with the ``max_concurrent_statements``
+        connection extra.
+    :type max_concurrent_statements: Optional[int]
+    :param concurrency_lock_dir: directory used to coordinate
+        ``max_concurrent_statements``, it has to be shared by all the workers
+        for the limit to be global. Can also be set with the
+        ``concurrency_lock_dir`` connection extra.
+    :type concurrency_lock_dir: Optional[str]
+    :param result_cache_ttl: if set, results of SELECT queries run with
+        ``get_records`` and ``get_first`` are cached on local disk for this
+        number of seconds. Cached results of a table are invalidated by
+        statements modifying it through the hook or by
+        :meth:`invalidate_cached_results`. Queries of ``information_schema``
+        are never cached. Only hooks created with this parameter use the
+        cache, so operators and sensors always see current results.
+    :type result_cache_ttl: Optional[float]
+    :param result_cache_dir: directory of the result cache. Can also be set
+        with the ``result_cache_dir`` connection extra.
+    :type result_cache_dir: Optional[str]
+    :param schema_cache_ttl: maximum age in seconds of the table schemas
+        returned by :meth:`get_table_schema`, 300 by default. Can also be set
+        with the ``schema_cache_ttl`` connection extra.
+    :type schema_cache_ttl: Optional[float]
+    :param statement_retries: number of times a statement failing with a
+        transient error (network failure, HTTP 5xx, restarting engine) is
+        retried in place, with jittered exponential backoff. Only read-only
+        and idempotent statements are retried.
+    :type statement_retries: int
+    :param retry_budget: maximum number of statement retries of a single
+        ``run``, so a failing engine doesn't retry every statement
+    :type retry_budget: int
+    :param http2: whether to use HTTP/2, which requires the ``h2`` package.
+        Can also be set with the ``http2`` connection extra.
+    :type http2: Optional[bool]
+    :param compression: whether to accept compressed responses, True by
+        default. Can also be set with the ``compression`` connection extra.
+    :type compression: Optional[bool]
     """
 
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+
     conn_name_attr = "firebolt_conn_id"
     default_conn_name = "firebolt_default"
     conn_type = "firebolt"
@@ -77,7 +211,17 @@ class FireboltHook(DbApiHook):
             "database",
             "engine_name",
             "account_name",
+            "engine_pool",
+            "primary_engine",
+            "max_concurrent_statements",
+            "concurrency_lock_dir",
+            "result_cache_ttl",
+            "result_cache_dir",
+            "schema_cache_ttl",
+            "http2",
+            "compression",
         ],
+        defaults=[None, None, None, None, None, None, None, False, True],
     )
 
     @staticmethod
@@ -122,6 +266,17 @@ class FireboltHook(DbApiHook):
         engine_name: Optional[str] = None,
         query_timeout: Optional[float] = None,
         fail_on_query_timeout: bool = True,
+        engine_pool: Optional[List[str]] = None,
+        primary_engine: Optional[str] = None,
+        max_concurrent_statements: Optional[int] = None,
+        concurrency_lock_dir: Optional[str] = None,
+        result_cache_ttl: Optional[float] = None,
+        result_cache_dir: Optional[str] = None,
+        schema_cache_ttl: Optional[float] = None,
+        statement_retries: int = 3,
+        retry_budget: int = 10,
+        http2: Optional[bool] = None,
+        compression: Optional[bool] = None,
         *args: Optional[str],
         **kwargs: Optional[str],
     ) -> None:
@@ -131,6 +286,35 @@ class FireboltHook(DbApiHook):
         self.engine_name = engine_name
         self.query_timeout = query_timeout
         self.fail_on_query_timeout = fail_on_query_timeout
+        self.engine_pool = engine_pool
+        self.primary_engine = primary_engine
+        self.max_concurrent_statements = max_concurrent_statements
+        self.concurrency_lock_dir = concurrency_lock_dir
+        self.result_cache_ttl = result_cache_ttl
+        self.result_cache_dir = result_cache_dir
+        self.schema_cache_ttl = schema_cache_ttl
+        self.statement_retries = statement_retries
+        self.retry_budget = retry_budget
+        self.http2 = http2
+        self.compression = compression
+        self._retries_left = retry_budget
+        # Index and timings of the statements of the current run
+        self._statement_index = 0
+        self._timings = StatementTimings()
+        self._result_cache: Optional[QueryResultCache] = None
+        # Schema cache of the database the hook last connected to
+        self._schema_cache: Optional[SchemaCache] = None
+        self._schema_database: Optional[str] = None
+        # Statements of the current run and resources held until it ends
+        self._routing_sql: Optional[Union[str, List[str]]] = None
+        self._run_stack: Optional[ExitStack] = None
+        # Pool engines of the current run, the one it's routed to and the
+        # ones it failed on
+        self._pool_engines: List[str] = []
+        self._routed_engine: Optional[str] = None
+        self._failed_engines: List[str] = []
+        self._resource_manager: Optional[ResourceManager] = None
+        self._auth: Optional[Auth] = None
 
     def _get_conn_params(self) -> "ConnectionParameters":
         """
@@ -144,6 +328,34 @@ class FireboltHook(DbApiHook):
         engine_name = self.engine_name or conn.host
         api_endpoint = conn.extra_dejson.get("api_endpoint", DEFAULT_API_URL)
         account_name = conn.extra_dejson.get("account_name", None)
+        # An explicit engine takes precedence over the pool
+        engine_pool = None
+        if not self.engine_name:
+            engine_pool = self.engine_pool or conn.extra_dejson.get("engine_pool")
+        if isinstance(engine_pool, str):
+            engine_pool = [name.strip() for name in engine_pool.split(",")]
+        primary_engine = self.primary_engine or conn.extra_dejson.get("primary_engine")
+        max_concurrent_statements = self.max_concurrent_statements or (
+            conn.extra_dejson.get("max_concurrent_statements")
+        )
+        concurrency_lock_dir = self.concurrency_lock_dir or (
+            conn.extra_dejson.get("concurrency_lock_dir")
+        )
+        result_cache_dir = self.result_cache_dir or (
+            conn.extra_dejson.get("result_cache_dir")
+        )
+        schema_cache_ttl = self.schema_cache_ttl or (
+            conn.extra_dejson.get("schema_cache_ttl")
+        )
+
+        http2 = (
+            conn.extra_dejson.get("http2", False) if self.http2 is None else self.http2
+        )
+        compression = (
+            conn.extra_dejson.get("compression", True)
+            if self.compression is None
+            else self.compression
+        )
 
         if not (conn.login and conn.password):
             raise FireboltError("Authentication credentials are missing")
@@ -155,60 +367,578 @@ class FireboltHook(DbApiHook):
             database=database,
             engine_name=engine_name,
             account_name=account_name,
+            engine_pool=engine_pool or None,
+            primary_engine=primary_engine,
+            max_concurrent_statements=(
+                int(max_concurrent_statements) if max_concurrent_statements else None
+            ),
+            concurrency_lock_dir=concurrency_lock_dir,
+            result_cache_ttl=(
+                float(self.result_cache_ttl) if self.result_cache_ttl else None
+            ),
+            result_cache_dir=result_cache_dir,
+            schema_cache_ttl=float(schema_cache_ttl) if schema_cache_ttl else None,
+            http2=bool(http2),
+            compression=bool(compression),
         )
 
     def get_conn(self) -> Connection:
         """Return Firebolt connection object"""
         conn_config = self._get_conn_params()
-        auth = _determine_auth(conn_config.client_id, conn_config.client_secret)
-        conn = connect(
-            auth=auth,
-            api_endpoint=conn_config.api_endpoint,
-            database=conn_config.database,
-            engine_name=conn_config.engine_name,
-            account_name=conn_config.account_name,
+        self._init_result_cache(conn_config)
+        self._schema_cache = get_schema_cache(
+            conn_config.api_endpoint, conn_config.account_name
+        )
+        self._schema_database = conn_config.database
+        if conn_config.engine_pool:
+            return self._connect_to_pool(conn_config)
+        return self._connect(conn_config, conn_config.engine_name)
+
+    def get_conn_to(
+        self,
+        database: Optional[str],
+        engine_name: Optional[str],
+        conn_config: Optional["ConnectionParameters"] = None,
+    ) -> Connection:
+        """
+        Return Firebolt connection to another database and/or engine
+
+        All connections of the hook share its authentication, so the access
+        token is only requested once.
+
+        :param database: database to connect to, the hook one if None
+        :param engine_name: engine to connect to, the hook one if None
+        :param conn_config: connection parameters to reuse, they are read
+            from the Airflow connection if not provided
+        """
+        conn_config = conn_config or self._get_conn_params()
+        conn_config = conn_config._replace(
+            database=database or conn_config.database,
+            engine_name=engine_name or conn_config.engine_name,
+        )
+        return self._connect(conn_config, conn_config.engine_name)
+
+    def _get_auth(self, conn_config: "ConnectionParameters") -> Auth:
+        if self._auth is None:
+            self._auth = _get_shared_auth(
+                conn_config.api_endpoint,
+                conn_config.client_id,
+                conn_config.client_secret,
+            )
+        return self._auth
+
+    def _share_transport(
+        self, client: Any, conn_config: "ConnectionParameters"
+    ) -> None:
+        """Route an SDK client through the account keep-alive connection pool"""
+        pool = get_transport(
+            conn_config.api_endpoint,
+            conn_config.account_name,
+            conn_config.http2,
+            client_verify(client),
         )
+        share_transport(client, SharedTransport(pool, conn_config.compression))
 
+    def _connect(
+        self, conn_config: "ConnectionParameters", engine_name: Optional[str]
+    ) -> Connection:
+        with ExitStack() as stack:
+            if self._run_stack is not None and conn_config.max_concurrent_statements:
+                limiter = EngineSlotLimiter(
+                    engine_name or "default",
+                    conn_config.max_concurrent_statements,
+                    lock_dir=conn_config.concurrency_lock_dir,
+                )
+                stack.enter_context(limiter.slot())
+
+            conn = connect(
+                auth=self._get_auth(conn_config),
+                api_endpoint=conn_config.api_endpoint,
+                database=conn_config.database,
+                engine_name=engine_name,
+                account_name=conn_config.account_name,
+            )
+            self._share_transport(conn._client, conn_config)
+
+            # Keep the slot until the end of the run
+            if self._run_stack is not None:
+                self._run_stack.push(stack.pop_all())
         return conn
 
+    def _connect_to_pool(self, conn_config: "ConnectionParameters") -> Connection:
+        """
+        Connect to the least loaded running engine of the pool
+
+        Write statements go to the primary engine, if it is configured.
+        An engine failing to connect is marked as stopped and the next
+        one is tried. Engines the run already failed on are skipped.
+        """
+        router = get_router(conn_config.api_endpoint, conn_config.account_name)
+        if conn_config.primary_engine and (
+            self._routing_sql is None or not is_read_only(self._routing_sql)
+        ):
+            engines = [conn_config.primary_engine]
+        else:
+            engines = list(conn_config.engine_pool)
+        self._pool_engines = list(engines)
+        engines = [name for name in engines if name not in self._failed_engines]
+
+        while True:
+            engine_name = router.choose(engines, self.is_engine_running)
+            try:
+                conn = self._connect(conn_config, engine_name)
+            except FireboltEngineError:
+                if len(engines) == 1:
+                    raise
+                self.log.warning("Engine %s is unavailable, failing over", engine_name)
+                router.mark_stopped(engine_name)
+                engines.remove(engine_name)
+                continue
+
+            self.log.info("Routing statements to engine %s", engine_name)
+            if self._run_stack is not None:
+                self._routed_engine = engine_name
+                router.track_start(engine_name)
+                self._run_stack.callback(router.track_end, engine_name)
+            return conn
+
+    def is_engine_running(self, engine_name: str) -> bool:
+        """Check whether the engine is running"""
+        if self._resource_manager is None:
+            self._resource_manager = self.get_resource_manager()
+        engine = self._resource_manager.engines.get_by_name(engine_name)
+        if isinstance(engine, EngineV1):
+            return (
+                engine.current_status_summary
+                == EngineStatusSummaryV1.ENGINE_STATUS_SUMMARY_RUNNING
+            )
+        return engine.current_status == EngineStatusV2.RUNNING
+
     def get_resource_manager(self) -> ResourceManager:
         """Return Resource Manager"""
         conn_config = self._get_conn_params()
-        auth = _determine_auth(conn_config.client_id, conn_config.client_secret)
-
         manager = ResourceManager(
-            auth=auth,
+            auth=self._get_auth(conn_config),
             api_endpoint=conn_config.api_endpoint,
             account_name=conn_config.account_name,
         )
-
+        self._share_transport(manager._client, conn_config)
+        # Only Firebolt 2.0 managers hold a connection to the system engine
+        system_conn = getattr(manager, "_connection", None)
+        if system_conn is not None:
+            self._share_transport(system_conn._client, conn_config)
         return manager
 
+    def warmup(self) -> None:
+        """
+        Authenticate and open a connection to the engine ahead of the first query
+
+        The access token, the engine URL and the open keep-alive connection
+        are shared by all the hooks of the process using the same account,
+        so the statements run afterwards skip the connection setup.
+        """
+        started = time.monotonic()
+        with closing(self.get_conn()) as conn, closing(conn.cursor()) as cur:
+            cur.execute("SELECT 1")
+        self.log.info("Warmed up connection in %.2fs", time.monotonic() - started)
+
+    def _init_result_cache(self, conn_config: "ConnectionParameters") -> None:
+        if self._result_cache is None and conn_config.result_cache_ttl:
+            self._result_cache = QueryResultCache(
+                conn_config.result_cache_ttl, conn_config.result_cache_dir
+            )
+
+    def _get_cached(
+        self,
+        fetch: Callable[..., Any],
+        sql: Union[str, List[str]],
+        parameters: Optional[Sequence],
+    ) -> Any:
+        """Return result of fetch for read-only sql from the cache, if enabled."""
+        if not self.result_cache_ttl:
+            return fetch(sql, parameters)
+        conn_config = self._get_conn_params()
+        self._init_result_cache(conn_config)
+        if self._result_cache is None or not is_cacheable(sql):
+            return fetch(sql, parameters)
+
+        # Results are only shared by connections with the same permissions
+        key = self._result_cache.make_key(
+            fetch.__name__,
+            sql,
+            parameters,
+            conn_config.api_endpoint,
+            conn_config.account_name,
+            conn_config.client_id,
+            conn_config.database,
+            conn_config.engine_name,
+        )
+        hit, result = self._result_cache.get(key)
+        if not hit:
+            result = fetch(sql, parameters)
+            statements = [sql] if isinstance(sql, str) else sql
+            tables = set().union(*(referenced_tables(s) for s in statements))
+            self._result_cache.set(key, result, tables)
+        return result
+
+    def get_records(
+        self, sql: Union[str, List[str]], parameters: Optional[Sequence] = None
+    ) -> Any:
+        return self._get_cached(super().get_records, sql, parameters)
+
+    def get_first(
+        self, sql: Union[str, List[str]], parameters: Optional[Sequence] = None
+    ) -> Any:
+        return self._get_cached(super().get_first, sql, parameters)
+
+    def invalidate_cached_results(self, table: str) -> int:
+        """
+        Remove cached results of all the queries reading from the table
+
+        Returns:
+            number of removed results
+        """
+        self._init_result_cache(self._get_conn_params())
+        if self._result_cache is None:
+            return 0
+        return self._result_cache.invalidate_table(table)
+
     def _run_command(
-        self, cur: Cursor, sql_statement: str, parameters: Optional[List[str]]
+        self, cur: Cursor, sql_statement: str, parameters: Optional[Sequence]
     ) -> None:
         """Run a statement using an already open cursor."""
+        self._statement_index += 1
         if self.log_sql:
             self.log.info(
-                "Running statement: %s, parameters: %s", sql_statement, parameters
+                "Running statement %s [%s]: %s, parameters: %s",
+                self._statement_index,
+                fingerprint(sql_statement),
+                preview(sql_statement),
+                preview(parameters) if parameters else None,
             )
 
         if parameters:
-            cur.execute(sql_statement, parameters, timeout_seconds=self.query_timeout)
+            execute = partial(
+                cur.execute,
+                sql_statement,
+                parameters,
+                timeout_seconds=self.query_timeout,
+            )
         else:
-            cur.execute(sql_statement, timeout_seconds=self.query_timeout)
+            execute = partial(
+                cur.execute, sql_statement, timeout_seconds=self.query_timeout
+            )
+        started = time.monotonic()
+        self._execute_with_retries([sql_statement], execute)
+        self._timings.add(
+            self._statement_index,
+            time.monotonic() - started,
+            cur.rowcount,
+            sql_statement,
+        )
+
+        self._invalidate_caches(sql_statement)
 
         # According to PEP 249, this is -1 when query result is not applicable.
         if cur.rowcount >= 0:
             self.log.info("Rows affected: %s", cur.rowcount)
 
-    def run(self, *args: Any, **kwargs: Any) -> Any:
+    def _run_batch(self, cur: Cursor, sql_statements: List[str]) -> None:
+        """Run several statements in a single request."""
+        first_index = self._statement_index + 1
+        self._statement_index += len(sql_statements)
+        batch = join_statements(sql_statements)
+        if self.log_sql:
+            self.log.info(
+                "Running statements %s-%s in one request [%s]: %s",
+                first_index,
+                self._statement_index,
+                fingerprint(batch),
+                preview(batch),
+            )
+
+        execute = partial(
+            cur.execute,
+            batch,
+            skip_parsing=True,
+            timeout_seconds=self.query_timeout,
+        )
+        started = time.monotonic()
+        self._execute_with_retries(sql_statements, execute)
+        self._timings.add(first_index, time.monotonic() - started, -1, batch)
+        for sql_statement in sql_statements:
+            self._invalidate_caches(sql_statement)
+
+    def _execute_with_retries(
+        self, sql_statements: List[str], execute: Callable[[], Any]
+    ) -> None:
+        """Call execute, retrying transient failures of idempotent statements."""
+        attempt = 0
+        while True:
+            try:
+                execute()
+                return
+            except Exception as e:
+                if not (
+                    attempt < self.statement_retries
+                    and self._retries_left > 0
+                    and is_transient(e)
+                    and all(is_idempotent(stmt) for stmt in sql_statements)
+                ):
+                    raise
+                if isinstance(e, FireboltEngineError) and self._can_fail_over():
+                    # Another engine of the pool can run it right away
+                    raise
+                attempt += 1
+                self._retries_left -= 1
+                delay = backoff_delay(
+                    attempt, self.RETRY_BASE_DELAY, self.RETRY_MAX_DELAY
+                )
+                self.log.warning(
+                    "Transient error, retry %s of %s in %.1f seconds: %s",
+                    attempt,
+                    self.statement_retries,
+                    delay,
+                    e,
+                )
+                Stats.incr("firebolt.statement_retries")
+                time.sleep(delay)
+
+    def _invalidate_caches(self, sql_statement: str) -> None:
+        """Drop cached results and schemas made stale by the statement."""
+        if is_read_only(sql_statement):
+            return
+        table = modified_table(sql_statement)
+        if not table:
+            return
+        if self._result_cache is not None:
+            self._result_cache.invalidate_table(table)
+        if (
+            self._schema_cache is not None
+            and self._schema_database
+            and statement_keyword(sql_statement) in DDL_KEYWORDS
+        ):
+            self._schema_cache.invalidate(self._schema_database)
+
+    def get_table_schema(self, table: str) -> Optional[List[Column]]:
+        """
+        Return columns of a table of the hook database, None if it doesn't exist
+
+        Schemas of all the tables of the database are loaded with a single
+        information_schema query and cached by the process for
+        ``schema_cache_ttl`` seconds. DDL statements run through the hook
+        invalidate the cache.
+        """
+        conn_config = self._get_conn_params()
+        if not conn_config.database:
+            raise FireboltError("Database is required to get table schemas")
+        cache = get_schema_cache(conn_config.api_endpoint, conn_config.account_name)
+        return cache.get_table(
+            conn_config.database,
+            table,
+            self._load_schemas,
+            max_age=conn_config.schema_cache_ttl,
+        )
+
+    def _load_schemas(self) -> Schemas:
+        with closing(self.get_conn()) as conn, closing(conn.cursor()) as cur:
+            cur.execute(SCHEMA_QUERY, timeout_seconds=self.query_timeout)
+            return parse_schema_rows(cur.fetchall())
+
+    @contextmanager
+    def _run_context(self, sql: Optional[Union[str, List[str]]]) -> Iterator[None]:
+        """Track statements of a run and release its resources at the end."""
+        self._routing_sql = sql
+        self._run_stack = ExitStack()
+        self._routed_engine = None
+        self._retries_left = self.retry_budget
+        self._statement_index = 0
+        self._timings = StatementTimings()
         try:
-            return super().run(*args, **kwargs)
+            yield
         except QueryTimeoutError:
             if self.fail_on_query_timeout:
                 raise
-            return None
+        finally:
+            if len(self._timings) > 1:
+                self.log.info("Statement timings: %s", self._timings.format())
+            self._run_stack.close()
+            self._run_stack = None
+            self._routing_sql = None
+
+    def run(self, sql: Union[str, List[str]], *args: Any, **kwargs: Any) -> Any:
+        self._failed_engines = []
+        try:
+            while True:
+                with self._run_context(sql):
+                    try:
+                        return super().run(sql, *args, **kwargs)
+                    except FireboltEngineError as e:
+                        if not self._can_fail_over():
+                            raise
+                        self._fail_over(e)
+                        continue
+                # Only reached when a query timeout is ignored
+                return None
+        finally:
+            self._failed_engines = []
+
+    def _can_fail_over(self) -> bool:
+        """Check whether the run can be moved to another engine of the pool."""
+        if self._routed_engine is None or len(self._timings):
+            # Not routed, or statements already completed on the engine
+            return False
+        failed = self._failed_engines + [self._routed_engine]
+        return any(name not in failed for name in self._pool_engines)
+
+    def _fail_over(self, error: Exception) -> None:
+        assert self._routed_engine is not None
+        self.log.warning(
+            "Engine %s failed, moving the run to another engine: %s",
+            self._routed_engine,
+            error,
+        )
+        conn_config = self._get_conn_params()
+        router = get_router(conn_config.api_endpoint, conn_config.account_name)
+        router.mark_stopped(self._routed_engine)
+        self._failed_engines.append(self._routed_engine)
+
+    @staticmethod
+    def split_sql_string(sql: str, strip_semicolon: bool = False) -> List[str]:
+        """
+        Split string into multiple SQL statements
+
+        Semicolons inside strings, comments and dollar-quoted blocks
+        are handled, see :func:`firebolt_provider.utils.sql.iter_statements`.
+        """
+        suffix = "" if strip_semicolon else ";"
+        return [statement + suffix for statement in iter_statements(sql)]
+
+    def run_script(
+        self,
+        script: Union[str, Iterable[str]],
+        parameters: Optional[Sequence] = None,
+        batch_size: int = 1,
+    ) -> int:
+        """
+        Run a multi-statement script, splitting it into statements lazily
+
+        Args:
+            script: SQL text or an iterable of text chunks, e.g. an open
+             file, consumed as the statements run
+            parameters: the parameters to render every statement with
+            batch_size: maximum number of consecutive statements sent in one
+             request. Only statements not returning rows (DDL and DML) are
+             batched, read-only and SET statements are always sent alone.
+             Batching is disabled when parameters are provided.
+
+        Returns:
+            number of statements run
+        """
+        if parameters:
+            batch_size = 1
+
+        statements = requests = 0
+        with self._run_context(None):
+            with closing(self.get_conn()) as conn, closing(conn.cursor()) as cur:
+                for batch in _batch_statements(iter_statements(script), batch_size):
+                    if len(batch) == 1:
+                        self._run_command(cur, batch[0], parameters)
+                    else:
+                        self._run_batch(cur, batch)
+                    statements += len(batch)
+                    requests += 1
+                if not self.get_autocommit(conn):
+                    conn.commit()
+            self.log.info("Ran %s statements in %s requests", statements, requests)
+        return statements
+
+    def run_many(
+        self,
+        sql: str,
+        seq_of_parameters: Iterable[Sequence],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Run a parameterized statement once for every set of parameters
+
+        Parameter sets are sent with ``executemany`` in groups of at most
+        ``batch_size``. INSERT statements are sent as a single bulk insert
+        per group where the Firebolt SDK supports it.
+
+        Args:
+            sql: a single statement with ``?`` placeholders
+            seq_of_parameters: parameter sets, consumed lazily
+            batch_size: maximum number of parameter sets sent in one request
+
+        Returns:
+            total number of affected rows
+        """
+        if batch_size < 1:
+            raise FireboltError("batch_size must be a positive number")
+        sql = sql.strip().rstrip(";")
+        kwargs: Dict[str, Any] = {"timeout_seconds": self.query_timeout}
+        if _EXECUTEMANY_BULK_INSERT and statement_keyword(sql) == "INSERT":
+            kwargs["bulk_insert"] = True
+
+        total = requests = 0
+        with self._run_context(sql):
+            with closing(self.get_conn()) as conn, closing(conn.cursor()) as cur:
+                for batch in _chunks(seq_of_parameters, batch_size):
+                    requests += 1
+                    if self.log_sql:
+                        self.log.info(
+                            "Running request %s [%s]: %s, %s parameter sets",
+                            requests,
+                            fingerprint(sql),
+                            preview(sql),
+                            len(batch),
+                        )
+                    started = time.monotonic()
+                    cur.executemany(sql, batch, **kwargs)
+                    rowcount = _total_rowcount(cur)
+                    self._timings.add(
+                        requests, time.monotonic() - started, rowcount, sql
+                    )
+                    total += rowcount
+                self._invalidate_caches(sql)
+                if not self.get_autocommit(conn):
+                    conn.commit()
+            self.log.info("Rows affected: %s in %s requests", total, requests)
+        return total
+
+    def explain(
+        self,
+        sql: str,
+        parameters: Optional[Sequence] = None,
+        analyze: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Return the execution plan of a statement
+
+        Args:
+            sql: the statement to explain
+            parameters: the parameters to render the statement with
+            analyze: if True, run ``EXPLAIN (ANALYZE)``, which executes
+             the statement and reports per-operator execution metrics
+
+        Returns:
+            dict with the statement, the plan text and the plan operators,
+            see :func:`firebolt_provider.utils.profiling.parse_plan`
+        """
+        prefix = "EXPLAIN (ANALYZE) " if analyze else "EXPLAIN "
+        rows = self.run(
+            prefix + sql, parameters=parameters, handler=lambda cur: cur.fetchall()
+        )
+        plan = "\n".join(
+            str(value) for row in rows or [] for value in row if value is not None
+        )
+        return {
+            "statement": sql,
+            "analyze": analyze,
+            "plan": plan,
+            "operators": parse_plan(plan),
+        }
 
     def _run_action(self, engine: Union[EngineV1, EngineV2], action: str) -> None:
         if action == "start":
@@ -231,6 +961,22 @@ class FireboltHook(DbApiHook):
         rm = self.get_resource_manager()
         return rm.engines.get_by_name(engine_name)
 
+    def get_engine_status(self, engine_name: Optional[str]) -> str:
+        """
+        Return the current status of the engine, e.g. RUNNING or STOPPED
+
+        Args:
+            engine_name: name of the engine, if None, the engine from
+             the connection will be used
+        """
+        engine = self._get_engine(engine_name)
+        if isinstance(engine, EngineV1):
+            summary = engine.current_status_summary
+            if summary is None:
+                return "UNKNOWN"
+            return summary.value.replace("ENGINE_STATUS_SUMMARY_", "")
+        return str(engine.current_status)
+
     def engine_action(self, engine_name: Optional[str], action: str) -> None:
         """
         Performs start or stop of the engine
@@ -252,8 +998,246 @@ class FireboltHook(DbApiHook):
         return True, "Connection successfully tested"
 
 
+def _batch_statements(
+    statements: Iterable[str], batch_size: int
+) -> Iterator[List[str]]:
+    """Group consecutive statements not returning rows into batches."""
+    batch: List[str] = []
+    for statement in statements:
+        if is_read_only(statement) or statement_keyword(statement) == "SET":
+            if batch:
+                yield batch
+                batch = []
+            yield [statement]
+            continue
+        batch.append(statement)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group items into lists of at most size items."""
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _total_rowcount(cur: Cursor) -> int:
+    """Sum row counts of all result sets of the last execution."""
+    total = 0
+    while True:
+        # According to PEP 249, this is -1 when query result is not applicable.
+        total += max(cur.rowcount, 0)
+        if not cur.nextset():
+            return total
+
+
 def _determine_auth(key: str, secret: str, token_cache_flag: bool = True) -> Auth:
     if "@" in key:
         return UsernamePassword(key, secret, token_cache_flag)
     else:
         return ClientCredentials(key, secret, token_cache_flag)
+
+
+_auths: Registry[Tuple[str, str], Auth] = Registry()
+
+
+def _get_shared_auth(api_endpoint: str, key: str, secret: str) -> Auth:
+    """Return the process-wide authentication of a service account."""
+    # Keyed on a hash, so the registry doesn't hold the plaintext secret
+    credentials = hashlib.sha256(f"{key}\0{secret}".encode()).hexdigest()
+    return _auths.get_or_create(
+        (api_endpoint, credentials), partial(_determine_auth, key, secret)
+    )
+
+
+class FireboltAsyncHook(BaseHook):
+    """
+    An asyncio client to interact with Firebolt.
+    Uses the same connection fields as :class:`FireboltHook`.
+
+    All queries of the hook share one connection, opened on first use,
+    and each query runs on its own cursor, so many queries can be run
+    concurrently with ``asyncio.gather``::
+
+        async with FireboltAsyncHook() as hook:
+            counts = await asyncio.gather(
+                *(hook.get_first(f"SELECT COUNT(*) FROM {t}") for t in tables)
+            )
+
+    :param firebolt_conn_id: Reference to
+        :ref:`Firebolt connection id<howto/connection:firebolt>`
+    :type firebolt_conn_id: str
+    :param database: name of firebolt database
+    :type database: Optional[str]
+    :param engine_name: name of firebolt engine
+    :type engine_name: Optional[str]
+    :param query_timeout: timeout of a single query in seconds
+    :type query_timeout: Optional[float]
+    """
+
+    conn_name_attr = "firebolt_conn_id"
+    default_conn_name = "firebolt_default"
+    conn_type = "firebolt"
+    hook_name = "Firebolt"
+
+    def __init__(
+        self,
+        firebolt_conn_id: str = default_conn_name,
+        database: Optional[str] = None,
+        engine_name: Optional[str] = None,
+        query_timeout: Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        self.firebolt_conn_id = firebolt_conn_id
+        self.query_timeout = query_timeout
+        # Connection parameters and engine management are shared with
+        # the synchronous hook, its calls are run in a thread
+        self._hook = FireboltHook(
+            firebolt_conn_id=firebolt_conn_id,
+            database=database,
+            engine_name=engine_name,
+            query_timeout=query_timeout,
+        )
+        self._conn: Optional[AsyncConnection] = None
+        self._conn_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> "FireboltAsyncHook":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def get_conn(self) -> AsyncConnection:
+        """Return the shared Firebolt connection, opening it if needed"""
+        if self._conn_lock is None:
+            self._conn_lock = asyncio.Lock()
+        async with self._conn_lock:
+            if self._conn is None or self._conn.closed:
+                conn_config = await _run_in_thread(self._hook._get_conn_params)
+                self._conn = await async_connect(
+                    auth=_determine_auth(
+                        conn_config.client_id, conn_config.client_secret
+                    ),
+                    api_endpoint=conn_config.api_endpoint,
+                    database=conn_config.database,
+                    engine_name=conn_config.engine_name,
+                    account_name=conn_config.account_name,
+                )
+        return self._conn
+
+    async def close(self) -> None:
+        """Close the shared connection"""
+        if self._conn is not None and not self._conn.closed:
+            await self._conn.aclose()
+        self._conn = None
+
+    async def _execute(
+        self,
+        cursor: AsyncCursor,
+        sql: str,
+        parameters: Optional[Sequence],
+        stream: bool = False,
+    ) -> None:
+        self.log.info(
+            "Running statement [%s]: %s, parameters: %s",
+            fingerprint(sql),
+            preview(sql),
+            preview(parameters) if parameters else None,
+        )
+        if stream:
+            # Rows are read from the response as they are fetched
+            await cursor.execute_stream(sql, parameters or None)
+        elif parameters:
+            await cursor.execute(sql, parameters, timeout_seconds=self.query_timeout)
+        else:
+            await cursor.execute(sql, timeout_seconds=self.query_timeout)
+
+    async def run(
+        self,
+        sql: Union[str, List[str]],
+        parameters: Optional[Sequence] = None,
+        handler: Optional[Callable[[AsyncCursor], Awaitable[T]]] = None,
+    ) -> Any:
+        """
+        Run a statement or a list of statements sequentially on one cursor
+
+        :param sql: the sql statement or a list of statements to be executed
+        :param parameters: the parameters to render the SQL query with
+        :param handler: coroutine function called with the cursor after each
+            statement, its results are returned
+        :return: result of the handler for a single statement, a list of
+            results for a list of statements or None without a handler
+        """
+        statements = [sql] if isinstance(sql, str) else sql
+        conn = await self.get_conn()
+        cursor = conn.cursor()
+        results = []
+        try:
+            for statement in statements:
+                await self._execute(cursor, statement, parameters)
+                if handler is not None:
+                    results.append(await handler(cursor))
+        finally:
+            await cursor.aclose()
+
+        if handler is None:
+            return None
+        return results[-1] if isinstance(sql, str) else results
+
+    async def get_records(
+        self, sql: str, parameters: Optional[Sequence] = None
+    ) -> List[List[Any]]:
+        """Execute the sql and return all the resulting rows"""
+        return await self.run(sql, parameters, handler=lambda cur: cur.fetchall())
+
+    async def get_first(
+        self, sql: str, parameters: Optional[Sequence] = None
+    ) -> Optional[List[Any]]:
+        """Execute the sql and return the first resulting row"""
+        return await self.run(sql, parameters, handler=lambda cur: cur.fetchone())
+
+    async def stream_records(
+        self, sql: str, parameters: Optional[Sequence] = None, batch_size: int = 1000
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Execute the sql and yield the resulting rows, fetching batch_size at once
+
+        The rows are read from the response as they are yielded, so the
+        result is never held in memory as a whole. ``query_timeout`` doesn't
+        apply to streamed queries.
+        """
+        conn = await self.get_conn()
+        cursor = conn.cursor()
+        try:
+            await self._execute(cursor, sql, parameters, stream=True)
+            while True:
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+        finally:
+            await cursor.aclose()
+
+    async def engine_action(self, engine_name: Optional[str], action: str) -> None:
+        """Start or stop the engine, see :meth:`FireboltHook.engine_action`"""
+        await _run_in_thread(self._hook.engine_action, engine_name, action)
+
+    async def get_engine_status(self, engine_name: Optional[str]) -> str:
+        """Return the engine status, see :meth:`FireboltHook.get_engine_status`"""
+        return await _run_in_thread(self._hook.get_engine_status, engine_name)
+
+
+async def _run_in_thread(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking call in the default executor of the running loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args))
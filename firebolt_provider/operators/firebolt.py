@@ -15,17 +15,67 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import Any, List, Optional, Sequence, Union
+import numbers
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import partial
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from uuid import uuid4
 
-from airflow.models import BaseOperator, BaseOperatorLink
+from airflow.exceptions import AirflowException
+from airflow.models import (
+    BaseOperator,
+    BaseOperatorLink,
+    DagBag,
+    DagModel,
+    DagRun,
+)
+from airflow.stats import Stats
+from airflow.utils import timezone
+from airflow.utils.db import create_session
 from airflow.utils.decorators import apply_defaults
+from airflow.utils.state import State
+from sqlalchemy import func  # type: ignore
 
 from firebolt_provider.hooks.firebolt import FireboltHook
+from firebolt_provider.utils.profiling import format_timings
+from firebolt_provider.utils.schema import Column
+from firebolt_provider.utils.sql import (
+    insert_query,
+    is_read_only,
+    join_statements,
+    statement_keyword,
+)
+from firebolt_provider.utils.sql_log import (
+    PREVIEW_LENGTH,
+    SQL_XCOM_KEY,
+    compress,
+    fingerprint,
+    preview,
+)
 
 
 def get_db_hook(
     self: Union[
-        "FireboltOperator", "FireboltStartEngineOperator", "FireboltStopEngineOperator"
+        "FireboltOperator",
+        "FireboltStartEngineOperator",
+        "FireboltStopEngineOperator",
+        "FireboltReplaceTableOperator",
+        "FireboltTableCheckOperator",
+        "FireboltFanOutOperator",
+        "FireboltEnginePrewarmOperator",
     ]
 ) -> FireboltHook:
     """
@@ -79,8 +129,35 @@ class FireboltOperator(BaseOperator):
     :param engine_name: name of engine (will overwrite engine_name defined in
         connection)
     :type engine_name: str
+    :param profile: if True, the plan of every SELECT and INSERT statement
+        is captured before the sql is run. Plans with per-operator metrics
+        are pushed to XCom under the ``firebolt_profile`` key and their
+        timings are logged. Can't be used with ``parameters_batch``.
+    :type profile: bool
+    :param profile_analyze: if True, read-only statements, and the queries
+        of ``INSERT INTO ... SELECT`` statements, are profiled with
+        ``EXPLAIN (ANALYZE)``, which executes them and reports rows and time
+        spent per operator. Every such query therefore runs twice.
+    :type profile_analyze: bool
+    :param max_scan_rows: fail before running the sql if any table scan of
+        a profiled statement reads more rows. Requires ``profile`` and
+        ``profile_analyze``, as only analyzed plans report scanned rows.
+    :type max_scan_rows: Optional[int]
+    :param statement_batch_size: if greater than 1, the sql is split into
+        statements lazily and up to this number of consecutive DDL and DML
+        statements are sent to Firebolt in a single request
+    :type statement_batch_size: int
+    :param parameters_batch: (optional) sets of parameters to run the sql,
+        a single statement, with. The sets are sent to Firebolt with
+        ``executemany``, instead of ``parameters``
+    :type parameters_batch: iterable of iterables
+    :param parameters_batch_size: maximum number of parameter sets of
+        ``parameters_batch`` sent in one request
+    :type parameters_batch_size: int
     """
 
+    PROFILE_XCOM_KEY = "firebolt_profile"
+
     template_fields = ("sql",)
     template_ext = (".sql",)
     ui_color = "#b4e0ff"
@@ -96,9 +173,19 @@ class FireboltOperator(BaseOperator):
         autocommit: bool = False,
         query_timeout: Optional[float] = None,
         fail_on_query_timeout: bool = True,
+        profile: bool = False,
+        profile_analyze: bool = False,
+        max_scan_rows: Optional[int] = None,
+        statement_batch_size: int = 1,
+        parameters_batch: Optional[Iterable[Sequence]] = None,
+        parameters_batch_size: int = 1000,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
+        if max_scan_rows is not None and not (profile and profile_analyze):
+            raise ValueError("max_scan_rows requires profile and profile_analyze")
+        if profile and parameters_batch is not None:
+            raise ValueError("profile can't be used with parameters_batch")
         self.firebolt_conn_id = firebolt_conn_id
         self.sql = sql
         self.database = database
@@ -107,17 +194,81 @@ class FireboltOperator(BaseOperator):
         self.autocommit = autocommit
         self.query_timeout = query_timeout
         self.fail_on_query_timeout = fail_on_query_timeout
+        self.profile = profile
+        self.profile_analyze = profile_analyze
+        self.max_scan_rows = max_scan_rows
+        self.statement_batch_size = statement_batch_size
+        self.parameters_batch = parameters_batch
+        self.parameters_batch_size = parameters_batch_size
 
     def get_db_hook(self) -> FireboltHook:
         return get_db_hook(self)
 
     def execute(self, context) -> Any:  # type: ignore
         """Run query on firebolt"""
-        self.log.info("Executing: %s", self.sql)
+        _log_sql(self, self.sql, context)
 
         hook = self.get_db_hook()
+        if self.profile:
+            self._profile(hook, context)
+        if self.parameters_batch is not None:
+            if not isinstance(self.sql, str):
+                raise AirflowException("parameters_batch requires a single statement")
+            # The total number of affected rows is pushed to XCom
+            return hook.run_many(
+                self.sql, self.parameters_batch, batch_size=self.parameters_batch_size
+            )
+        if self.statement_batch_size > 1:
+            script = (
+                self.sql if isinstance(self.sql, str) else join_statements(self.sql)
+            )
+            hook.run_script(
+                script, parameters=self.parameters, batch_size=self.statement_batch_size
+            )
+            return
         hook.run(sql=self.sql, autocommit=self.autocommit, parameters=self.parameters)
 
+    def _profile(self, hook: FireboltHook, context: Any) -> None:
+        """Capture plans of the statements and check their table scans."""
+        if isinstance(self.sql, str):
+            statements = hook.split_sql_string(self.sql)
+        else:
+            statements = list(self.sql)
+
+        profiles = []
+        for statement in statements:
+            read_only = is_read_only(statement)
+            if not read_only and statement_keyword(statement) != "INSERT":
+                continue
+            query = None if read_only else insert_query(statement)
+            if self.profile_analyze and query:
+                # Inserts can't be analyzed, their query is read-only
+                profile = hook.explain(query, parameters=self.parameters, analyze=True)
+            else:
+                profile = hook.explain(
+                    statement,
+                    parameters=self.parameters,
+                    analyze=self.profile_analyze and read_only,
+                )
+            self.log.info(
+                "Profile of %s:\n%s",
+                preview(statement),
+                format_timings(profile["operators"]),
+            )
+            profiles.append(profile)
+        context["ti"].xcom_push(key=self.PROFILE_XCOM_KEY, value=profiles)
+
+        if self.max_scan_rows is None:
+            return
+        for profile in profiles:
+            for operator in profile["operators"]:
+                rows = operator.get("output_rows", 0)
+                if "table" in operator and rows > self.max_scan_rows:
+                    raise AirflowException(
+                        f"Scan of {operator['table']} reads {rows} rows, more than "
+                        f"{self.max_scan_rows} allowed:\n{profile['statement']}"
+                    )
+
 
 class FireboltStartEngineOperator(BaseOperator):
     """
@@ -181,3 +332,1183 @@ class FireboltStopEngineOperator(BaseOperator):
     def execute(self, context) -> Any:  # type: ignore
         """Stops engine by its name"""
         get_db_hook(self).engine_action(self.engine_name, "stop")
+
+
+class FireboltReplaceTableOperator(BaseOperator):
+    """
+    Fully reloads a Firebolt table without exposing a partially loaded state
+
+    The data is loaded into a shadow table, which is then validated and
+    swapped with the target table by renaming both in a single transaction.
+    Every ``{table}`` placeholder in ``create_table_sql``, ``insert_sql``
+    and ``validation_sql`` is replaced with the shadow table name.
+    If anything fails before the swap, the shadow table is dropped and the
+    target table is left untouched. Shadow tables of crashed reloads are
+    dropped by the next reload once they are older than
+    ``stale_shadow_age``, younger ones may belong to a reload of the same
+    table running at the same time.
+
+    :param table: name of the table to replace
+    :type table: str
+    :param create_table_sql: statement creating the shadow table,
+        e.g. ``CREATE FACT TABLE {table} (id INT) PRIMARY INDEX id`` (templated)
+    :type create_table_sql: str
+    :param insert_sql: statement or a list of statements loading data into
+        the shadow table. Statements of a list are independent slices of
+        the data and are run in parallel. (templated)
+    :type insert_sql: str or list of str
+    :param validation_sql: queries run against the shadow table before the
+        swap. Each of them must return a row with only truthy values,
+        e.g. ``SELECT COUNT(*) > 0 FROM {table}`` (templated)
+    :type validation_sql: str or list of str
+    :param max_parallel_slices: maximum number of ``insert_sql`` slices
+        loaded at the same time
+    :type max_parallel_slices: int
+    :param keep_old_table: if True, the previous version of the table is
+        kept as ``<table>__old_<suffix>`` instead of being dropped. It is
+        still dropped by the next reload.
+    :type keep_old_table: bool
+    :param stale_shadow_age: age after which shadow tables left by other
+        reloads are considered abandoned and dropped. It should be longer
+        than a reload can take.
+    :type stale_shadow_age: datetime.timedelta
+    :param firebolt_conn_id: Firebolt connection id
+    :type firebolt_conn_id: str
+    :param database: name of database (will overwrite database defined
+        in connection)
+    :type database: str
+    :param engine_name: name of engine (will overwrite engine_name defined in
+        connection)
+    :type engine_name: str
+    """
+
+    SHADOW_INFIX = "__shadow_"
+    OLD_INFIX = "__old_"
+    SUFFIX_TIME_FORMAT = "%Y%m%d%H%M%S"
+
+    template_fields = ("create_table_sql", "insert_sql", "validation_sql")
+    template_ext = (".sql",)
+    ui_color = "#b4e0ff"
+
+    @apply_defaults
+    def __init__(
+        self,
+        table: str,
+        create_table_sql: str,
+        insert_sql: Union[str, List[str]],
+        validation_sql: Optional[Union[str, List[str]]] = None,
+        max_parallel_slices: int = 4,
+        keep_old_table: bool = False,
+        stale_shadow_age: timedelta = timedelta(hours=24),
+        firebolt_conn_id: str = "firebolt_default",
+        database: Optional[str] = None,
+        engine_name: Optional[str] = None,
+        query_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.table = table
+        self.create_table_sql = create_table_sql
+        self.insert_sql = insert_sql
+        self.validation_sql = validation_sql
+        self.max_parallel_slices = max_parallel_slices
+        self.keep_old_table = keep_old_table
+        self.stale_shadow_age = stale_shadow_age
+        self.firebolt_conn_id = firebolt_conn_id
+        self.database = database
+        self.engine_name = engine_name
+        self.query_timeout = query_timeout
+        self.fail_on_query_timeout = True
+
+    def get_db_hook(self) -> FireboltHook:
+        return get_db_hook(self)
+
+    def execute(self, context) -> Any:  # type: ignore
+        """Load the shadow table and swap it with the target table"""
+        hook = self.get_db_hook()
+        now = timezone.utcnow()
+        self._drop_stale_tables(hook, now)
+
+        # The creation time tells concurrent reloads whether a shadow is stale
+        suffix = f"{now.strftime(self.SUFFIX_TIME_FORMAT)}_{uuid4().hex[:8]}"
+        shadow_table = f"{self.table}{self.SHADOW_INFIX}{suffix}"
+        old_table = f"{self.table}{self.OLD_INFIX}{suffix}"
+
+        self.log.info("Loading shadow table %s", shadow_table)
+        try:
+            hook.run(sql=_substitute(self.create_table_sql, table=shadow_table))
+            self._load(shadow_table)
+            self._validate(hook, shadow_table)
+            self._swap(hook, shadow_table, old_table)
+        except Exception:
+            self.log.error("Reload failed, dropping shadow table %s", shadow_table)
+            hook.run(sql=f"DROP TABLE IF EXISTS {shadow_table}")
+            raise
+
+        if not self.keep_old_table:
+            hook.run(sql=f"DROP TABLE IF EXISTS {old_table}")
+
+    def _load(self, shadow_table: str) -> None:
+        slices = _as_list(self.insert_sql)
+        if len(slices) == 1:
+            self.get_db_hook().run(sql=_substitute(slices[0], table=shadow_table))
+            return
+
+        self.log.info("Loading %s slices in parallel", len(slices))
+        with ThreadPoolExecutor(max_workers=self.max_parallel_slices) as executor:
+            futures = [
+                executor.submit(
+                    self.get_db_hook().run, sql=_substitute(sql, table=shadow_table)
+                )
+                for sql in slices
+            ]
+            # Re-raise the first failure after all the slices are done
+            for future in futures:
+                future.result()
+
+    def _validate(self, hook: FireboltHook, shadow_table: str) -> None:
+        for sql in _as_list(self.validation_sql):
+            sql = _substitute(sql, table=shadow_table)
+            record = hook.get_first(sql)
+            if not record or not all(record):
+                raise AirflowException(
+                    f"Validation failed for {self.table}.\n"
+                    f"Query:\n{sql}\nResult:\n{record}"
+                )
+
+    def _swap(self, hook: FireboltHook, shadow_table: str, old_table: str) -> None:
+        statements = ["BEGIN TRANSACTION"]
+        if self.table in self._table_names(hook, self.table):
+            statements.append(f"ALTER TABLE {self.table} RENAME TO {old_table}")
+        statements.append(f"ALTER TABLE {shadow_table} RENAME TO {self.table}")
+        statements.append("COMMIT")
+
+        self.log.info("Swapping %s into %s", shadow_table, self.table)
+        hook.run(sql=statements)
+
+    def _drop_stale_tables(self, hook: FireboltHook, now: datetime) -> None:
+        """
+        Drop shadow and old tables left behind by previous reloads
+
+        Shadow tables younger than ``stale_shadow_age`` are kept. Shadow
+        tables without a creation time in their name are always dropped.
+        """
+        shadow_prefix = self.table + self.SHADOW_INFIX
+        prefixes = (shadow_prefix, self.table + self.OLD_INFIX)
+        for name in self._table_names(hook, self.table + "%"):
+            if not name.startswith(prefixes):
+                continue
+            if name.startswith(shadow_prefix):
+                created = self._created_at(name[len(shadow_prefix) :])
+                if created is not None and now - created < self.stale_shadow_age:
+                    self.log.info("Keeping %s of a reload which may be running", name)
+                    continue
+            self.log.info("Dropping stale table %s", name)
+            hook.run(sql=f"DROP TABLE IF EXISTS {name}")
+
+    def _created_at(self, suffix: str) -> Optional[datetime]:
+        try:
+            created = datetime.strptime(suffix.split("_")[0], self.SUFFIX_TIME_FORMAT)
+        except ValueError:
+            return None
+        return created.replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def _table_names(hook: FireboltHook, pattern: str) -> List[str]:
+        records = hook.get_records(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_name LIKE ?",
+            parameters=[pattern],
+        )
+        return [record[0] for record in records or []]
+
+
+class FireboltTableCheckOperator(BaseOperator):
+    """
+    Runs a batch of data quality checks against a table in a single scan
+
+    All the checks are compiled into one aggregate query, so the table is
+    read once regardless of the number of checks. Every check is evaluated
+    against the resulting row and all failed checks are reported together.
+
+    Column checks are defined per column, each check with exactly one
+    comparison (``equal_to``, ``greater_than``, ``geq_to``, ``less_than``,
+    ``leq_to``) and an optional relative ``tolerance``::
+
+        column_checks={
+            "id": {"null_check": {"equal_to": 0}, "unique_check": {"equal_to": 0}},
+            "price": {"min": {"geq_to": 0}, "max": {"less_than": 1000}},
+        }
+
+    Supported column checks are ``null_check``, ``distinct_check``,
+    ``unique_check``, ``min`` and ``max``.
+
+    Table checks are boolean SQL expressions over aggregates of the table::
+
+        table_checks={"row_count_check": {"check_statement": "COUNT(*) >= 1000"}}
+
+    :param table: name of the table to check
+    :type table: str
+    :param column_checks: checks to run per column
+    :type column_checks: dict
+    :param table_checks: checks to run against the whole table
+    :type table_checks: dict
+    :param partition_clause: optional condition restricting the checked rows,
+        e.g. ``order_date = '{{ ds }}'`` (templated)
+    :type partition_clause: str
+    :param firebolt_conn_id: Firebolt connection id
+    :type firebolt_conn_id: str
+    :param database: name of database (will overwrite database defined
+        in connection)
+    :type database: str
+    :param engine_name: name of engine (will overwrite engine_name defined in
+        connection)
+    :type engine_name: str
+    """
+
+    COLUMN_CHECKS = {
+        "null_check": "SUM(CASE WHEN {column} IS NULL THEN 1 ELSE 0 END)",
+        "distinct_check": "COUNT(DISTINCT {column})",
+        "unique_check": "COUNT({column}) - COUNT(DISTINCT {column})",
+        "min": "MIN({column})",
+        "max": "MAX({column})",
+    }
+    COMPARISONS = ("equal_to", "greater_than", "geq_to", "less_than", "leq_to")
+
+    template_fields = ("partition_clause",)
+    ui_color = "#b4e0ff"
+
+    @apply_defaults
+    def __init__(
+        self,
+        table: str,
+        column_checks: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+        table_checks: Optional[Dict[str, Dict[str, str]]] = None,
+        partition_clause: Optional[str] = None,
+        firebolt_conn_id: str = "firebolt_default",
+        database: Optional[str] = None,
+        engine_name: Optional[str] = None,
+        query_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.table = table
+        self.column_checks = column_checks or {}
+        self.table_checks = table_checks or {}
+        self.partition_clause = partition_clause
+        self.firebolt_conn_id = firebolt_conn_id
+        self.database = database
+        self.engine_name = engine_name
+        self.query_timeout = query_timeout
+        self.fail_on_query_timeout = True
+        self._validate_checks()
+
+    def _validate_checks(self) -> None:
+        if not self.column_checks and not self.table_checks:
+            raise ValueError("At least one column or table check must be provided")
+        for column, checks in self.column_checks.items():
+            for check, condition in checks.items():
+                if check not in self.COLUMN_CHECKS:
+                    raise ValueError(f"Unknown check {check} for column {column}")
+                comparisons = set(condition) - {"tolerance"}
+                if len(comparisons) != 1 or not comparisons <= set(self.COMPARISONS):
+                    raise ValueError(
+                        f"Check {check} for column {column} must define exactly "
+                        f"one of {', '.join(self.COMPARISONS)}"
+                    )
+        for check, condition in self.table_checks.items():
+            if "check_statement" not in condition:
+                raise ValueError(f"Table check {check} has no check_statement")
+
+    def get_db_hook(self) -> FireboltHook:
+        return get_db_hook(self)
+
+    def _compile_checks(self) -> Tuple[List[str], str]:
+        """Return check names and one query computing all of them."""
+        names, expressions = [], []
+        for column, checks in self.column_checks.items():
+            for check in checks:
+                names.append(f"{column}.{check}")
+                expressions.append(self.COLUMN_CHECKS[check].format(column=column))
+        for check, condition in self.table_checks.items():
+            names.append(check)
+            expressions.append(
+                f"CASE WHEN {condition['check_statement']} THEN 1 ELSE 0 END"
+            )
+
+        sql = f"SELECT {', '.join(expressions)} FROM {self.table}"
+        if self.partition_clause:
+            sql += f" WHERE {self.partition_clause}"
+        return names, sql
+
+    def _conditions(self) -> List[Dict[str, Any]]:
+        conditions = [
+            condition
+            for checks in self.column_checks.values()
+            for condition in checks.values()
+        ]
+        return conditions + [{"equal_to": 1}] * len(self.table_checks)
+
+    def execute(self, context) -> Any:  # type: ignore
+        """Run all the checks with a single query"""
+        names, sql = self._compile_checks()
+        self.log.info("Running %s checks on %s", len(names), self.table)
+
+        record = self.get_db_hook().get_first(sql)
+        if not record:
+            raise AirflowException(f"Check query returned no results: {sql}")
+
+        results = {}
+        failed = []
+        for name, result, condition in zip(names, record, self._conditions()):
+            success = _check_passes(result, condition)
+            results[name] = {"result": result, "success": success}
+            self.log.info(
+                "Check %s: %s (%s)", name, result, "passed" if success else "FAILED"
+            )
+            if not success:
+                failed.append(f"{name}: result {result}, expected {condition}")
+
+        if failed:
+            raise AirflowException(
+                f"{len(failed)} of {len(names)} checks failed for {self.table}:\n"
+                + "\n".join(failed)
+            )
+        return results
+
+
+class FireboltFanOutOperator(BaseOperator):
+    """
+    Runs the same SQL in many Firebolt databases and/or engines concurrently
+
+    The ``{database}`` and ``{engine_name}`` placeholders of the sql are
+    replaced with the values of every target. Targets are run by a bounded
+    pool of workers, connections to all of them share one authentication.
+    The task returns a summary with the result or the error of each target.
+
+    :param sql: the sql code to be executed in every target (templated)
+    :type sql: Can receive a str representing a sql statement,
+        a list of str (sql statements), or reference to a template file.
+    :param targets: databases to run the sql in, either as names or as dicts
+        with ``database`` and/or ``engine_name`` keys (templated)
+    :type targets: list
+    :param discovery_sql: query returning the targets, one per row, as
+        ``database`` or ``database, engine_name`` columns. Run before the
+        fan-out, its targets are added to ``targets``. (templated)
+    :type discovery_sql: str
+    :param parameters: (optional) the parameters to render the SQL query with.
+    :type parameters: iterable
+    :param max_workers: maximum number of targets processed at the same time
+    :type max_workers: int
+    :param max_failures: number of failed targets tolerated before the task
+        fails, None to never fail the task
+    :type max_failures: Optional[int]
+    :param firebolt_conn_id: Firebolt connection id
+    :type firebolt_conn_id: str
+    :param database: name of database, to run ``discovery_sql`` in and for
+        targets without a database (will overwrite database defined
+        in connection)
+    :type database: str
+    :param engine_name: name of engine for targets without an engine
+        (will overwrite engine_name defined in connection)
+    :type engine_name: str
+    """
+
+    template_fields = ("sql", "targets", "discovery_sql")
+    template_ext = (".sql",)
+    ui_color = "#b4e0ff"
+
+    @apply_defaults
+    def __init__(
+        self,
+        sql: Union[str, List[str]],
+        targets: Optional[List[Union[str, Dict[str, str]]]] = None,
+        discovery_sql: Optional[str] = None,
+        parameters: Optional[Sequence] = None,
+        max_workers: int = 8,
+        max_failures: Optional[int] = 0,
+        firebolt_conn_id: str = "firebolt_default",
+        database: Optional[str] = None,
+        engine_name: Optional[str] = None,
+        query_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if not targets and not discovery_sql:
+            raise ValueError("Either targets or discovery_sql must be provided")
+        self.sql = sql
+        self.targets = targets or []
+        self.discovery_sql = discovery_sql
+        self.parameters = parameters
+        self.max_workers = max_workers
+        self.max_failures = max_failures
+        self.firebolt_conn_id = firebolt_conn_id
+        self.database = database
+        self.engine_name = engine_name
+        self.query_timeout = query_timeout
+        self.fail_on_query_timeout = True
+
+    def get_db_hook(self) -> FireboltHook:
+        return get_db_hook(self)
+
+    def _resolve_targets(self, hook: FireboltHook) -> List[Dict[str, Optional[str]]]:
+        targets: List[Dict[str, Optional[str]]] = [
+            {"database": target, "engine_name": None}
+            if isinstance(target, str)
+            else {
+                "database": target.get("database"),
+                "engine_name": target.get("engine_name"),
+            }
+            for target in self.targets
+        ]
+        if self.discovery_sql:
+            for row in hook.get_records(self.discovery_sql) or []:
+                targets.append(
+                    {
+                        "database": row[0],
+                        "engine_name": row[1] if len(row) > 1 else None,
+                    }
+                )
+        return targets
+
+    def _run_target(
+        self,
+        hook: FireboltHook,
+        conn_config: FireboltHook.ConnectionParameters,
+        target: Dict[str, Optional[str]],
+    ) -> Dict[str, Any]:
+        result: Dict[str, Any] = dict(target, rowcount=0, error=None)
+        try:
+            conn = hook.get_conn_to(
+                target["database"], target["engine_name"], conn_config
+            )
+            with closing(conn), closing(conn.cursor()) as cur:
+                for sql in _as_list(self.sql):
+                    sql = _substitute(sql, **target)
+                    if self.parameters:
+                        cur.execute(
+                            sql, self.parameters, timeout_seconds=self.query_timeout
+                        )
+                    else:
+                        cur.execute(sql, timeout_seconds=self.query_timeout)
+                    result["rowcount"] += max(cur.rowcount, 0)
+        except Exception as e:
+            self.log.warning("Target %s failed: %s", target, e)
+            result["error"] = str(e)
+        return result
+
+    def execute(self, context) -> Any:  # type: ignore
+        """Run the sql in all the targets"""
+        hook = self.get_db_hook()
+        targets = self._resolve_targets(hook)
+        self.log.info("Running sql in %s targets", len(targets))
+        _log_sql(self, self.sql, context)
+
+        conn_config = hook._get_conn_params()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(
+                executor.map(partial(self._run_target, hook, conn_config), targets)
+            )
+
+        failed = [result for result in results if result["error"]]
+        self.log.info(
+            "%s of %s targets succeeded", len(results) - len(failed), len(results)
+        )
+        if self.max_failures is not None and len(failed) > self.max_failures:
+            raise AirflowException(
+                f"{len(failed)} of {len(results)} targets failed:\n"
+                + "\n".join(
+                    f"{result['database']}/{result['engine_name']}: {result['error']}"
+                    for result in failed
+                )
+            )
+        return results
+
+
+class FireboltToFireboltOperator(BaseOperator):
+    """
+    Copies rows of a table between Firebolt databases, engines or accounts
+
+    When the source and the target connections use the same account and
+    engine, the rows are copied by the engine with a single
+    ``INSERT INTO ... SELECT`` statement. Otherwise they are streamed
+    through the worker: the source rows are split into ranges of
+    ``partition_column``, by default the first primary index column, and
+    the ranges are copied in parallel. Every range is streamed, only
+    ``batch_size`` rows of it are held in memory at a time.
+
+    Without ``incremental_column`` the target table is truncated and the
+    whole source table is copied. With it, only the rows up to the current
+    maximum of the column in the source table are copied, starting after
+    ``watermark`` if given, rows of the target above the watermark are
+    replaced, or after the maximum of the column in the target table. If a
+    streamed range fails, the rows copied by the other ranges are deleted
+    again, so a retry starts from the same point.
+
+    Finally the number of rows and a checksum of the copied range are
+    compared between the tables.
+
+    :param source_table: name of the table to copy (templated)
+    :type source_table: str
+    :param target_table: name of the table to copy to, the source table
+        name by default. The table must exist. (templated)
+    :type target_table: str
+    :param columns: columns to copy, all the source table columns by default
+    :type columns: Optional[List[str]]
+    :param incremental_column: column identifying new rows, e.g. an id or
+        an update timestamp
+    :type incremental_column: Optional[str]
+    :param watermark: value of ``incremental_column`` after which the rows
+        are copied, e.g. ``{{ data_interval_start }}`` (templated)
+    :type watermark: Optional[str]
+    :param partition_column: integer column the streamed rows are split by
+    :type partition_column: Optional[str]
+    :param partitions: number of ranges streamed in parallel
+    :type partitions: int
+    :param batch_size: number of rows fetched and inserted at a time
+    :type batch_size: int
+    :param server_side: force (True) or disable (False) the copy with
+        ``INSERT INTO ... SELECT``, detected from the connections by default
+    :type server_side: Optional[bool]
+    :param verify: if True, compare row counts and checksums after the copy
+    :type verify: bool
+    :param source_conn_id: Firebolt connection id of the source table
+    :type source_conn_id: str
+    :param source_database: database of the source table (will overwrite
+        database defined in connection)
+    :type source_database: Optional[str]
+    :param source_engine_name: engine to read the source table with (will
+        overwrite engine_name defined in connection)
+    :type source_engine_name: Optional[str]
+    :param target_conn_id: Firebolt connection id of the target table,
+        ``source_conn_id`` by default
+    :type target_conn_id: Optional[str]
+    :param target_database: database of the target table (will overwrite
+        database defined in connection)
+    :type target_database: Optional[str]
+    :param target_engine_name: engine to write the target table with (will
+        overwrite engine_name defined in connection)
+    :type target_engine_name: Optional[str]
+    """
+
+    CHECKSUM_EXPRESSION = "SUM(CITY_HASH({columns}) % 1000000007)"
+
+    template_fields = ("source_table", "target_table", "watermark")
+    ui_color = "#b4e0ff"
+
+    @apply_defaults
+    def __init__(
+        self,
+        source_table: str,
+        target_table: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        incremental_column: Optional[str] = None,
+        watermark: Optional[str] = None,
+        partition_column: Optional[str] = None,
+        partitions: int = 4,
+        batch_size: int = 10000,
+        server_side: Optional[bool] = None,
+        verify: bool = True,
+        source_conn_id: str = "firebolt_default",
+        source_database: Optional[str] = None,
+        source_engine_name: Optional[str] = None,
+        target_conn_id: Optional[str] = None,
+        target_database: Optional[str] = None,
+        target_engine_name: Optional[str] = None,
+        query_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if watermark is not None and not incremental_column:
+            raise ValueError("watermark requires incremental_column")
+        self.source_table = source_table
+        self.target_table = target_table or source_table
+        self.columns = columns
+        self.incremental_column = incremental_column
+        self.watermark = watermark
+        self.partition_column = partition_column
+        self.partitions = partitions
+        self.batch_size = batch_size
+        self.server_side = server_side
+        self.verify = verify
+        self.source_conn_id = source_conn_id
+        self.source_database = source_database
+        self.source_engine_name = source_engine_name
+        self.target_conn_id = target_conn_id or source_conn_id
+        self.target_database = target_database
+        self.target_engine_name = target_engine_name
+        self.query_timeout = query_timeout
+
+    def get_source_hook(self) -> FireboltHook:
+        return FireboltHook(
+            firebolt_conn_id=self.source_conn_id,
+            database=self.source_database,
+            engine_name=self.source_engine_name,
+            query_timeout=self.query_timeout,
+        )
+
+    def get_target_hook(self) -> FireboltHook:
+        return FireboltHook(
+            firebolt_conn_id=self.target_conn_id,
+            database=self.target_database,
+            engine_name=self.target_engine_name,
+            query_timeout=self.query_timeout,
+        )
+
+    def execute(self, context) -> Any:  # type: ignore
+        """Copy the rows and verify the copy"""
+        source, target = self.get_source_hook(), self.get_target_hook()
+        columns = self.columns or [
+            column.name for column in self._source_schema(source)
+        ]
+
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        if self.incremental_column:
+            upper = self._max(source, self.source_table)
+            if upper is None:
+                self.log.info("Source table %s is empty", self.source_table)
+                return {"mode": None, "rows": 0}
+            lower = self.watermark
+            if lower is None:
+                lower = self._max(target, self.target_table)
+            else:
+                # Replace the rows copied by a previous run of the interval
+                target.run(
+                    f"DELETE FROM {self.target_table} "
+                    f"WHERE {self.incremental_column} > ?",
+                    parameters=[lower],
+                )
+            if lower is not None:
+                conditions.append(f"{self.incremental_column} > ?")
+                parameters.append(lower)
+            conditions.append(f"{self.incremental_column} <= ?")
+            parameters.append(upper)
+        else:
+            target.run(f"TRUNCATE TABLE {self.target_table}")
+
+        if self._is_server_side(source, target):
+            mode = "server_side"
+            rows = self._copy_server_side(
+                source, target, columns, conditions, parameters
+            )
+        else:
+            mode = "streamed"
+            try:
+                rows = self._copy_streamed(source, columns, conditions, parameters)
+            except Exception:
+                if self.incremental_column:
+                    self._remove_copied(target, conditions, parameters)
+                raise
+        self.log.info("Copied %s rows of %s (%s)", rows, self.source_table, mode)
+
+        if self.verify:
+            self._verify(source, target, columns, conditions, parameters)
+        return {"mode": mode, "rows": rows}
+
+    def _source_schema(self, source: FireboltHook) -> List[Column]:
+        schema = source.get_table_schema(self.source_table)
+        if not schema:
+            raise AirflowException(f"Source table {self.source_table} not found")
+        return schema
+
+    def _max(self, hook: FireboltHook, table: str) -> Any:
+        record = hook.get_first(f"SELECT MAX({self.incremental_column}) FROM {table}")
+        return record[0] if record else None
+
+    def _is_server_side(self, source: FireboltHook, target: FireboltHook) -> bool:
+        """Check whether one engine can read the source and write the target."""
+        if self.server_side is not None:
+            return self.server_side
+        source_config = source._get_conn_params()
+        target_config = target._get_conn_params()
+        fields = (
+            "client_id",
+            "api_endpoint",
+            "account_name",
+            "engine_name",
+            "engine_pool",
+        )
+        return bool(source_config.engine_name or source_config.engine_pool) and all(
+            getattr(source_config, field) == getattr(target_config, field)
+            for field in fields
+        )
+
+    def _copy_server_side(
+        self,
+        source: FireboltHook,
+        target: FireboltHook,
+        columns: List[str],
+        conditions: List[str],
+        parameters: List[Any],
+    ) -> int:
+        source_table = self.source_table
+        source_database = source._get_conn_params().database
+        if source_database != target._get_conn_params().database:
+            source_table = f"{source_database}.public.{source_table}"
+        column_list = ", ".join(columns)
+        return target.run(
+            f"INSERT INTO {self.target_table} ({column_list}) "
+            f"SELECT {column_list} FROM {source_table}{_where(conditions)}",
+            parameters=parameters or None,
+            handler=lambda cur: max(cur.rowcount, 0),
+        )
+
+    def _copy_streamed(
+        self,
+        source: FireboltHook,
+        columns: List[str],
+        conditions: List[str],
+        parameters: List[Any],
+    ) -> int:
+        ranges = self._ranges(source, conditions, parameters)
+        self.log.info("Streaming %s ranges in parallel", len(ranges))
+        with ThreadPoolExecutor(max_workers=self.partitions) as executor:
+            futures = [
+                executor.submit(self._copy_range, columns, range_conditions, values)
+                for range_conditions, values in ranges
+            ]
+            # Re-raise the first failure after all the ranges are done
+            return sum(future.result() for future in futures)
+
+    def _remove_copied(
+        self, target: FireboltHook, conditions: List[str], parameters: List[Any]
+    ) -> None:
+        """
+        Delete the rows of the copied range from the target table
+
+        Every range commits on its own. Without this, the ranges finished
+        before a failure would raise the target maximum of the incremental
+        column, and a retry would skip the rows of the unfinished ones.
+        """
+        self.log.warning("Copy failed, removing its rows from %s", self.target_table)
+        target.run(
+            f"DELETE FROM {self.target_table}{_where(conditions)}",
+            parameters=parameters,
+        )
+
+    def _ranges(
+        self, source: FireboltHook, conditions: List[str], parameters: List[Any]
+    ) -> List[Tuple[List[str], List[Any]]]:
+        """
+        Split the copied rows into ranges of the partition column
+
+        Rows with a NULL partition column fall into no range, so they get
+        their own one if the column is nullable.
+        """
+        if self.partitions < 2:
+            return [(conditions, parameters)]
+        schema = self._source_schema(source)
+        column = self.partition_column
+        if column is None:
+            primary_index = [column.name for column in schema if column.primary_index]
+            column = primary_index[0] if primary_index else None
+        if column is None:
+            return [(conditions, parameters)]
+
+        record = source.get_first(
+            f"SELECT MIN({column}), MAX({column}) "
+            f"FROM {self.source_table}{_where(conditions)}",
+            parameters=parameters or None,
+        )
+        low, high = record if record else (None, None)
+        if not (isinstance(low, int) and isinstance(high, int)):
+            return [(conditions, parameters)]
+
+        step = (high - low) // self.partitions + 1
+        ranges = [
+            (
+                conditions + [f"{column} >= ?", f"{column} < ?"],
+                parameters + [start, start + step],
+            )
+            for start in range(low, high + 1, step)
+        ]
+        nullable = next(
+            (c.nullable for c in schema if c.name.lower() == column.lower()), True
+        )
+        if nullable:
+            ranges.append((conditions + [f"{column} IS NULL"], parameters))
+        return ranges
+
+    def _copy_range(
+        self, columns: List[str], conditions: List[str], parameters: List[Any]
+    ) -> int:
+        # Hooks track the state of their runs, so every range uses its own
+        source, target = self.get_source_hook(), self.get_target_hook()
+        column_list = ", ".join(columns)
+        select_sql = (
+            f"SELECT {column_list} FROM {self.source_table}{_where(conditions)}"
+        )
+        insert_sql = (
+            f"INSERT INTO {self.target_table} ({column_list}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        with closing(source.get_conn()) as conn, closing(conn.cursor()) as cur:
+            # Rows are fetched from the response as they are inserted, so
+            # a range is never held in memory as a whole
+            cur.execute_stream(select_sql, parameters or None)
+            return target.run_many(
+                insert_sql, _fetch_rows(cur, self.batch_size), self.batch_size
+            )
+
+    def _verify(
+        self,
+        source: FireboltHook,
+        target: FireboltHook,
+        columns: List[str],
+        conditions: List[str],
+        parameters: List[Any],
+    ) -> None:
+        sql = (
+            "SELECT COUNT(*), "
+            + self.CHECKSUM_EXPRESSION.format(columns=", ".join(columns))
+            + " FROM {table}"
+            + _where(conditions)
+        )
+        expected = source.get_first(
+            _substitute(sql, table=self.source_table), parameters=parameters or None
+        )
+        actual = target.get_first(
+            _substitute(sql, table=self.target_table), parameters=parameters or None
+        )
+        if tuple(expected or ()) != tuple(actual or ()):
+            raise AirflowException(
+                f"Copy of {self.source_table} to {self.target_table} doesn't match, "
+                f"source (rows, checksum): {expected}, target: {actual}"
+            )
+        self.log.info("Verified %s rows", expected[0] if expected else 0)
+
+
+def _as_list(sql: Optional[Union[str, List[str]]]) -> List[str]:
+    if not sql:
+        return []
+    if isinstance(sql, str):
+        return [sql]
+    return list(sql)
+
+
+def _substitute(sql: str, **values: Optional[str]) -> str:
+    """Replace {name} placeholders of the sql, leaving other braces intact."""
+    for name, value in values.items():
+        sql = sql.replace("{" + name + "}", value or "")
+    return sql
+
+
+class FireboltEnginePrewarmOperator(BaseOperator):
+    """
+    Starts an engine ahead of the DAG runs using it and stops it when idle
+
+    Meant to run in a maintenance DAG scheduled every few minutes. The next
+    scheduled runs of the DAGs using the engine are read from the metadata
+    database. The engine is started when one of them is due within
+    ``lead_time``. It is stopped when none is, no run of these DAGs is in
+    progress and the last one finished more than ``idle_timeout`` ago.
+
+    Every start is pushed to XCom under the ``firebolt_prewarm`` key. Once
+    the predicted run starts, the error of the prediction and the time the
+    engine was started ahead of the run are logged and sent as the
+    ``firebolt.<engine>.prewarm_error`` and ``firebolt.<engine>.prewarm_lead``
+    timing metrics, which can be used to tune ``lead_time``.
+
+    Requires Airflow 2.2 or newer.
+
+    :param engine_name: name of the engine to pre-warm, the engine_name from
+        the connection by default
+    :type engine_name: Optional[str]
+    :param dag_ids: DAGs to pre-warm the engine for. By default, all the
+        DAGs of the DAG folder with tasks using ``firebolt_conn_id`` and the
+        engine are used.
+    :type dag_ids: Optional[List[str]]
+    :param discovery_interval: how long DAGs found in the DAG folder are
+        reused for, before the folder is parsed again. Found DAGs are kept
+        in XCom under the ``firebolt_prewarm_dag_ids`` key.
+    :type discovery_interval: datetime.timedelta
+    :param lead_time: how long before the next expected run the engine is
+        started
+    :type lead_time: datetime.timedelta
+    :param idle_timeout: how long after the last run the engine is stopped
+    :type idle_timeout: datetime.timedelta
+    :param firebolt_conn_id: Firebolt connection id
+    :type firebolt_conn_id: str
+    """
+
+    PREWARM_XCOM_KEY = "firebolt_prewarm"
+    DAG_IDS_XCOM_KEY = "firebolt_prewarm_dag_ids"
+
+    ui_color = "#f72a30"
+
+    @apply_defaults
+    def __init__(
+        self,
+        engine_name: Optional[str] = None,
+        dag_ids: Optional[List[str]] = None,
+        lead_time: timedelta = timedelta(minutes=10),
+        idle_timeout: timedelta = timedelta(minutes=30),
+        discovery_interval: timedelta = timedelta(hours=1),
+        firebolt_conn_id: str = "firebolt_default",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.engine_name = engine_name
+        self.dag_ids = dag_ids
+        self.lead_time = lead_time
+        self.idle_timeout = idle_timeout
+        self.discovery_interval = discovery_interval
+        self.firebolt_conn_id = firebolt_conn_id
+        self.database = None
+        self.query_timeout = None
+        self.fail_on_query_timeout = True
+
+    def execute(self, context) -> Any:  # type: ignore
+        """Start or stop the engine depending on the upcoming DAG runs"""
+        hook = get_db_hook(self)
+        engine_name = self.engine_name or hook._get_conn_params().engine_name
+        if not engine_name:
+            raise AirflowException("Engine name must be provided")
+        now = timezone.utcnow()
+        ti = context["ti"]
+        dag_ids = self.dag_ids or self._discover_dag_ids(
+            engine_name, context["dag"].dag_id, ti, now
+        )
+        if not dag_ids:
+            self.log.info("No DAGs use engine %s", engine_name)
+            return None
+
+        next_runs, running_runs, last_end = self._schedule(dag_ids)
+        prediction = ti.xcom_pull(
+            task_ids=self.task_id, key=self.PREWARM_XCOM_KEY, include_prior_dates=True
+        )
+        if prediction and not prediction.get("evaluated"):
+            if self._report_accuracy(engine_name, prediction):
+                # Later runs pull the same prediction, it's reported only once
+                prediction = {**prediction, "evaluated": True}
+            ti.xcom_push(key=self.PREWARM_XCOM_KEY, value=prediction)
+
+        upcoming = sorted(
+            (run_after, dag_id)
+            for dag_id, run_after in next_runs.items()
+            if run_after - self.lead_time <= now
+        )
+        status = hook.get_engine_status(engine_name)
+        if upcoming:
+            run_after, dag_id = upcoming[0]
+            if status != "STOPPED":
+                return status
+            self.log.info(
+                "Starting engine %s for the run of %s expected at %s",
+                engine_name,
+                dag_id,
+                run_after,
+            )
+            ti.xcom_push(
+                key=self.PREWARM_XCOM_KEY,
+                value={
+                    "dag_id": dag_id,
+                    "expected_at": run_after.isoformat(),
+                    "started_at": now.isoformat(),
+                },
+            )
+            hook.engine_action(engine_name, "start")
+            return "STARTED"
+
+        idle = running_runs == 0 and (
+            last_end is None or now - last_end >= self.idle_timeout
+        )
+        if status == "RUNNING" and idle:
+            self.log.info(
+                "Stopping engine %s, idle since %s", engine_name, last_end or "ever"
+            )
+            hook.engine_action(engine_name, "stop")
+            return "STOPPED"
+        return status
+
+    def _discover_dag_ids(
+        self, engine_name: str, own_dag_id: str, ti: Any, now: datetime
+    ) -> List[str]:
+        """Return DAGs using the engine found by a recent run, or find them."""
+        discovered = ti.xcom_pull(
+            task_ids=self.task_id, key=self.DAG_IDS_XCOM_KEY, include_prior_dates=True
+        )
+        if (
+            discovered
+            and discovered.get("engine_name") == engine_name
+            and now - timezone.parse(discovered["discovered_at"])
+            < self.discovery_interval
+        ):
+            return discovered["dag_ids"]
+
+        dag_ids = self._find_dag_ids(engine_name, own_dag_id)
+        ti.xcom_push(
+            key=self.DAG_IDS_XCOM_KEY,
+            value={
+                "engine_name": engine_name,
+                "dag_ids": dag_ids,
+                "discovered_at": now.isoformat(),
+            },
+        )
+        return dag_ids
+
+    def _find_dag_ids(self, engine_name: str, own_dag_id: str) -> List[str]:
+        """Find DAGs of the DAG folder with tasks using the connection and engine."""
+        default_engine = get_db_hook(self)._get_conn_params().engine_name
+        dag_ids = []
+        for dag_id, dag in DagBag(include_examples=False).dags.items():
+            if dag_id == own_dag_id:
+                continue
+            for task in dag.tasks:
+                if getattr(task, "firebolt_conn_id", None) != self.firebolt_conn_id:
+                    continue
+                if (
+                    getattr(task, "engine_name", None) or default_engine
+                ) == engine_name:
+                    dag_ids.append(dag_id)
+                    break
+        return dag_ids
+
+    @staticmethod
+    def _schedule(
+        dag_ids: List[str],
+    ) -> Tuple[Dict[str, datetime], int, Optional[datetime]]:
+        """
+        Read the schedule of the DAGs from the metadata database
+
+        Returns:
+            next run times of active DAGs, number of their runs in progress
+            and end time of their last finished run
+        """
+        with create_session() as session:
+            next_runs = {
+                dag_id: run_after
+                for dag_id, run_after in session.query(
+                    DagModel.dag_id, DagModel.next_dagrun_create_after
+                ).filter(
+                    DagModel.dag_id.in_(dag_ids),
+                    DagModel.is_paused.is_(False),
+                    DagModel.is_active.is_(True),
+                )
+                if run_after is not None
+            }
+            dag_runs = session.query(DagRun).filter(DagRun.dag_id.in_(dag_ids))
+            running_runs = dag_runs.filter(DagRun.state == State.RUNNING).count()
+            last_end = (
+                session.query(func.max(DagRun.end_date))
+                .filter(DagRun.dag_id.in_(dag_ids))
+                .scalar()
+            )
+        return next_runs, running_runs, last_end
+
+    def _report_accuracy(self, engine_name: str, prediction: Dict[str, str]) -> bool:
+        """
+        Log how accurate the last prediction was, if its run has started
+
+        Returns:
+            True if the prediction was evaluated
+        """
+        expected_at = timezone.parse(prediction["expected_at"])
+        started_at = timezone.parse(prediction["started_at"])
+        run_start = self._first_run_start(prediction["dag_id"], started_at)
+        if run_start is None:
+            return False
+
+        error = run_start - expected_at
+        lead = run_start - started_at
+        self.log.info(
+            "Run of %s expected at %s started at %s (error %s), "
+            "engine %s was started %s before it",
+            prediction["dag_id"],
+            expected_at,
+            run_start,
+            error,
+            engine_name,
+            lead,
+        )
+        Stats.timing(f"firebolt.{engine_name}.prewarm_error", error)
+        Stats.timing(f"firebolt.{engine_name}.prewarm_lead", lead)
+        return True
+
+    @staticmethod
+    def _first_run_start(dag_id: str, since: datetime) -> Optional[datetime]:
+        with create_session() as session:
+            return (
+                session.query(func.min(DagRun.start_date))
+                .filter(DagRun.dag_id == dag_id, DagRun.start_date >= since)
+                .scalar()
+            )
+
+
+def _log_sql(operator: BaseOperator, sql: Union[str, List[str]], context: Any) -> None:
+    """
+    Log the sql, or its fingerprint and a preview if it's long
+
+    The full text of long sql is pushed once to XCom, compressed, so it
+    is kept by the XCom backend under its retention instead of the log.
+    """
+    text = sql if isinstance(sql, str) else join_statements(sql)
+    if len(text) <= PREVIEW_LENGTH:
+        operator.log.info("Executing: %s", text)
+        return
+    operator.log.info(
+        "Executing %s chars of sql [%s]: %s",
+        len(text),
+        fingerprint(text),
+        preview(text),
+    )
+    artifact = compress(text)
+    if artifact is None:
+        operator.log.warning("Full text of the sql is too large to keep")
+        return
+    context["ti"].xcom_push(key=SQL_XCOM_KEY, value=artifact)
+    operator.log.info("Full text of the sql is in XCom %s (gzip, base64)", SQL_XCOM_KEY)
+
+
+def _where(conditions: List[str]) -> str:
+    return " WHERE " + " AND ".join(conditions) if conditions else ""
+
+
+def _fetch_rows(cur: Any, size: int) -> Iterator[Sequence]:
+    """Iterate over the rows of the cursor, fetching size rows at a time."""
+    while True:
+        rows = cur.fetchmany(size)
+        if not rows:
+            return
+        yield from rows
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (numbers.Real, Decimal)) and not isinstance(value, bool)
+
+
+def _check_passes(result: Any, condition: Dict[str, Any]) -> bool:
+    """
+    Compare a check result with its expected value
+
+    The tolerance only applies to numbers, other values such as dates and
+    strings are compared as they are. Values which can't be compared fail
+    the check.
+    """
+    if result is None:
+        return False
+
+    tolerance = condition.get("tolerance") or 0
+    (comparison, expected), *_ = (
+        (key, value) for key, value in condition.items() if key != "tolerance"
+    )
+    lower = upper = expected
+    if tolerance and _is_number(expected) and _is_number(result):
+        # Decimals don't mix with float tolerances
+        result, expected = float(result), float(expected)
+        lower = expected - abs(expected) * tolerance
+        upper = expected + abs(expected) * tolerance
+
+    try:
+        if comparison == "equal_to":
+            return bool(lower <= result <= upper)
+        if comparison == "greater_than":
+            return bool(result > lower)
+        if comparison == "geq_to":
+            return bool(result >= lower)
+        if comparison == "less_than":
+            return bool(result < upper)
+        return bool(result <= upper)
+    except TypeError:
+        return False
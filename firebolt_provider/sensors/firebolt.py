@@ -0,0 +1,196 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from contextlib import closing
+from datetime import timedelta
+from typing import Any, Dict, Optional, Sequence
+
+from airflow.exceptions import AirflowException
+from airflow.version import version as airflow_version
+from firebolt.db import Connection
+from packaging.version import Version
+
+from firebolt_provider.hooks.firebolt import FireboltHook
+from firebolt_provider.utils.checks import build_check, check_passes
+
+if airflow_version.startswith("1.10"):
+    from airflow.sensors.base_sensor_operator import (  # type: ignore
+        BaseSensorOperator,
+    )
+else:
+    from airflow.sensors.base import BaseSensorOperator
+
+
+class FireboltSqlSensor(BaseSensorOperator):
+    """
+    Waits for a SQL condition or for table metadata in Firebolt
+
+    With ``sql`` the sensor succeeds once the first cell of the first row
+    returned by the query is truthy. With ``table`` it reads the table
+    metadata instead of scanning it and succeeds once the table exists,
+    has at least ``min_rows`` rows and was modified after
+    ``modified_after``.
+
+    In ``poke`` mode one connection is kept open for the whole lifetime of
+    the sensor. With ``deferrable=True`` the sensor checks once and then
+    defers the polling to the triggerer, where it runs in an async loop
+    on one connection. The poke interval grows exponentially by default,
+    see ``exponential_backoff`` and ``max_wait`` of ``BaseSensorOperator``.
+
+    :param sql: query checking the condition (templated)
+    :type sql: Optional[str]
+    :param parameters: (optional) the parameters to render the SQL query with.
+    :type parameters: iterable
+    :param table: name of the table to check the metadata of (templated)
+    :type table: Optional[str]
+    :param min_rows: minimum number of rows of ``table``
+    :type min_rows: Optional[int]
+    :param modified_after: ``table`` must be modified after this timestamp,
+        e.g. ``{{ data_interval_end }}`` (templated)
+    :type modified_after: Optional[str]
+    :param deferrable: if True, poll in the triggerer instead of a worker.
+        Requires Airflow 2.2+.
+    :type deferrable: bool
+    :param firebolt_conn_id: Firebolt connection id
+    :type firebolt_conn_id: str
+    :param database: name of database (will overwrite database defined
+        in connection)
+    :type database: str
+    :param engine_name: name of engine (will overwrite engine_name defined in
+        connection)
+    :type engine_name: str
+    :param query_timeout: timeout of a check query in seconds, also used by
+        the trigger
+    :type query_timeout: Optional[float]
+    """
+
+    template_fields = ("sql", "table", "modified_after")
+    template_ext = (".sql",)
+    ui_color = "#b4e0ff"
+
+    def __init__(
+        self,
+        sql: Optional[str] = None,
+        parameters: Optional[Sequence] = None,
+        table: Optional[str] = None,
+        min_rows: Optional[int] = None,
+        modified_after: Optional[str] = None,
+        deferrable: bool = False,
+        firebolt_conn_id: str = "firebolt_default",
+        database: Optional[str] = None,
+        engine_name: Optional[str] = None,
+        query_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        kwargs.setdefault("exponential_backoff", True)
+        super().__init__(**kwargs)
+        if not sql and not table:
+            raise ValueError("Either sql or table must be provided")
+        if deferrable and Version(airflow_version) < Version("2.2"):
+            raise ValueError("deferrable requires Airflow 2.2+")
+        self.sql = sql
+        self.parameters = parameters
+        self.table = table
+        self.min_rows = min_rows
+        self.modified_after = modified_after
+        self.deferrable = deferrable
+        self.firebolt_conn_id = firebolt_conn_id
+        self.database = database
+        self.engine_name = engine_name
+        self.query_timeout = query_timeout
+        self._hook: Optional[FireboltHook] = None
+        self._conn: Optional[Connection] = None
+
+    def get_db_hook(self) -> FireboltHook:
+        if self._hook is None:
+            self._hook = FireboltHook(
+                firebolt_conn_id=self.firebolt_conn_id,
+                database=self.database,
+                engine_name=self.engine_name,
+                query_timeout=self.query_timeout,
+            )
+        return self._hook
+
+    def _get_conn(self) -> Connection:
+        """Return the connection shared by all the pokes, opening it if needed."""
+        if self._conn is None or self._conn.closed:
+            self._conn = self.get_db_hook().get_conn()
+        return self._conn
+
+    def _close_conn(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def poke(self, context: Any) -> bool:
+        sql, parameters = build_check(self.sql, self.parameters, self.table)
+        self.log.info("Poking: %s (with parameters %s)", sql, parameters)
+        try:
+            with closing(self._get_conn().cursor()) as cur:
+                if parameters:
+                    cur.execute(sql, parameters, timeout_seconds=self.query_timeout)
+                else:
+                    cur.execute(sql, timeout_seconds=self.query_timeout)
+                record = cur.fetchone()
+        except Exception:
+            # The connection may be broken, the next poke opens a new one
+            self._close_conn()
+            raise
+        return check_passes(record, self.table, self.min_rows, self.modified_after)
+
+    def execute(self, context: Any) -> Any:
+        try:
+            if not self.deferrable:
+                return super().execute(context)
+            if self.poke(context):
+                return None
+        finally:
+            self._close_conn()
+
+        # Triggers only exist from Airflow 2.2
+        from firebolt_provider.triggers.firebolt import FireboltSqlTrigger
+
+        # max_wait only exists from Airflow 2.3
+        max_wait = getattr(self, "max_wait", None)
+        if isinstance(max_wait, timedelta):
+            max_wait = max_wait.total_seconds()
+        self.defer(
+            trigger=FireboltSqlTrigger(
+                sql=self.sql,
+                parameters=list(self.parameters) if self.parameters else None,
+                table=self.table,
+                min_rows=self.min_rows,
+                modified_after=self.modified_after,
+                firebolt_conn_id=self.firebolt_conn_id,
+                database=self.database,
+                engine_name=self.engine_name,
+                poke_interval=self.poke_interval,
+                max_interval=max_wait or 3600.0,
+                exponential_backoff=self.exponential_backoff,
+                query_timeout=self.query_timeout,
+            ),
+            method_name="execute_complete",
+            timeout=timedelta(seconds=self.timeout),
+        )
+
+    def execute_complete(self, context: Any, event: Dict[str, Any]) -> None:
+        """Finish the sensor after the trigger fired"""
+        if event["status"] != "success":
+            raise AirflowException(f"Firebolt sensor failed: {event['message']}")
+        self.log.info("Condition met: %s", event["message"])
@@ -0,0 +1,108 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+from firebolt_provider.hooks.firebolt import FireboltAsyncHook
+from firebolt_provider.utils.checks import build_check, check_passes
+
+
+class FireboltSqlTrigger(BaseTrigger):
+    """
+    Polls Firebolt until a sensor check passes
+
+    All the polls share one connection. The interval between them doubles
+    after every poll with ``exponential_backoff``, up to ``max_interval``.
+    See :class:`~firebolt_provider.sensors.firebolt.FireboltSqlSensor` for
+    the check parameters.
+    """
+
+    def __init__(
+        self,
+        sql: Optional[str] = None,
+        parameters: Optional[List[Any]] = None,
+        table: Optional[str] = None,
+        min_rows: Optional[int] = None,
+        modified_after: Optional[str] = None,
+        firebolt_conn_id: str = "firebolt_default",
+        database: Optional[str] = None,
+        engine_name: Optional[str] = None,
+        poke_interval: float = 60.0,
+        max_interval: float = 3600.0,
+        exponential_backoff: bool = True,
+        query_timeout: Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        self.sql = sql
+        self.parameters = parameters
+        self.table = table
+        self.min_rows = min_rows
+        self.modified_after = modified_after
+        self.firebolt_conn_id = firebolt_conn_id
+        self.database = database
+        self.engine_name = engine_name
+        self.poke_interval = poke_interval
+        self.max_interval = max_interval
+        self.exponential_backoff = exponential_backoff
+        self.query_timeout = query_timeout
+
+    def serialize(self) -> Tuple[str, Dict[str, Any]]:
+        return (
+            "firebolt_provider.triggers.firebolt.FireboltSqlTrigger",
+            {
+                "sql": self.sql,
+                "parameters": self.parameters,
+                "table": self.table,
+                "min_rows": self.min_rows,
+                "modified_after": self.modified_after,
+                "firebolt_conn_id": self.firebolt_conn_id,
+                "database": self.database,
+                "engine_name": self.engine_name,
+                "poke_interval": self.poke_interval,
+                "max_interval": self.max_interval,
+                "exponential_backoff": self.exponential_backoff,
+                "query_timeout": self.query_timeout,
+            },
+        )
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        sql, parameters = build_check(self.sql, self.parameters, self.table)
+        interval = self.poke_interval
+        async with FireboltAsyncHook(
+            firebolt_conn_id=self.firebolt_conn_id,
+            database=self.database,
+            engine_name=self.engine_name,
+            query_timeout=self.query_timeout,
+        ) as hook:
+            while True:
+                try:
+                    record = await hook.get_first(sql, parameters)
+                except Exception as e:
+                    yield TriggerEvent({"status": "error", "message": str(e)})
+                    return
+                if check_passes(record, self.table, self.min_rows, self.modified_after):
+                    yield TriggerEvent({"status": "success", "message": str(record)})
+                    return
+                self.log.info("Check didn't pass, next poll in %s seconds", interval)
+                await asyncio.sleep(interval)
+                if self.exponential_backoff:
+                    interval = min(interval * 2, self.max_interval)
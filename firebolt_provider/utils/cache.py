@@ -0,0 +1,193 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import hashlib
+import os
+import pickle
+import stat
+import time
+from typing import Any, Iterable, Optional, Tuple
+
+from airflow.configuration import AIRFLOW_HOME
+from airflow.stats import Stats
+from airflow.utils.log.logging_mixin import LoggingMixin
+from firebolt.utils.exception import FireboltError
+
+DEFAULT_CACHE_DIR = os.path.join(AIRFLOW_HOME, "firebolt_result_cache")
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Check whether a file is owned by the current user only."""
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _table_key(table: str) -> str:
+    """
+    Return the name a table is matched by in invalidation
+
+    Names are compared unquoted and case-insensitively, so a write through
+    any spelling of a table invalidates it. Tables differing only in the
+    case of a quoted name invalidate each other, which is merely a miss.
+    """
+    return table.split(".")[-1].strip('"').lower()
+
+
+class QueryResultCache(LoggingMixin):
+    """
+    Local disk cache of query results with TTL and LRU eviction
+
+    Every entry is stored as a pickle file named after its key, next to a
+    file listing the tables the query reads from, used for invalidation.
+    The directory is private to the current user, and entries written by
+    anybody else are never loaded.
+    Modification time of an entry is its last access time, the least
+    recently used entries are evicted when there are more than
+    ``max_entries`` of them.
+
+    :param ttl: seconds a result stays valid
+    :param directory: directory to keep the entries in
+    :param max_entries: maximum number of entries kept
+    """
+
+    RESULT_SUFFIX = ".pickle"
+    TABLES_SUFFIX = ".tables"
+
+    def __init__(
+        self, ttl: float, directory: Optional[str] = None, max_entries: int = 1000
+    ) -> None:
+        super().__init__()
+        self.ttl = ttl
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        st = os.stat(self.directory)
+        if hasattr(os, "getuid") and st.st_uid != os.getuid():
+            raise FireboltError(
+                f"Result cache directory {self.directory} belongs to another user"
+            )
+        if st.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+            os.chmod(self.directory, 0o700)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from the query and its context
+
+        Surrounding whitespace and trailing semicolons of str parts are
+        dropped. Whitespace inside them is kept, as it may be part of a
+        string literal.
+        """
+        normalized = [
+            part.strip().rstrip(";").strip() if isinstance(part, str) else part
+            for part in parts
+        ]
+        return hashlib.sha256(repr(normalized).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return a (hit, result) tuple for the key."""
+        path = self._path(key, self.RESULT_SUFFIX)
+        try:
+            with open(path, "rb") as f:
+                if _is_private(os.fstat(f.fileno())):
+                    created, result = pickle.load(f)
+                else:
+                    self.log.warning("Ignoring cached result %s of another user", path)
+                    created, result = None, None
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            created, result = None, None
+
+        if created is None or time.time() - created > self.ttl:
+            if created is not None:
+                self._remove(key)
+            self.misses += 1
+            Stats.incr("firebolt.result_cache.miss")
+            return False, None
+
+        os.utime(path)
+        self.hits += 1
+        Stats.incr("firebolt.result_cache.hit")
+        self.log.info("Result cache hit, hit rate %.0f%%", self.hit_rate * 100)
+        return True, result
+
+    def set(self, key: str, result: Any, tables: Iterable[str]) -> None:
+        """Store the result of a query reading from tables."""
+        table_list = "\n".join(_table_key(table) for table in tables)
+        for suffix, content in (
+            (self.TABLES_SUFFIX, table_list.encode("utf-8")),
+            (self.RESULT_SUFFIX, pickle.dumps((time.time(), result))),
+        ):
+            # Write to a temporary file first, so readers never see a partial entry
+            tmp_path = f"{self._path(key, suffix)}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, self._path(key, suffix))
+        self._evict()
+
+    def invalidate_table(self, table: str) -> int:
+        """Remove all the entries reading from the table, return their number."""
+        removed = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.TABLES_SUFFIX):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    tables = f.read().split("\n")
+            except FileNotFoundError:
+                continue
+            if _table_key(table) in tables:
+                self._remove(name[: -len(self.TABLES_SUFFIX)])
+                removed += 1
+        if removed:
+            self.log.info("Invalidated %s cached results of %s", removed, table)
+        return removed
+
+    def _evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.RESULT_SUFFIX):
+                try:
+                    mtime = os.path.getmtime(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((mtime, name[: -len(self.RESULT_SUFFIX)]))
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, key in entries[: len(entries) - self.max_entries]:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        for suffix in (self.RESULT_SUFFIX, self.TABLES_SUFFIX):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,74 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from datetime import timezone
+from typing import Optional, Sequence, Tuple
+
+from airflow.utils import timezone as airflow_timezone
+
+# Table metadata, read instead of scanning the table
+TABLE_METADATA_QUERY = (
+    "SELECT number_of_rows, last_altered FROM information_schema.tables "
+    "WHERE table_name = ?"
+)
+
+
+def build_check(
+    sql: Optional[str],
+    parameters: Optional[Sequence],
+    table: Optional[str],
+) -> Tuple[str, Optional[Sequence]]:
+    """Return the query and parameters of a sensor check."""
+    if table:
+        return TABLE_METADATA_QUERY, [table]
+    if not sql:
+        raise ValueError("Either sql or table must be provided")
+    return sql, parameters
+
+
+def check_passes(
+    record: Optional[Sequence],
+    table: Optional[str],
+    min_rows: Optional[int] = None,
+    modified_after: Optional[str] = None,
+) -> bool:
+    """
+    Evaluate the first row returned by the check query
+
+    A sql check passes when the first cell is truthy. A table check passes
+    when the table exists, has at least min_rows rows and was modified
+    after modified_after.
+    """
+    if not record:
+        return False
+    if not table:
+        return bool(record[0])
+
+    rows, last_altered = record[0], record[1]
+    if min_rows is not None and (rows or 0) < min_rows:
+        return False
+    if modified_after is not None:
+        if last_altered is None:
+            return False
+        if isinstance(last_altered, str):
+            last_altered = airflow_timezone.parse(last_altered)
+        if last_altered.tzinfo is None:
+            last_altered = last_altered.replace(tzinfo=timezone.utc)
+        return bool(last_altered > airflow_timezone.parse(modified_after))
+    return True
@@ -0,0 +1,169 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+from uuid import uuid4
+
+from airflow.stats import Stats
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+DEFAULT_LOCK_DIR = os.path.join(tempfile.gettempdir(), "airflow-firebolt-slots")
+
+
+class EngineSlotLimiter(LoggingMixin):
+    """
+    Limits the number of concurrent statements on an engine across processes
+
+    Every process waiting for a slot creates a ticket file in a shared lock
+    directory, tickets are granted slots in the order of creation. A granted
+    ticket is renamed to a lease, which is kept alive by a heartbeat while
+    the slot is held. Tickets and leases not refreshed for ``lease_seconds``
+    (e.g. left by a killed worker) are expired.
+
+    The lock directory has to be shared by all workers (e.g. a network file
+    system) for the limit to be global, otherwise it applies per host.
+
+    :param engine_name: name of the engine to limit
+    :param max_concurrency: maximum number of slots of the engine
+    :param lock_dir: directory holding tickets and leases of all engines
+    :param lease_seconds: time after which a stale ticket or lease expires
+    :param poll_interval: seconds between attempts to acquire a slot
+    """
+
+    WAIT_SUFFIX = ".wait"
+    LEASE_SUFFIX = ".lease"
+
+    def __init__(
+        self,
+        engine_name: str,
+        max_concurrency: int,
+        lock_dir: Optional[str] = None,
+        lease_seconds: float = 60.0,
+        poll_interval: float = 0.5,
+    ) -> None:
+        super().__init__()
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive number")
+        self.engine_name = engine_name
+        self.max_concurrency = max_concurrency
+        self.directory = os.path.join(lock_dir or DEFAULT_LOCK_DIR, engine_name)
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+
+    def _entries(self, suffix: str) -> List[str]:
+        """Return sorted live entries with the suffix, removing expired ones."""
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith(suffix):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if now - os.path.getmtime(path) > self.lease_seconds:
+                    os.remove(path)
+                    continue
+            except FileNotFoundError:
+                continue
+            entries.append(name)
+        return sorted(entries)
+
+    def _try_acquire(self, ticket: str) -> bool:
+        # Waiting tickets are listed before leases, so a ticket promoted in
+        # between is seen at least once and can't be overtaken
+        waiting = self._entries(self.WAIT_SUFFIX)
+        leases = self._entries(self.LEASE_SUFFIX)
+        if ticket + self.WAIT_SUFFIX not in waiting:
+            # Our own ticket expired while waiting, e.g. after a long pause
+            _touch(os.path.join(self.directory, ticket + self.WAIT_SUFFIX))
+            return False
+        position = waiting.index(ticket + self.WAIT_SUFFIX)
+        if len(leases) + position >= self.max_concurrency:
+            return False
+        try:
+            os.rename(
+                os.path.join(self.directory, ticket + self.WAIT_SUFFIX),
+                os.path.join(self.directory, ticket + self.LEASE_SUFFIX),
+            )
+        except FileNotFoundError:
+            return False
+        return True
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Wait for a free slot of the engine and hold it while in context."""
+        os.makedirs(self.directory, exist_ok=True)
+        ticket = f"{time.time_ns():020d}-{uuid4().hex}"
+        wait_path = os.path.join(self.directory, ticket + self.WAIT_SUFFIX)
+        lease_path = os.path.join(self.directory, ticket + self.LEASE_SUFFIX)
+
+        started = time.monotonic()
+        _touch(wait_path)
+        try:
+            while not self._try_acquire(ticket):
+                _touch(wait_path)
+                time.sleep(self.poll_interval)
+        except BaseException:
+            _remove(wait_path)
+            raise
+
+        waited = time.monotonic() - started
+        Stats.timing(f"firebolt.{self.engine_name}.slot_wait", waited * 1000)
+        if waited >= self.poll_interval:
+            self.log.info(
+                "Waited %.2f seconds for a slot of engine %s", waited, self.engine_name
+            )
+
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=_heartbeat,
+            args=(lease_path, self.lease_seconds / 3, stop_heartbeat),
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            yield
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+            _remove(lease_path)
+
+
+def _touch(path: str) -> None:
+    with open(path, "a"):
+        os.utime(path)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _heartbeat(path: str, interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return
@@ -0,0 +1,99 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from firebolt.utils.exception import FireboltError
+
+from firebolt_provider.utils.registry import Registry
+
+
+class EngineRouter:
+    """
+    Routes statements to the least loaded running engine of a pool
+
+    Engine status is cached for ``status_ttl`` seconds, the load of an
+    engine is the number of statements this process currently runs on it.
+    One router is shared by all hooks of a process using the same account,
+    see :func:`get_router`.
+    """
+
+    def __init__(self, status_ttl: float = 30.0) -> None:
+        self.status_ttl = status_ttl
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        self._status: Dict[str, Tuple[float, bool]] = {}
+
+    def is_running(self, engine_name: str, fetch: Callable[[str], bool]) -> bool:
+        """Return cached engine status, refreshing it with fetch if stale."""
+        cached = self._status.get(engine_name)
+        if cached and time.monotonic() - cached[0] < self.status_ttl:
+            return cached[1]
+        running = fetch(engine_name)
+        self._status[engine_name] = (time.monotonic(), running)
+        return running
+
+    def mark_stopped(self, engine_name: str) -> None:
+        self._status[engine_name] = (time.monotonic(), False)
+
+    def choose(
+        self,
+        engine_names: Iterable[str],
+        fetch_status: Callable[[str], bool],
+    ) -> str:
+        """
+        Pick the running engine with the fewest in-flight statements
+
+        Ties are resolved by the order of engine_names. When none of the
+        engines is running, the first one is picked, connecting to it
+        starts it.
+        """
+        engine_names = list(engine_names)
+        if not engine_names:
+            raise FireboltError("The engine pool is empty")
+        candidates = [
+            name for name in engine_names if self.is_running(name, fetch_status)
+        ]
+        if not candidates:
+            return engine_names[0]
+        with self._lock:
+            return min(candidates, key=lambda name: self._in_flight[name])
+
+    def in_flight_count(self, engine_name: str) -> int:
+        return self._in_flight[engine_name]
+
+    def track_start(self, engine_name: str) -> None:
+        """Count a run as in flight on the engine."""
+        with self._lock:
+            self._in_flight[engine_name] += 1
+
+    def track_end(self, engine_name: str) -> None:
+        with self._lock:
+            self._in_flight[engine_name] -= 1
+
+
+_routers: Registry[Tuple[str, Optional[str]], EngineRouter] = Registry()
+
+
+def get_router(api_endpoint: str, account_name: Optional[str]) -> EngineRouter:
+    """Return the process-wide router for an account."""
+    return _routers.get_or_create((api_endpoint, account_name), EngineRouter)
@@ -0,0 +1,69 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import re
+from typing import Any, Dict, List
+
+_NODE_RE = re.compile(r"\[(\d+)\]\s*\[(\w+)\]([^\n]*)")
+_TABLE_RE = re.compile(r'Name:\s*"?([\w.]+)"?')
+_METRICS_RE = {
+    "output_rows": re.compile(r"output cardinality\s*=\s*(\d+)"),
+    "thread_time_ms": re.compile(r"thread time\s*=\s*([\d.]+)\s*ms"),
+    "cpu_time_ms": re.compile(r"cpu time\s*=\s*([\d.]+)\s*ms"),
+}
+
+
+def parse_plan(plan: str) -> List[Dict[str, Any]]:
+    """
+    Extract operators and their execution metrics from a Firebolt plan
+
+    Each operator is a dict with ``id``, ``name`` and, when present in the
+    plan, ``table``, ``output_rows``, ``thread_time_ms`` and ``cpu_time_ms``.
+    Execution metrics are only reported by ``EXPLAIN (ANALYZE)``.
+    """
+    operators: List[Dict[str, Any]] = []
+    for line in plan.splitlines():
+        node = _NODE_RE.search(line)
+        if node:
+            operators.append({"id": int(node.group(1)), "name": node.group(2)})
+            table = _TABLE_RE.search(node.group(3))
+            if table:
+                operators[-1]["table"] = table.group(1)
+            continue
+        if not operators:
+            continue
+        for metric, metric_re in _METRICS_RE.items():
+            match = metric_re.search(line)
+            if match:
+                value = float(match.group(1))
+                operators[-1][metric] = int(value) if metric == "output_rows" else value
+    return operators
+
+
+def format_timings(operators: List[Dict[str, Any]]) -> str:
+    """Render operators of a parsed plan as a compact text table."""
+    lines = [
+        f"{'id':>4} {'operator':<24} {'rows':>12} {'thread ms':>10} {'cpu ms':>10}"
+    ]
+    for op in operators:
+        lines.append(
+            f"{op['id']:>4} {op['name'][:24]:<24} {op.get('output_rows', ''):>12} "
+            f"{op.get('thread_time_ms', ''):>10} {op.get('cpu_time_ms', ''):>10}"
+        )
+    return "\n".join(lines)
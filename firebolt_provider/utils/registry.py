@@ -0,0 +1,45 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+import threading
+from typing import Callable, Dict, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class Registry(Dict[K, V]):
+    """
+    Process-wide objects shared by key, created on first use
+
+    The dict is only read and written through :meth:`get_or_create`, which
+    holds a lock so concurrent callers get the same object.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """Return the object of the key, creating it with factory if missing."""
+        with self._lock:
+            if key not in self:
+                self[key] = factory()
+            return self[key]
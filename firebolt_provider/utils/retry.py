@@ -0,0 +1,65 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import random
+import re
+
+from firebolt.utils.exception import (
+    ConnectionClosedError,
+    ConnectionError,
+    EngineNotRunningError,
+    OperationalError,
+    QueryTimeoutError,
+)
+from httpx import HTTPStatusError, TransportError
+
+# HTTP statuses of overloaded or restarting services
+TRANSIENT_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Messages of server errors caused by the infrastructure, not by the query
+_TRANSIENT_MESSAGE_RE = re.compile(
+    r"\b(?:502|503|504)\b|bad gateway|service unavailable|gateway time-?out"
+    r"|connection (?:reset|refused|aborted)|temporarily unavailable"
+    r"|engine is (?:starting|restarting|stopping)",
+    re.IGNORECASE,
+)
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Check whether an error is likely to go away if the statement is retried
+
+    Network failures, HTTP 429 and 5xx gateway errors, a restarting engine
+    and server errors reporting such conditions are transient. Query
+    timeouts, closed connections, authentication and query errors are not.
+    """
+    if isinstance(error, (QueryTimeoutError, ConnectionClosedError)):
+        return False
+    if isinstance(error, (TransportError, ConnectionError, EngineNotRunningError)):
+        return True
+    if isinstance(error, HTTPStatusError):
+        return error.response.status_code in TRANSIENT_STATUS_CODES
+    if isinstance(error, OperationalError):
+        return bool(_TRANSIENT_MESSAGE_RE.search(str(error)))
+    return False
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Return a random delay before retry number attempt, 1-based ("full jitter")."""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
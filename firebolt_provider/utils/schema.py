@@ -0,0 +1,116 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from firebolt_provider.utils.registry import Registry
+
+# Columns of all the user tables of the database, in table order
+SCHEMA_QUERY = (
+    "SELECT table_name, column_name, data_type, is_nullable, is_in_primary_index "
+    "FROM information_schema.columns "
+    "WHERE table_schema <> 'information_schema' "
+    "ORDER BY table_name, ordinal_position"
+)
+
+
+class Column(NamedTuple):
+    name: str
+    data_type: str
+    nullable: bool
+    primary_index: bool
+
+
+Schemas = Dict[str, List[Column]]
+
+
+def _is_true(value: object) -> bool:
+    """Convert information_schema YES/NO flags to bool."""
+    if isinstance(value, str):
+        return value.strip().upper() in ("YES", "TRUE", "1")
+    return bool(value)
+
+
+def parse_schema_rows(rows: Iterable[Tuple]) -> Schemas:
+    """Group rows returned by SCHEMA_QUERY into column lists by table name."""
+    schemas: Schemas = {}
+    for table, column, data_type, is_nullable, is_in_primary_index in rows:
+        schemas.setdefault(table.lower(), []).append(
+            Column(
+                column, data_type, _is_true(is_nullable), _is_true(is_in_primary_index)
+            )
+        )
+    return schemas
+
+
+class SchemaCache:
+    """
+    In-memory cache of table schemas of databases
+
+    Schemas of a database are loaded together with a single query and kept
+    for ``ttl`` seconds. A DDL statement on any table of the database drops
+    its entry, so the next lookup reloads it. One cache is shared by all
+    hooks of a process using the same account, see :func:`get_schema_cache`.
+    """
+
+    def __init__(self, ttl: float = 300.0) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._databases: Dict[str, Tuple[float, Schemas]] = {}
+
+    def get_table(
+        self,
+        database: str,
+        table: str,
+        load: Callable[[], Schemas],
+        max_age: Optional[float] = None,
+    ) -> Optional[List[Column]]:
+        """
+        Return columns of the table, or None if it doesn't exist
+
+        Schemas of the database are loaded with load when missing or older
+        than max_age, ``ttl`` by default, or when the table is not among the
+        cached ones, e.g. because it was created by another process.
+        """
+        table = table.lower()
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            cached = self._databases.get(database)
+            if (
+                cached is None
+                or time.monotonic() - cached[0] >= max_age
+                or table not in cached[1]
+            ):
+                cached = (time.monotonic(), load())
+                self._databases[database] = cached
+            return cached[1].get(table)
+
+    def invalidate(self, database: str) -> None:
+        with self._lock:
+            self._databases.pop(database, None)
+
+
+_caches: Registry[Tuple[str, Optional[str]], SchemaCache] = Registry()
+
+
+def get_schema_cache(api_endpoint: str, account_name: Optional[str]) -> SchemaCache:
+    """Return the process-wide schema cache for an account."""
+    return _caches.get_or_create((api_endpoint, account_name), SchemaCache)
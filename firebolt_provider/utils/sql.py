@@ -0,0 +1,301 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import re
+from typing import Iterable, Iterator, List, Optional, Set, Union
+
+# Leading keywords of statements which never modify data
+READ_ONLY_KEYWORDS = frozenset({"SELECT", "WITH", "SHOW", "DESCRIBE", "EXPLAIN"})
+# Leading keywords of statements which may change table schemas
+DDL_KEYWORDS = frozenset({"CREATE", "DROP", "ALTER"})
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_KEYWORD_RE = re.compile(r"[\s(]*([A-Za-z]+)")
+_EXPLAIN_RE = re.compile(r"[\s(]*EXPLAIN\s*(?:\(([^)]*)\)|(ANALYZE)\b)?", re.IGNORECASE)
+_ANALYZE_RE = re.compile(r"\bANALYZE\b", re.IGNORECASE)
+
+
+def statement_keyword(statement: str) -> str:
+    """Return the upper-cased leading keyword of a statement."""
+    match = _KEYWORD_RE.match(_COMMENT_RE.sub(" ", statement))
+    return match.group(1).upper() if match else ""
+
+
+def is_read_only(sql: Union[str, Iterable[str]]) -> bool:
+    """
+    Check whether the sql consists of read-only statements only
+
+    Classification is conservative: a statement is read-only only if it
+    starts with one of READ_ONLY_KEYWORDS, anything unknown is treated as
+    a write. ``EXPLAIN (ANALYZE)`` executes the statement it wraps, so it
+    is classified as that statement.
+    """
+    statements = [sql] if isinstance(sql, str) else list(sql)
+    chunks = [
+        chunk
+        for statement in statements
+        for chunk in _COMMENT_RE.sub(" ", statement).split(";")
+        if chunk.strip()
+    ]
+    return bool(chunks) and all(_is_read_only_statement(chunk) for chunk in chunks)
+
+
+def _is_read_only_statement(statement: str) -> bool:
+    keyword = statement_keyword(statement)
+    if keyword == "EXPLAIN":
+        match = _EXPLAIN_RE.match(statement)
+        if match and _ANALYZE_RE.search(match.group(1) or match.group(2) or ""):
+            return _is_read_only_statement(statement[match.end() :])
+    return keyword in READ_ONLY_KEYWORDS
+
+
+# Leading keywords of queries whose results may be cached
+CACHEABLE_KEYWORDS = frozenset({"SELECT", "WITH"})
+_SYSTEM_SCHEMA_RE = re.compile(r"\binformation_schema\s*\.", re.IGNORECASE)
+
+
+def is_cacheable(sql: Union[str, Iterable[str]]) -> bool:
+    """
+    Check whether results of the sql may be served from a cache
+
+    Only SELECT queries are cacheable, except the ones reading
+    information_schema, whose results must always be current.
+    """
+    statements = [sql] if isinstance(sql, str) else list(sql)
+    chunks = [
+        chunk
+        for statement in statements
+        for chunk in _COMMENT_RE.sub(" ", statement).split(";")
+        if chunk.strip()
+    ]
+    return bool(chunks) and all(
+        statement_keyword(chunk) in CACHEABLE_KEYWORDS
+        and not _SYSTEM_SCHEMA_RE.search(chunk)
+        for chunk in chunks
+    )
+
+
+_IDEMPOTENT_DDL_RE = re.compile(
+    r"^\s*(?:DROP\s+\w+(?:\s+\w+)?\s+IF\s+EXISTS"
+    r"|CREATE\s+OR\s+REPLACE"
+    r"|CREATE\s+(?:\w+\s+){1,2}?IF\s+NOT\s+EXISTS)\b",
+    re.IGNORECASE,
+)
+
+
+def is_idempotent(statement: str) -> bool:
+    """
+    Check whether running the statement twice has the same effect as once
+
+    Read-only, SET and TRUNCATE statements are idempotent, as well as DROP
+    ... IF EXISTS, CREATE ... IF NOT EXISTS and CREATE OR REPLACE.
+    """
+    if is_read_only(statement) or statement_keyword(statement) in ("SET", "TRUNCATE"):
+        return True
+    return bool(_IDEMPOTENT_DDL_RE.match(_COMMENT_RE.sub(" ", statement)))
+
+
+_IDENTIFIER = r'((?:"[^"]+"|\w+)(?:\.(?:"[^"]+"|\w+))*)'
+_TOKEN_RE = re.compile(r"'(?:[^']|'')*'|" + _IDENTIFIER + r"|[(),]")
+# Keywords ending the table list of a FROM clause
+_FROM_END_KEYWORDS = frozenset(
+    {
+        "WHERE",
+        "GROUP",
+        "HAVING",
+        "ORDER",
+        "LIMIT",
+        "OFFSET",
+        "UNION",
+        "INTERSECT",
+        "EXCEPT",
+        "QUALIFY",
+        "WINDOW",
+        "SELECT",
+    }
+)
+_MODIFIED_TABLE_RE = re.compile(
+    r"^\s*(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?"
+    r"|(?:DROP|ALTER)\s+TABLE(?:\s+IF\s+EXISTS)?"
+    r"|CREATE(?:\s+OR\s+REPLACE)?(?:\s+(?:FACT|DIMENSION|EXTERNAL))?\s+TABLE"
+    r"(?:\s+IF\s+NOT\s+EXISTS)?)\s+" + _IDENTIFIER,
+    re.IGNORECASE,
+)
+
+
+def _table_name(identifier: str) -> str:
+    """Return unquoted lower-cased table name of a possibly qualified identifier."""
+    name = identifier.split(".")[-1]
+    return name[1:-1] if name.startswith('"') else name.lower()
+
+
+_INSERT_QUERY_RE = re.compile(
+    r"^\s*INSERT\s+INTO\s+"
+    + _IDENTIFIER
+    + r"\s*(?:\([^)]*\))?\s*(?=[(\s]*(?:SELECT|WITH)\b)",
+    re.IGNORECASE,
+)
+
+
+def insert_query(sql: str) -> Optional[str]:
+    """Return the query of an ``INSERT INTO ... SELECT`` statement, if it is one."""
+    sql = _COMMENT_RE.sub(" ", sql)
+    match = _INSERT_QUERY_RE.match(sql)
+    return sql[match.end() :].strip() if match else None
+
+
+def referenced_tables(sql: str) -> Set[str]:
+    """
+    Return names of the tables the statement reads from
+
+    Tables following FROM or JOIN, and the comma-separated ones of a FROM
+    list, are collected at every subquery level.
+    """
+    tables: Set[str] = set()
+    # Per parenthesis level: whether in a FROM clause, whether a table is next
+    levels = [[False, False]]
+    for match in _TOKEN_RE.finditer(_COMMENT_RE.sub(" ", sql)):
+        token, level = match.group(0), levels[-1]
+        if token == "(":
+            level[1] = False
+            levels.append([False, False])
+        elif token == ")":
+            if len(levels) > 1:
+                levels.pop()
+        elif token == ",":
+            level[1] = level[0]
+        elif token.startswith("'"):
+            level[1] = False
+        elif token.upper() in ("FROM", "JOIN"):
+            level[0] = level[1] = True
+        elif token.upper() in _FROM_END_KEYWORDS:
+            level[0] = level[1] = False
+        elif level[1]:
+            tables.add(_table_name(token))
+            level[1] = False
+    return tables
+
+
+def modified_table(sql: str) -> Optional[str]:
+    """Return name of the table the statement writes to or alters, if any."""
+    match = _MODIFIED_TABLE_RE.match(_COMMENT_RE.sub(" ", sql))
+    return _table_name(match.group(1)) if match else None
+
+
+def join_statements(statements: Iterable[str]) -> str:
+    """
+    Join statements into one script
+
+    The separator starts on a new line, so a statement ending with a line
+    comment doesn't swallow it.
+    """
+    return "\n;\n".join(statements)
+
+
+# States of the statement splitter
+_NORMAL = "normal"
+_QUOTE = "quote"
+_QUOTED_IDENTIFIER = "quoted_identifier"
+_LINE_COMMENT = "line_comment"
+_BLOCK_COMMENT = "block_comment"
+_DOLLAR_TAG = "dollar_tag"
+_DOLLAR = "dollar"
+
+
+def iter_statements(sql: Union[str, Iterable[str]]) -> Iterator[str]:
+    """
+    Lazily split SQL text into statements
+
+    Semicolons inside quoted strings and identifiers, comments and
+    dollar-quoted blocks (``$$ ... $$``, ``$tag$ ... $tag$``) do not end a
+    statement. Statements are yielded stripped, without the terminating
+    semicolon, statements consisting of comments only are skipped.
+
+    :param sql: SQL text or an iterable of text chunks, e.g. an open file,
+        which is consumed as the statements are iterated
+    """
+    chunks = [sql] if isinstance(sql, str) else sql
+    buf: List[str] = []
+    state = _NORMAL
+    prev = ""
+    escapes = escaped = False
+    dollar_start = body_start = 0
+    dollar_tag = ""
+
+    for chunk in chunks:
+        for ch in chunk:
+            if state == _DOLLAR_TAG and not (ch == "$" or ch.isalnum() or ch == "_"):
+                # Not a dollar quote, e.g. a $1 placeholder
+                state = _NORMAL
+
+            if state == _NORMAL:
+                if ch == ";":
+                    statement = "".join(buf).strip()
+                    if _COMMENT_RE.sub("", statement).strip():
+                        yield statement
+                    buf, prev = [], ""
+                    continue
+                buf.append(ch)
+                if ch == "'":
+                    state, escapes, escaped = _QUOTE, prev in ("e", "E"), False
+                elif ch == '"':
+                    state = _QUOTED_IDENTIFIER
+                elif ch == "-" and prev == "-":
+                    state = _LINE_COMMENT
+                elif ch == "*" and prev == "/":
+                    state, ch = _BLOCK_COMMENT, ""
+                elif ch == "$" and not (prev.isalnum() or prev == "_"):
+                    state, dollar_start = _DOLLAR_TAG, len(buf) - 1
+            else:
+                buf.append(ch)
+                if state == _QUOTE:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\" and escapes:
+                        escaped = True
+                    elif ch == "'":
+                        state = _NORMAL
+                elif state == _QUOTED_IDENTIFIER:
+                    if ch == '"':
+                        state = _NORMAL
+                elif state == _LINE_COMMENT:
+                    if ch == "\n":
+                        state = _NORMAL
+                elif state == _BLOCK_COMMENT:
+                    if ch == "/" and prev == "*":
+                        state = _NORMAL
+                elif state == _DOLLAR_TAG:
+                    if ch == "$":
+                        if buf[dollar_start + 1].isdigit():
+                            state = _NORMAL
+                        else:
+                            dollar_tag = "".join(buf[dollar_start:])
+                            state, body_start = _DOLLAR, len(buf)
+                elif state == _DOLLAR:
+                    if (
+                        ch == "$"
+                        and len(buf) - len(dollar_tag) >= body_start
+                        and "".join(buf[-len(dollar_tag) :]) == dollar_tag
+                    ):
+                        state = _NORMAL
+            prev = ch
+
+    statement = "".join(buf).strip()
+    if _COMMENT_RE.sub("", statement).strip():
+        yield statement
@@ -0,0 +1,105 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import base64
+import gzip
+import hashlib
+import re
+from typing import Any, List, NamedTuple, Optional
+
+PREVIEW_LENGTH = 200
+# XCom key and maximum compressed size of the full text of long sql
+SQL_XCOM_KEY = "firebolt_sql"
+MAX_ARTIFACT_BYTES = 1024 * 1024
+
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Return a short hash identifying the statement shape
+
+    Literals and whitespace are normalized, so statements differing only
+    in values share a fingerprint.
+    """
+    normalized = _WHITESPACE_RE.sub(" ", _LITERAL_RE.sub("?", sql)).strip().lower()
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+def preview(value: Any, length: int = PREVIEW_LENGTH) -> str:
+    """Return the text on one line, truncated to length characters."""
+    text = _WHITESPACE_RE.sub(" ", str(value)).strip()
+    if len(text) <= length:
+        return text
+    return f"{text[:length]}... ({len(text)} chars)"
+
+
+def compress(sql: str, max_bytes: int = MAX_ARTIFACT_BYTES) -> Optional[str]:
+    """
+    Return the text gzip-compressed and base64-encoded, e.g. for XCom
+
+    None is returned when the compressed text is larger than max_bytes.
+    """
+    compressed = gzip.compress(sql.encode(), mtime=0)
+    if len(compressed) > max_bytes:
+        return None
+    return base64.b64encode(compressed).decode("ascii")
+
+
+def decompress(artifact: str) -> str:
+    """Return the text of an artifact built by :func:`compress`."""
+    return gzip.decompress(base64.b64decode(artifact)).decode()
+
+
+class _Timing(NamedTuple):
+    position: int
+    seconds: float
+    rowcount: int
+    sql: str
+
+
+class StatementTimings:
+    """Collects durations of the statements of a run and formats them"""
+
+    def __init__(self) -> None:
+        self.timings: List[_Timing] = []
+
+    def __len__(self) -> int:
+        return len(self.timings)
+
+    def add(self, index: int, seconds: float, rowcount: int, sql: str) -> None:
+        self.timings.append(_Timing(index, seconds, rowcount, sql))
+
+    def format(self, limit: int = 10) -> str:
+        """Return a table of the slowest statements with the totals."""
+        total = sum(timing.seconds for timing in self.timings)
+        lines = [
+            f"{len(self.timings)} statements took {total:.3f}s, "
+            f"slowest {min(limit, len(self.timings))}:",
+            f"{'#':>6} {'seconds':>9} {'rows':>10}  {'fingerprint':12}  statement",
+        ]
+        slowest = sorted(self.timings, key=lambda timing: -timing.seconds)[:limit]
+        for timing in slowest:
+            rows = str(timing.rowcount) if timing.rowcount >= 0 else "-"
+            lines.append(
+                f"{timing.position:>6} {timing.seconds:>9.3f} {rows:>10}  "
+                f"{fingerprint(timing.sql)}  {preview(timing.sql, 60)}"
+            )
+        return "\n".join(lines)
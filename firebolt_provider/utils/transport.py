@@ -0,0 +1,110 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import hashlib
+from ssl import SSLContext
+from typing import Any, Optional, Tuple, Union
+
+from firebolt.client.http_backend import KeepaliveTransport
+from httpx import BaseTransport, Client, Request, Response
+
+from firebolt_provider.utils.registry import Registry
+
+
+class SharedTransport(BaseTransport):
+    """
+    Client handle of a process-wide keep-alive connection pool
+
+    SDK clients close their transport together with the connection. Closing
+    the handle keeps the pool, so its open TCP/TLS connections are reused
+    by the next client of the same account.
+
+    :param pool: connection pool returned by :func:`get_transport`
+    :param compression: whether to accept compressed responses, disabling
+        it saves CPU on fast networks
+    """
+
+    def __init__(self, pool: BaseTransport, compression: bool = True) -> None:
+        self.pool = pool
+        self.compression = compression
+
+    def handle_request(self, request: Request) -> Response:
+        if not self.compression:
+            request.headers["Accept-Encoding"] = "identity"
+        return self.pool.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+Verify = Union[bool, SSLContext]
+
+_pools: Registry[Tuple[str, Optional[str], bool, Any], BaseTransport] = Registry()
+
+
+def client_verify(client: Any) -> Verify:
+    """Return the TLS verification setting an SDK client was built with."""
+    transport = getattr(client, "_transport", None)
+    if isinstance(transport, SharedTransport):
+        transport = transport.pool
+    pool = getattr(transport, "_pool", None)
+    ssl_context = getattr(pool, "_ssl_context", None)
+    return ssl_context if isinstance(ssl_context, SSLContext) else True
+
+
+def _verify_key(verify: Verify) -> Any:
+    """Return a key equal for SSL contexts verifying the same way."""
+    if not isinstance(verify, SSLContext):
+        return verify
+    ca_certs = hashlib.sha256()
+    for cert in verify.get_ca_certs(binary_form=True):
+        ca_certs.update(cert)
+    return (verify.verify_mode, verify.check_hostname, ca_certs.hexdigest())
+
+
+def get_transport(
+    api_endpoint: str,
+    account_name: Optional[str],
+    http2: bool = False,
+    verify: Verify = True,
+) -> BaseTransport:
+    """
+    Return the process-wide keep-alive connection pool for an account
+
+    Clients verifying TLS differently, e.g. with another CA bundle, get
+    separate pools.
+    """
+    return _pools.get_or_create(
+        (api_endpoint, account_name, http2, _verify_key(verify)),
+        lambda: KeepaliveTransport(http2=http2, verify=verify),
+    )
+
+
+def share_transport(client: Any, transport: BaseTransport) -> None:
+    """
+    Make an SDK client send its requests through a shared transport
+
+    The SDK doesn't accept a transport, so the one the client was built
+    with is replaced. Clients routed through a proxy are left unchanged.
+    """
+    if not isinstance(client, Client) or client._mounts:
+        return
+    own_transport = client._transport
+    client._transport = transport
+    own_transport.close()
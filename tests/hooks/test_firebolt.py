@@ -17,16 +17,32 @@
 # under the License.
 
 
+import asyncio
 import json
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
+import httpx
+import pytest
 from airflow.providers.common.sql.hooks.sql import fetch_all_handler
 from firebolt.client.auth import ClientCredentials, UsernamePassword
-from firebolt.utils.exception import FireboltError, QueryTimeoutError
-
-from firebolt_provider.hooks.firebolt import FireboltHook
+from firebolt.service.V2.types import EngineStatus
+from firebolt.utils.exception import (
+    EngineNotRunningError,
+    FireboltError,
+    OperationalError,
+    QueryTimeoutError,
+)
+
+from firebolt_provider.hooks.firebolt import (
+    FireboltAsyncHook,
+    FireboltHook,
+    _auths,
+)
+from firebolt_provider.utils.engine_pool import EngineRouter
 
 
 class TestFireboltHookConn(unittest.TestCase):
@@ -46,6 +62,12 @@ class TestFireboltHookConn(unittest.TestCase):
         self.db_hook.get_connection = mock.Mock()
         self.db_hook.get_connection.return_value = self.connection
 
+        auths_patcher = patch.dict(
+            "firebolt_provider.hooks.firebolt._auths", {}, clear=True
+        )
+        auths_patcher.start()
+        self.addCleanup(auths_patcher.stop)
+
     @patch("firebolt_provider.hooks.firebolt.connect")
     def test_get_conn(self, mock_connect):
         self.db_hook.get_conn()
@@ -90,6 +112,56 @@ class TestFireboltHookConn(unittest.TestCase):
             account_name="firebolt",
         )
 
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch("firebolt_provider.hooks.firebolt.ClientCredentials")
+    def test_get_conn_to_shares_auth(self, mock_auth, mock_connect):
+        self.db_hook.get_conn()
+        self.db_hook.get_conn_to("other_db", None)
+        self.db_hook.get_conn_to(None, "other_engine")
+
+        mock_auth.assert_called_once_with("client_id", "client_secret", True)
+        assert [
+            (call[1]["database"], call[1]["engine_name"])
+            for call in mock_connect.call_args_list
+        ] == [("firebolt", "test"), ("other_db", "test"), ("firebolt", "other_engine")]
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch("firebolt_provider.hooks.firebolt.ClientCredentials")
+    def test_hooks_share_auth(self, mock_auth, mock_connect):
+        other_hook = FireboltHook()
+        other_hook.get_connection = self.db_hook.get_connection
+
+        self.db_hook.get_conn()
+        other_hook.get_conn()
+
+        mock_auth.assert_called_once_with("client_id", "client_secret", True)
+        assert "client_secret" not in str(list(_auths))
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    def test_get_conn_shares_transport(self, mock_connect):
+        mock_connect.return_value._client = httpx.Client(trust_env=False)
+        self.connection.extra_dejson["compression"] = False
+
+        with patch.dict(
+            "firebolt_provider.utils.transport._pools", {}, clear=True
+        ) as pools:
+            conn = self.db_hook.get_conn()
+            other_conn = self.db_hook.get_conn()
+            (pool,) = pools.values()
+
+        transport = conn._client._transport
+        assert transport.pool is pool
+        assert transport.pool is other_conn._client._transport.pool
+        assert not transport.compression
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    def test_warmup(self, mock_connect):
+        self.db_hook.warmup()
+
+        conn = mock_connect.return_value
+        conn.cursor.return_value.execute.assert_called_once_with("SELECT 1")
+        conn.close.assert_called_once()
+
     @patch("firebolt_provider.hooks.firebolt.ResourceManager")
     @patch("firebolt_provider.hooks.firebolt.ClientCredentials")
     def test_get_resource_manager(self, mock_auth, mock_rm):
@@ -223,6 +295,15 @@ class TestFireboltHook(unittest.TestCase):
 
         mock_engine.stop.assert_called_once()
 
+    @mock.patch(
+        "firebolt_provider.hooks.firebolt.FireboltHook.get_resource_manager",
+    )
+    def test_get_engine_status(self, mock_rm_call):
+        engine = mock_rm_call.return_value.engines.get_by_name.return_value
+        engine.current_status = EngineStatus.STOPPED
+
+        assert self.db_hook.get_engine_status("engine_name") == "STOPPED"
+
     @mock.patch(
         "firebolt_provider.hooks.firebolt.FireboltHook._get_conn_params",
     )
@@ -262,6 +343,156 @@ class TestFireboltHook(unittest.TestCase):
         )
         assert res == [(1, 2)]
 
+    def test_explain(self):
+        self.cursor.fetchall.return_value = [
+            (
+                '[0] [StoredTable] Name: "t"\n[Execution Metrics]: '
+                "output cardinality = 5, thread time = 1ms, cpu time = 1ms",
+            )
+        ]
+        profile = self.db_hook.explain("SELECT * FROM t", analyze=True)
+
+        self.conn.cursor().execute.assert_called_once_with(
+            "EXPLAIN (ANALYZE) SELECT * FROM t", timeout_seconds=None
+        )
+        assert profile["operators"] == [
+            {
+                "id": 0,
+                "name": "StoredTable",
+                "table": "t",
+                "output_rows": 5,
+                "thread_time_ms": 1.0,
+                "cpu_time_ms": 1.0,
+            }
+        ]
+
+    def test_split_sql_string(self):
+        sql = "SELECT 'a;b'; -- comment;\nINSERT INTO t VALUES (1)"
+        assert self.db_hook.split_sql_string(sql) == [
+            "SELECT 'a;b';",
+            "-- comment;\nINSERT INTO t VALUES (1);",
+        ]
+        assert self.db_hook.split_sql_string(sql, strip_semicolon=True) == [
+            "SELECT 'a;b'",
+            "-- comment;\nINSERT INTO t VALUES (1)",
+        ]
+
+    def test_run_script_batches_statements(self):
+        self.cursor.rowcount = -1
+        script = (
+            "CREATE TABLE t (id INT); INSERT INTO t VALUES (1); "
+            "INSERT INTO t VALUES (2); SELECT * FROM t; SET x = 1; DROP TABLE s"
+        )
+        assert self.db_hook.run_script(script, batch_size=5) == 6
+
+        assert self.cursor.execute.call_args_list == [
+            mock.call(
+                "CREATE TABLE t (id INT)\n;\nINSERT INTO t VALUES (1)\n;\n"
+                "INSERT INTO t VALUES (2)",
+                skip_parsing=True,
+                timeout_seconds=None,
+            ),
+            mock.call("SELECT * FROM t", timeout_seconds=None),
+            mock.call("SET x = 1", timeout_seconds=None),
+            mock.call("DROP TABLE s", timeout_seconds=None),
+        ]
+        self.conn.commit.assert_called_once()
+
+    def test_run_script_batches_statements_ending_with_comment(self):
+        self.cursor.rowcount = -1
+        script = "INSERT INTO t VALUES (1) -- first row\n;\nINSERT INTO t VALUES (2);"
+
+        self.db_hook.run_script(script, batch_size=2)
+
+        batch = self.cursor.execute.call_args[0][0]
+        assert batch == script.rstrip(";")
+        assert len(self.db_hook.split_sql_string(batch)) == 2
+
+    @patch("firebolt_provider.hooks.firebolt._EXECUTEMANY_BULK_INSERT", True)
+    def test_run_many(self):
+        self.cursor.rowcount = 2
+        self.cursor.nextset.return_value = None
+        sql = "INSERT INTO t VALUES (?, ?);"
+        params = ([n, "name"] for n in range(5))
+
+        assert self.db_hook.run_many(sql, params, batch_size=2) == 6
+
+        assert self.cursor.executemany.call_args_list == [
+            mock.call(
+                "INSERT INTO t VALUES (?, ?)",
+                batch,
+                timeout_seconds=None,
+                bulk_insert=True,
+            )
+            for batch in (
+                [[0, "name"], [1, "name"]],
+                [[2, "name"], [3, "name"]],
+                [[4, "name"]],
+            )
+        ]
+        self.conn.commit.assert_called_once()
+
+    @patch("firebolt_provider.hooks.firebolt._EXECUTEMANY_BULK_INSERT", False)
+    def test_run_many_sums_result_sets(self):
+        type(self.cursor).rowcount = mock.PropertyMock(side_effect=[1, 1, -1, 1])
+        self.cursor.nextset.side_effect = [True, True, True, None]
+
+        assert self.db_hook.run_many("UPDATE t SET a = ?", [[1], [2], [3]]) == 3
+        self.cursor.executemany.assert_called_once_with(
+            "UPDATE t SET a = ?", [[1], [2], [3]], timeout_seconds=None
+        )
+
+    @patch("firebolt_provider.hooks.firebolt.Stats")
+    @patch("firebolt_provider.hooks.firebolt.time.sleep")
+    def test_transient_errors_are_retried(self, mock_sleep, mock_stats):
+        self.cursor.execute.side_effect = [
+            httpx.ConnectError("connection reset"),
+            OperationalError("502 Bad Gateway"),
+            None,
+        ]
+        self.db_hook.run("SELECT 1")
+
+        assert self.cursor.execute.call_count == 3
+        assert mock_sleep.call_count == 2
+        mock_stats.incr.assert_called_with("firebolt.statement_retries")
+
+    @patch("firebolt_provider.hooks.firebolt.time.sleep")
+    def test_writes_and_fatal_errors_are_not_retried(self, mock_sleep):
+        self.cursor.execute.side_effect = httpx.ConnectError("connection reset")
+        with self.assertRaises(httpx.ConnectError):
+            self.db_hook.run("INSERT INTO t VALUES (1)")
+        assert self.cursor.execute.call_count == 1
+
+        self.cursor.execute.reset_mock()
+        self.cursor.execute.side_effect = OperationalError("Unknown column 'x'")
+        with self.assertRaises(OperationalError):
+            self.db_hook.run("SELECT x")
+        assert self.cursor.execute.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("firebolt_provider.hooks.firebolt.time.sleep")
+    def test_retry_budget(self, mock_sleep):
+        self.db_hook.statement_retries = 2
+        self.db_hook.retry_budget = 3
+        error = httpx.ConnectError("connection reset")
+        self.cursor.execute.side_effect = [error, error, None, error, error]
+        with self.assertRaises(httpx.ConnectError):
+            self.db_hook.run(["SELECT 1", "SELECT 2"])
+        # Two retries of the first statement leave one for the second
+        assert self.cursor.execute.call_count == 5
+
+    def test_run_logs_previews_and_timings(self):
+        statements = [f"INSERT INTO t VALUES ({n}, '{'x' * 500}')" for n in range(3)]
+        with self.assertLogs(self.db_hook.log, level="INFO") as logs:
+            self.db_hook.run(statements)
+
+        running = [line for line in logs.output if "Running statement" in line]
+        assert len(running) == 3
+        assert all(
+            "... (528 chars)" in line and "x" * 300 not in line for line in running
+        )
+        assert "3 statements took" in logs.output[-1]
+
     def test_timeout(self):
         self.db_hook.query_timeout = 1
         self.cursor.execute.side_effect = QueryTimeoutError("Timeout")
@@ -279,3 +510,357 @@ class TestFireboltHook(unittest.TestCase):
         self.conn.cursor().execute.assert_called_once_with(
             "SELECT 1", timeout_seconds=1
         )
+
+
+class TestFireboltHookEnginePool(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.connection = mock.MagicMock()
+        self.connection.login = "client_id"
+        self.connection.password = "client_secret"
+        self.connection.schema = "firebolt"
+        self.connection.host = "test"
+        self.connection.extra_dejson = {
+            "account_name": "firebolt",
+            "engine_pool": "engine_a, engine_b",
+        }
+
+        self.db_hook = FireboltHook()
+        self.db_hook.get_connection = mock.Mock(return_value=self.connection)
+        self.router = EngineRouter()
+        patcher = patch(
+            "firebolt_provider.hooks.firebolt.get_router", return_value=self.router
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch.object(FireboltHook, "is_engine_running", return_value=True)
+    def test_routes_to_least_loaded_engine(self, mock_running, mock_connect):
+        mock_connect.return_value.cursor.return_value.rowcount = -1
+        self.router.track_start("engine_a")
+
+        self.db_hook.run("SELECT 1")
+
+        assert mock_connect.call_args[1]["engine_name"] == "engine_b"
+        assert self.router.in_flight_count("engine_b") == 0
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    def test_explicit_engine_bypasses_pool(self, mock_connect):
+        mock_connect.return_value.cursor.return_value.rowcount = -1
+        hook = FireboltHook(engine_name="engine_c")
+        hook.get_connection = mock.Mock(return_value=self.connection)
+
+        hook.run("SELECT 1")
+
+        assert hook._get_conn_params().engine_pool is None
+        assert mock_connect.call_args[1]["engine_name"] == "engine_c"
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch.object(FireboltHook, "is_engine_running")
+    def test_skips_stopped_engine(self, mock_running, mock_connect):
+        mock_connect.return_value.cursor.return_value.rowcount = -1
+        mock_running.side_effect = lambda name: name == "engine_b"
+
+        self.db_hook.run("SELECT 1")
+
+        assert mock_connect.call_args[1]["engine_name"] == "engine_b"
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch.object(FireboltHook, "is_engine_running", return_value=True)
+    def test_fails_over_on_engine_error(self, mock_running, mock_connect):
+        conn = MagicMock()
+        conn.cursor.return_value.rowcount = -1
+        mock_connect.side_effect = [EngineNotRunningError("engine_a"), conn]
+
+        self.db_hook.run("SELECT 1")
+
+        assert mock_connect.call_args[1]["engine_name"] == "engine_b"
+        assert self.router.is_running("engine_a", mock_running) is False
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch.object(FireboltHook, "is_engine_running", return_value=False)
+    def test_connects_to_first_engine_when_none_is_running(
+        self, mock_running, mock_connect
+    ):
+        mock_connect.return_value.cursor.return_value.rowcount = -1
+
+        self.db_hook.run("SELECT 1")
+
+        assert mock_connect.call_args[1]["engine_name"] == "engine_a"
+
+    @patch("firebolt_provider.hooks.firebolt.time.sleep")
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch.object(FireboltHook, "is_engine_running", return_value=True)
+    def test_fails_over_on_execute_engine_error(
+        self, mock_running, mock_connect, mock_sleep
+    ):
+        failing, conn = MagicMock(), MagicMock()
+        failing.cursor.return_value.execute.side_effect = EngineNotRunningError("a")
+        conn.cursor.return_value.rowcount = -1
+        mock_connect.side_effect = [failing, conn]
+
+        self.db_hook.run(["SELECT 1", "INSERT INTO t VALUES (1)"])
+
+        assert [c[1]["engine_name"] for c in mock_connect.call_args_list] == [
+            "engine_a",
+            "engine_b",
+        ]
+        assert conn.cursor.return_value.execute.call_count == 2
+        assert self.router.is_running("engine_a", mock_running) is False
+        mock_sleep.assert_not_called()
+
+    @patch("firebolt_provider.hooks.firebolt.time.sleep")
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch.object(FireboltHook, "is_engine_running", return_value=True)
+    def test_no_fail_over_after_completed_statements(
+        self, mock_running, mock_connect, mock_sleep
+    ):
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.rowcount = -1
+        cursor.execute.side_effect = [None] + [EngineNotRunningError("a")] * 4
+
+        with pytest.raises(EngineNotRunningError):
+            self.db_hook.run(["INSERT INTO t VALUES (1)", "SELECT 1"])
+
+        mock_connect.assert_called_once()
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch.object(FireboltHook, "is_engine_running", return_value=True)
+    def test_pins_writes_to_primary_engine(self, mock_running, mock_connect):
+        mock_connect.return_value.cursor.return_value.rowcount = -1
+        self.connection.extra_dejson["primary_engine"] = "engine_w"
+
+        self.db_hook.run(["SELECT 1", "INSERT INTO t VALUES (1)"])
+        assert mock_connect.call_args[1]["engine_name"] == "engine_w"
+
+        self.db_hook.run("SELECT 1")
+        assert mock_connect.call_args[1]["engine_name"] == "engine_a"
+
+
+class TestFireboltHookConcurrencyLimit(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.connection = mock.MagicMock()
+        self.connection.login = "client_id"
+        self.connection.password = "client_secret"
+        self.connection.schema = "firebolt"
+        self.connection.host = "test"
+        self.connection.extra_dejson = {
+            "account_name": "firebolt",
+            "max_concurrent_statements": "3",
+            "concurrency_lock_dir": "/shared/locks",
+        }
+
+        self.db_hook = FireboltHook()
+        self.db_hook.get_connection = mock.Mock(return_value=self.connection)
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch("firebolt_provider.hooks.firebolt.EngineSlotLimiter")
+    def test_run_holds_engine_slot(self, mock_limiter, mock_connect):
+        mock_connect.return_value.cursor.return_value.rowcount = -1
+        slot = mock_limiter.return_value.slot.return_value
+
+        self.db_hook.run("SELECT 1")
+
+        mock_limiter.assert_called_once_with("test", 3, lock_dir="/shared/locks")
+        slot.__enter__.assert_called_once()
+        slot.__exit__.assert_called_once()
+
+    @patch("firebolt_provider.hooks.firebolt.connect")
+    @patch("firebolt_provider.hooks.firebolt.EngineSlotLimiter")
+    def test_get_conn_outside_run_is_not_limited(self, mock_limiter, mock_connect):
+        self.db_hook.get_conn()
+
+        mock_limiter.assert_not_called()
+
+
+class TestFireboltAsyncHook(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.hook = FireboltAsyncHook()
+        self.hook._hook._get_conn_params = mock.Mock(
+            return_value=FireboltHook.ConnectionParameters(
+                client_id="client_id",
+                client_secret="client_secret",
+                api_endpoint="api.app.firebolt.io",
+                database="database",
+                engine_name="engine",
+                account_name="account",
+            )
+        )
+        self.cursor = mock.MagicMock()
+        self.cursor.execute = mock.AsyncMock()
+        self.cursor.execute_stream = mock.AsyncMock()
+        self.cursor.aclose = mock.AsyncMock()
+        self.cursor.fetchall = mock.AsyncMock(return_value=[[1]])
+        self.cursor.fetchmany = mock.AsyncMock(side_effect=[[[1], [2]], [[3]], []])
+        self.conn = mock.MagicMock(closed=False)
+        self.conn.cursor.return_value = self.cursor
+        self.conn.aclose = mock.AsyncMock()
+
+        patcher = patch(
+            "firebolt_provider.hooks.firebolt.async_connect",
+            new=mock.AsyncMock(return_value=self.conn),
+        )
+        self.mock_connect = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_gather_shares_connection(self):
+        async def gather():
+            async with self.hook as hook:
+                return await asyncio.gather(
+                    hook.get_records("SELECT 1"),
+                    hook.get_records("SELECT 2", parameters=[1]),
+                )
+
+        assert asyncio.run(gather()) == [[[1]], [[1]]]
+        self.mock_connect.assert_awaited_once_with(
+            auth=mock.ANY,
+            api_endpoint="api.app.firebolt.io",
+            database="database",
+            engine_name="engine",
+            account_name="account",
+        )
+        self.cursor.execute.assert_any_await("SELECT 1", timeout_seconds=None)
+        self.cursor.execute.assert_any_await("SELECT 2", [1], timeout_seconds=None)
+        self.conn.aclose.assert_awaited_once()
+
+    def test_stream_records(self):
+        async def stream():
+            return [row async for row in self.hook.stream_records("SELECT 1", None, 2)]
+
+        assert asyncio.run(stream()) == [[1], [2], [3]]
+        self.cursor.execute_stream.assert_awaited_once_with("SELECT 1", None)
+        self.cursor.execute.assert_not_called()
+        self.cursor.fetchmany.assert_awaited_with(2)
+        self.cursor.aclose.assert_awaited_once()
+
+    def test_run_statement_list(self):
+        self.cursor.fetchall.side_effect = [[[1]], [[2]]]
+        result = asyncio.run(
+            self.hook.run(["SQL1", "SQL2"], handler=lambda cur: cur.fetchall())
+        )
+        assert result == [[[1]], [[2]]]
+        self.cursor.aclose.assert_awaited_once()
+        self.cursor.close.assert_not_called()
+
+    @mock.patch.object(FireboltHook, "engine_action")
+    def test_engine_action(self, mock_engine_action):
+        asyncio.run(self.hook.engine_action("engine", "start"))
+        mock_engine_action.assert_called_once_with("engine", "start")
+
+
+class TestFireboltHookResultCache(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.connection = mock.MagicMock()
+        self.connection.login = "client_id"
+        self.connection.password = "client_secret"
+        self.connection.schema = "firebolt"
+        self.connection.host = "test"
+        self.connection.extra_dejson = {"result_cache_dir": self.cache_dir}
+
+        self.db_hook = self._make_hook(result_cache_ttl=60)
+        patcher = patch("firebolt_provider.hooks.firebolt.connect")
+        self.cursor = patcher.start().return_value.cursor.return_value
+        self.cursor.rowcount = -1
+        self.cursor.fetchall.return_value = [(1,)]
+        self.addCleanup(patcher.stop)
+
+    def _make_hook(self, **kwargs):
+        hook = FireboltHook(**kwargs)
+        hook.get_connection = mock.Mock(return_value=self.connection)
+        return hook
+
+    def test_read_only_results_are_cached(self):
+        assert self.db_hook.get_records("SELECT * FROM t") == [(1,)]
+        assert self.db_hook.get_records("SELECT * FROM t;") == [(1,)]
+        self.cursor.execute.assert_called_once()
+
+        self.db_hook.get_records("SELECT * FROM t", parameters=[1])
+        assert self.cursor.execute.call_count == 2
+
+    def test_cache_is_opt_in(self):
+        self.connection.extra_dejson["result_cache_ttl"] = "60"
+        hook = self._make_hook()
+
+        with patch.object(
+            hook, "_get_conn_params", wraps=hook._get_conn_params
+        ) as get_conn_params:
+            hook.get_records("SELECT * FROM t")
+            hook.get_records("SELECT * FROM t")
+        assert self.cursor.execute.call_count == 2
+        # Without a cache the connection is looked up by the run only
+        assert get_conn_params.call_count == 2
+
+    def test_metadata_queries_are_not_cached(self):
+        for _ in range(2):
+            self.db_hook.get_records("SELECT table_name FROM information_schema.tables")
+            self.db_hook.get_records("SHOW TABLES")
+        assert self.cursor.execute.call_count == 4
+
+    def test_cache_is_per_client(self):
+        self.db_hook.get_records("SELECT * FROM t")
+        self.connection.login = "other_client_id"
+        self._make_hook(result_cache_ttl=60).get_records("SELECT * FROM t")
+        assert self.cursor.execute.call_count == 2
+
+    def test_writes_are_not_cached(self):
+        self.db_hook.get_records("INSERT INTO t SELECT 1")
+        self.db_hook.get_records("INSERT INTO t SELECT 1")
+        assert self.cursor.execute.call_count == 2
+
+    def test_writes_invalidate_cached_results(self):
+        self.db_hook.get_records("SELECT * FROM t")
+        self.db_hook.run("INSERT INTO t VALUES (2)")
+        self.db_hook.get_records("SELECT * FROM t")
+        assert self.cursor.execute.call_count == 3
+
+        assert self.db_hook.invalidate_cached_results("t") == 1
+
+
+class TestFireboltHookSchemaCache(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.connection = mock.MagicMock()
+        self.connection.login = "client_id"
+        self.connection.password = "client_secret"
+        self.connection.schema = "firebolt"
+        self.connection.host = "test"
+        self.connection.extra_dejson = {}
+
+        self.db_hook = FireboltHook()
+        self.db_hook.get_connection = mock.Mock(return_value=self.connection)
+        patcher = patch("firebolt_provider.hooks.firebolt.connect")
+        self.cursor = patcher.start().return_value.cursor.return_value
+        self.cursor.rowcount = -1
+        self.cursor.fetchall.return_value = [
+            ("orders", "id", "INTEGER", "NO", "YES"),
+            ("orders", "name", "TEXT", "YES", "NO"),
+        ]
+        self.addCleanup(patcher.stop)
+        caches_patcher = patch.dict(
+            "firebolt_provider.utils.schema._caches", {}, clear=True
+        )
+        caches_patcher.start()
+        self.addCleanup(caches_patcher.stop)
+
+    def test_schemas_are_loaded_once(self):
+        orders = self.db_hook.get_table_schema("Orders")
+        assert [column.name for column in orders] == ["id", "name"]
+        assert orders[0].primary_index and not orders[0].nullable
+        assert self.db_hook.get_table_schema("orders") == orders
+        assert self.cursor.execute.call_count == 1
+
+    def test_ddl_invalidates_schemas(self):
+        self.db_hook.get_table_schema("orders")
+        self.db_hook.run("INSERT INTO orders VALUES (1, 'a')")
+        self.db_hook.get_table_schema("orders")
+        assert self.cursor.execute.call_count == 2
+
+        self.db_hook.run("ALTER TABLE orders ADD COLUMN price REAL")
+        self.db_hook.get_table_schema("orders")
+        assert self.cursor.execute.call_count == 4
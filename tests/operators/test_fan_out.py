@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock
+
+import pytest
+from airflow.exceptions import AirflowException
+
+from firebolt_provider.operators.firebolt import FireboltFanOutOperator
+
+
+@pytest.fixture
+def hook(hook: MagicMock) -> MagicMock:
+    def get_conn_to(database, engine_name, conn_config):
+        if database == "broken":
+            raise RuntimeError("no such database")
+        conn = MagicMock()
+        conn.cursor.return_value.rowcount = 2
+        return conn
+
+    hook.get_conn_to.side_effect = get_conn_to
+    return hook
+
+
+def test_fan_out(hook: MagicMock):
+    hook.get_records.return_value = [("db_3", "engine_3")]
+
+    results = FireboltFanOutOperator(
+        task_id="task_id",
+        sql=["DELETE FROM {database}_events", "VACUUM {database}_events"],
+        targets=["db_1", {"database": "db_2", "engine_name": "engine_2"}],
+        discovery_sql="SELECT database_name, engine_name FROM tenants",
+    ).execute({})
+
+    hook.get_records.assert_called_once_with(
+        "SELECT database_name, engine_name FROM tenants"
+    )
+    conn_config = hook._get_conn_params.return_value
+    hook.get_conn_to.assert_any_call("db_1", None, conn_config)
+    hook.get_conn_to.assert_any_call("db_2", "engine_2", conn_config)
+    hook.get_conn_to.assert_any_call("db_3", "engine_3", conn_config)
+    assert results == [
+        {"database": "db_1", "engine_name": None, "rowcount": 4, "error": None},
+        {"database": "db_2", "engine_name": "engine_2", "rowcount": 4, "error": None},
+        {"database": "db_3", "engine_name": "engine_3", "rowcount": 4, "error": None},
+    ]
+
+
+@pytest.mark.parametrize("max_failures, fails", [(0, True), (1, False), (None, False)])
+def test_fan_out_failure_tolerance(hook: MagicMock, max_failures, fails):
+    operator = FireboltFanOutOperator(
+        task_id="task_id",
+        sql="SELECT 1",
+        targets=["db_1", "broken"],
+        max_failures=max_failures,
+    )
+
+    if fails:
+        with pytest.raises(AirflowException, match="broken/None: no such database"):
+            operator.execute({})
+    else:
+        results = operator.execute({})
+        assert results[1]["error"] == "no such database"
+
+
+def test_fan_out_requires_targets():
+    with pytest.raises(ValueError):
+        FireboltFanOutOperator(task_id="task_id", sql="SELECT 1")
@@ -20,8 +20,10 @@ import unittest
 from unittest import mock
 
 import pytest
+from airflow.exceptions import AirflowException
 
 from firebolt_provider.operators.firebolt import FireboltOperator
+from firebolt_provider.utils.sql_log import decompress
 
 
 class TestFireboltOperator(unittest.TestCase):
@@ -41,6 +43,123 @@ class TestFireboltOperator(unittest.TestCase):
             sql=sql, autocommit=autocommit, parameters=parameters
         )
 
+    @mock.patch("firebolt_provider.operators.firebolt.FireboltHook")
+    def test_execute_keeps_long_sql_in_xcom(self, mock_hook):
+        sql = ["INSERT INTO t VALUES (1)"] * 100
+        ti = mock.MagicMock()
+
+        FireboltOperator(task_id="test_task_id", sql=sql).execute({"ti": ti})
+
+        ti.xcom_push.assert_called_once_with(key="firebolt_sql", value=mock.ANY)
+        artifact = ti.xcom_push.call_args[1]["value"]
+        assert decompress(artifact) == "\n;\n".join(sql)
+
+    @mock.patch("firebolt_provider.operators.firebolt.FireboltHook")
+    def test_execute_statement_batch_size(self, mock_hook):
+        operator = FireboltOperator(
+            task_id="test_task_id",
+            sql=["INSERT INTO t VALUES (1)", "INSERT INTO t VALUES (2)"],
+            statement_batch_size=10,
+        )
+        operator.execute({})
+        mock_hook.return_value.run_script.assert_called_once_with(
+            "INSERT INTO t VALUES (1)\n;\nINSERT INTO t VALUES (2)",
+            parameters=None,
+            batch_size=10,
+        )
+        mock_hook.return_value.run.assert_not_called()
+
+    @mock.patch("firebolt_provider.operators.firebolt.FireboltHook")
+    def test_execute_parameters_batch(self, mock_hook):
+        mock_hook.return_value.run_many.return_value = 2
+        operator = FireboltOperator(
+            task_id="test_task_id",
+            sql="INSERT INTO t VALUES (?)",
+            parameters_batch=[[1], [2]],
+            parameters_batch_size=100,
+        )
+        assert operator.execute({}) == 2
+        mock_hook.return_value.run_many.assert_called_once_with(
+            "INSERT INTO t VALUES (?)", [[1], [2]], batch_size=100
+        )
+        mock_hook.return_value.run.assert_not_called()
+
+        operator.sql = ["INSERT INTO t VALUES (?)"]
+        with pytest.raises(AirflowException, match="requires a single statement"):
+            operator.execute({})
+
+    @mock.patch("firebolt_provider.operators.firebolt.FireboltHook")
+    def test_execute_profile(self, mock_hook):
+        hook = mock_hook.return_value
+        hook.split_sql_string.return_value = [
+            "CREATE TABLE t (id INT);",
+            "INSERT INTO t SELECT 1;",
+            "INSERT INTO t VALUES (1);",
+            "SELECT * FROM t;",
+        ]
+        hook.explain.return_value = {
+            "statement": "SELECT * FROM t;",
+            "operators": [{"id": 0, "name": "StoredTable", "table": "t"}],
+        }
+        ti = mock.MagicMock()
+        operator = FireboltOperator(
+            task_id="test_task_id",
+            sql="CREATE TABLE t (id INT); INSERT INTO t SELECT 1; SELECT * FROM t;",
+            profile=True,
+            profile_analyze=True,
+        )
+        operator.execute({"ti": ti})
+
+        hook.explain.assert_has_calls(
+            [
+                mock.call("SELECT 1;", parameters=None, analyze=True),
+                mock.call("INSERT INTO t VALUES (1);", parameters=None, analyze=False),
+                mock.call("SELECT * FROM t;", parameters=None, analyze=True),
+            ]
+        )
+        ti.xcom_push.assert_called_once_with(
+            key="firebolt_profile", value=[hook.explain.return_value] * 3
+        )
+        hook.run.assert_called_once()
+
+    @mock.patch("firebolt_provider.operators.firebolt.FireboltHook")
+    def test_execute_profile_max_scan_rows(self, mock_hook):
+        hook = mock_hook.return_value
+        hook.explain.return_value = {
+            "statement": "SELECT * FROM t",
+            "operators": [
+                {"id": 0, "name": "StoredTable", "table": "t", "output_rows": 1001}
+            ],
+        }
+        operator = FireboltOperator(
+            task_id="test_task_id",
+            sql=["SELECT * FROM t"],
+            profile=True,
+            profile_analyze=True,
+            max_scan_rows=1000,
+        )
+        with pytest.raises(AirflowException, match="Scan of t reads 1001 rows"):
+            operator.execute({"ti": mock.MagicMock()})
+        hook.run.assert_not_called()
+
+    def test_profile_rejects_parameters_batch(self):
+        with pytest.raises(ValueError, match="parameters_batch"):
+            FireboltOperator(
+                task_id="test_task_id",
+                sql="INSERT INTO t VALUES (?)",
+                profile=True,
+                parameters_batch=[(1,), (2,)],
+            )
+
+    def test_max_scan_rows_requires_profile_analyze(self):
+        with pytest.raises(ValueError, match="max_scan_rows requires"):
+            FireboltOperator(
+                task_id="test_task_id",
+                sql="SELECT * FROM t",
+                profile=True,
+                max_scan_rows=1000,
+            )
+
 
 class TestGetDBHook:
     @mock.patch("firebolt_provider.operators.firebolt.FireboltHook")
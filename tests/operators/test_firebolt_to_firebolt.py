@@ -0,0 +1,217 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from unittest.mock import ANY, MagicMock, call
+
+import pytest
+from airflow.exceptions import AirflowException
+from pytest_mock import MockerFixture
+
+from firebolt_provider.hooks.firebolt import FireboltHook
+from firebolt_provider.operators.firebolt import FireboltToFireboltOperator
+from firebolt_provider.utils.schema import Column
+
+CONFIG = FireboltHook.ConnectionParameters(
+    client_id="id",
+    client_secret="secret",
+    api_endpoint="api.app.firebolt.io",
+    database="prod",
+    engine_name="engine",
+    account_name="account",
+)
+
+
+@pytest.fixture
+def hook(mocker: MockerFixture) -> MagicMock:
+    hook = mocker.patch(
+        "firebolt_provider.operators.firebolt.FireboltHook"
+    ).return_value
+    hook._get_conn_params.return_value = CONFIG
+    hook.get_table_schema.return_value = [
+        Column("id", "INTEGER", False, True),
+        Column("name", "TEXT", True, False),
+    ]
+    return hook
+
+
+def test_copy_server_side(hook: MagicMock):
+    hook._get_conn_params.side_effect = [
+        CONFIG,
+        CONFIG._replace(database="analytics"),
+        CONFIG,
+        CONFIG._replace(database="analytics"),
+    ]
+    hook.run.side_effect = [None, 5]
+    hook.get_first.return_value = (5, 123)
+
+    result = FireboltToFireboltOperator(
+        task_id="task_id", source_table="events", target_database="analytics"
+    ).execute({})
+
+    assert result == {"mode": "server_side", "rows": 5}
+    assert hook.run.call_args_list == [
+        call("TRUNCATE TABLE events"),
+        call(
+            "INSERT INTO events (id, name) SELECT id, name FROM prod.public.events",
+            parameters=None,
+            handler=ANY,
+        ),
+    ]
+    hook.get_first.assert_called_with(
+        "SELECT COUNT(*), SUM(CITY_HASH(id, name) % 1000000007) FROM events",
+        parameters=None,
+    )
+
+
+def test_copy_streamed_incremental(hook: MagicMock):
+    hook.get_first.side_effect = [(100,), (40,), (41, 100), (60, 7), (60, 7)]
+    cursor = hook.get_conn.return_value.cursor.return_value
+    cursor.fetchmany.side_effect = [[(41, "a")], [], [(71, "b")], []]
+    hook.run_many.return_value = 30
+
+    result = FireboltToFireboltOperator(
+        task_id="task_id",
+        source_table="events",
+        target_conn_id="analytics",
+        incremental_column="id",
+        partitions=2,
+        server_side=False,
+    ).execute({})
+
+    assert result == {"mode": "streamed", "rows": 60}
+    hook.run.assert_not_called()
+    cursor.execute.assert_not_called()
+    selects = sorted(args[0] for args, _ in cursor.execute_stream.call_args_list)
+    assert (
+        selects
+        == [
+            "SELECT id, name FROM events "
+            "WHERE id > ? AND id <= ? AND id >= ? AND id < ?"
+        ]
+        * 2
+    )
+    assert sorted(args[1] for args, _ in cursor.execute_stream.call_args_list) == [
+        [40, 100, 41, 71],
+        [40, 100, 71, 101],
+    ]
+    hook.run_many.assert_called_with(
+        "INSERT INTO events (id, name) VALUES (?, ?)", ANY, 10000
+    )
+
+
+def test_copy_streamed_incremental_failure_is_retried(hook: MagicMock):
+    cursor = hook.get_conn.return_value.cursor.return_value
+    cursor.fetchmany.return_value = []
+    operator = FireboltToFireboltOperator(
+        task_id="task_id",
+        source_table="events",
+        incremental_column="id",
+        partitions=2,
+        server_side=False,
+        verify=False,
+    )
+
+    hook.get_first.side_effect = [(100,), (40,), (41, 100)]
+    hook.run_many.side_effect = [30, RuntimeError("connection reset")]
+    with pytest.raises(RuntimeError):
+        operator.execute({})
+    hook.run.assert_called_once_with(
+        "DELETE FROM events WHERE id > ? AND id <= ?", parameters=[40, 100]
+    )
+
+    # The retry starts after the same target maximum and copies every range
+    hook.get_first.side_effect = [(100,), (40,), (41, 100)]
+    hook.run_many.side_effect = None
+    hook.run_many.return_value = 30
+    cursor.execute_stream.reset_mock()
+    assert operator.execute({}) == {"mode": "streamed", "rows": 60}
+    assert sorted(args[1] for args, _ in cursor.execute_stream.call_args_list) == [
+        [40, 100, 41, 71],
+        [40, 100, 71, 101],
+    ]
+
+
+def test_copy_streamed_nullable_partition_column(hook: MagicMock):
+    hook.get_table_schema.return_value = [
+        Column("id", "INTEGER", False, True),
+        Column("user_id", "INTEGER", True, False),
+    ]
+    hook.get_first.return_value = (1, 4)
+    cursor = hook.get_conn.return_value.cursor.return_value
+    cursor.fetchmany.return_value = []
+    hook.run_many.return_value = 1
+
+    result = FireboltToFireboltOperator(
+        task_id="task_id",
+        source_table="events",
+        partition_column="user_id",
+        partitions=2,
+        server_side=False,
+        verify=False,
+    ).execute({})
+
+    assert result == {"mode": "streamed", "rows": 3}
+    assert sorted(call.args for call in cursor.execute_stream.call_args_list) == [
+        ("SELECT id, user_id FROM events WHERE user_id >= ? AND user_id < ?", [1, 3]),
+        ("SELECT id, user_id FROM events WHERE user_id >= ? AND user_id < ?", [3, 5]),
+        ("SELECT id, user_id FROM events WHERE user_id IS NULL", None),
+    ]
+
+
+def test_copy_watermark_replaces_target_rows(hook: MagicMock):
+    hook.get_first.side_effect = [(100,), (10, 1), (10, 1)]
+
+    FireboltToFireboltOperator(
+        task_id="task_id",
+        source_table="events",
+        columns=["id"],
+        incremental_column="updated_at",
+        watermark="2024-01-01",
+        partitions=1,
+        server_side=False,
+        verify=True,
+    ).execute({})
+
+    hook.run.assert_called_once_with(
+        "DELETE FROM events WHERE updated_at > ?", parameters=["2024-01-01"]
+    )
+    cursor = hook.get_conn.return_value.cursor.return_value
+    cursor.execute_stream.assert_called_once_with(
+        "SELECT id FROM events WHERE updated_at > ? AND updated_at <= ?",
+        ["2024-01-01", 100],
+    )
+
+
+def test_copy_verification_failure(hook: MagicMock):
+    hook.get_first.side_effect = [(5, 123), (4, 120)]
+
+    with pytest.raises(AirflowException, match="doesn't match"):
+        FireboltToFireboltOperator(
+            task_id="task_id", source_table="events", target_table="events_copy"
+        ).execute({})
+
+
+def test_server_side_detection_with_engine_pool(hook: MagicMock):
+    pool = CONFIG._replace(engine_name=None, engine_pool=["a", "b"])
+    operator = FireboltToFireboltOperator(task_id="task_id", source_table="events")
+
+    hook._get_conn_params.side_effect = [pool, pool]
+    assert operator._is_server_side(hook, hook)
+    hook._get_conn_params.side_effect = [pool, CONFIG]
+    assert not operator._is_server_side(hook, hook)
@@ -0,0 +1,174 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from airflow.utils import timezone
+from pytest_mock import MockerFixture
+
+from firebolt_provider.operators.firebolt import FireboltEnginePrewarmOperator
+
+
+@pytest.fixture
+def operator() -> FireboltEnginePrewarmOperator:
+    return FireboltEnginePrewarmOperator(
+        task_id="task_id",
+        engine_name="engine",
+        dag_ids=["etl"],
+        lead_time=timedelta(minutes=10),
+        idle_timeout=timedelta(minutes=30),
+    )
+
+
+def _context(prediction=None):
+    ti = MagicMock()
+    ti.xcom_pull.return_value = prediction
+    return {"ti": ti, "dag": MagicMock(dag_id="prewarm")}
+
+
+def test_starts_engine_ahead_of_run(
+    mocker: MockerFixture, hook: MagicMock, operator: FireboltEnginePrewarmOperator
+):
+    run_after = timezone.utcnow() + timedelta(minutes=5)
+    mocker.patch.object(
+        operator, "_schedule", return_value=({"etl": run_after}, 0, None)
+    )
+    hook.get_engine_status.return_value = "STOPPED"
+    context = _context()
+
+    assert operator.execute(context) == "STARTED"
+
+    hook.engine_action.assert_called_once_with("engine", "start")
+    value = context["ti"].xcom_push.call_args.kwargs["value"]
+    assert value["dag_id"] == "etl"
+    assert value["expected_at"] == run_after.isoformat()
+
+
+def test_does_not_start_before_lead_time(
+    mocker: MockerFixture, hook: MagicMock, operator: FireboltEnginePrewarmOperator
+):
+    run_after = timezone.utcnow() + timedelta(hours=1)
+    mocker.patch.object(
+        operator, "_schedule", return_value=({"etl": run_after}, 0, None)
+    )
+    hook.get_engine_status.return_value = "STOPPED"
+
+    assert operator.execute(_context()) == "STOPPED"
+    hook.engine_action.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "running_runs, idle_for, stops",
+    [(0, timedelta(hours=1), True), (1, timedelta(hours=1), False), (0, None, False)],
+)
+def test_stops_idle_engine(
+    mocker: MockerFixture,
+    hook: MagicMock,
+    operator: FireboltEnginePrewarmOperator,
+    running_runs,
+    idle_for,
+    stops,
+):
+    now = timezone.utcnow()
+    last_end = now - idle_for if idle_for else now - timedelta(minutes=1)
+    schedule = ({"etl": now + timedelta(hours=1)}, running_runs, last_end)
+    mocker.patch.object(operator, "_schedule", return_value=schedule)
+    hook.get_engine_status.return_value = "RUNNING"
+
+    operator.execute(_context())
+
+    if stops:
+        hook.engine_action.assert_called_once_with("engine", "stop")
+    else:
+        hook.engine_action.assert_not_called()
+
+
+def test_reports_prediction_accuracy(
+    mocker: MockerFixture, hook: MagicMock, operator: FireboltEnginePrewarmOperator
+):
+    now = timezone.utcnow()
+    mocker.patch.object(operator, "_schedule", return_value=({}, 1, None))
+    run_start = mocker.patch.object(operator, "_first_run_start")
+    timing = mocker.patch("firebolt_provider.operators.firebolt.Stats.timing")
+    hook.get_engine_status.return_value = "RUNNING"
+    prediction = {
+        "dag_id": "etl",
+        "expected_at": (now - timedelta(minutes=2)).isoformat(),
+        "started_at": (now - timedelta(minutes=12)).isoformat(),
+    }
+
+    # The run hasn't started yet, the prediction is kept
+    run_start.return_value = None
+    context = _context(prediction)
+    operator.execute(context)
+    context["ti"].xcom_push.assert_called_once_with(
+        key="firebolt_prewarm", value=prediction
+    )
+    timing.assert_not_called()
+
+    run_start.return_value = now
+    context = _context(prediction)
+    operator.execute(context)
+    evaluated = {**prediction, "evaluated": True}
+    context["ti"].xcom_push.assert_called_once_with(
+        key="firebolt_prewarm", value=evaluated
+    )
+    timing.assert_any_call("firebolt.engine.prewarm_error", timedelta(minutes=2))
+    timing.assert_any_call("firebolt.engine.prewarm_lead", timedelta(minutes=12))
+
+    # Later runs don't report the same prediction again
+    timing.reset_mock()
+    context = _context(evaluated)
+    operator.execute(context)
+    context["ti"].xcom_push.assert_not_called()
+    timing.assert_not_called()
+
+
+def test_reuses_discovered_dags(mocker: MockerFixture, hook: MagicMock):
+    now = timezone.utcnow()
+    find_dag_ids = mocker.patch.object(
+        FireboltEnginePrewarmOperator, "_find_dag_ids", return_value=["etl"]
+    )
+    schedule = mocker.patch.object(
+        FireboltEnginePrewarmOperator, "_schedule", return_value=({}, 1, None)
+    )
+    operator = FireboltEnginePrewarmOperator(task_id="task_id", engine_name="engine")
+
+    def run(discovered):
+        context = _context()
+        context["ti"].xcom_pull.side_effect = lambda key, **kwargs: (
+            discovered if key == "firebolt_prewarm_dag_ids" else None
+        )
+        operator.execute(context)
+        return context["ti"]
+
+    ti = run(None)
+    find_dag_ids.assert_called_once_with("engine", "prewarm")
+    pushed = ti.xcom_push.call_args.kwargs["value"]
+    assert pushed["dag_ids"] == ["etl"]
+
+    run(pushed)
+    find_dag_ids.assert_called_once()
+    schedule.assert_called_with(["etl"])
+
+    stale = {**pushed, "discovered_at": (now - timedelta(hours=2)).isoformat()}
+    run(stale)
+    assert find_dag_ids.call_count == 2
@@ -0,0 +1,87 @@
+from datetime import datetime
+from unittest.mock import MagicMock, call
+
+import pytest
+from airflow.exceptions import AirflowException
+from airflow.utils import timezone
+from pytest_mock import MockerFixture
+
+from firebolt_provider.operators.firebolt import FireboltReplaceTableOperator
+
+
+@pytest.fixture
+def hook(hook: MagicMock, mocker: MockerFixture) -> MagicMock:
+    mocker.patch(
+        "firebolt_provider.operators.firebolt.uuid4"
+    ).return_value.hex = "abcdef0123"
+    mocker.patch(
+        "firebolt_provider.operators.firebolt.timezone.utcnow",
+        return_value=datetime(2024, 1, 2, 12, tzinfo=timezone.utc),
+    )
+    return hook
+
+
+def test_replace_table(hook: MagicMock):
+    hook.get_records.return_value = [
+        ("sales",),
+        ("sales__shadow_11111111",),
+        ("sales__shadow_20231231120000_22222222",),
+        ("sales__shadow_20240102110000_33333333",),
+        ("sales_archive",),
+    ]
+    hook.get_first.return_value = (True,)
+
+    FireboltReplaceTableOperator(
+        task_id="task_id",
+        table="sales",
+        create_table_sql="CREATE FACT TABLE {table} (id INT)",
+        insert_sql=["INSERT INTO {table} SELECT 1", "INSERT INTO {table} SELECT 2"],
+        validation_sql="SELECT COUNT(*) > 0 FROM {table}",
+    ).execute({})
+
+    run_calls = hook.run.call_args_list
+    # The shadow table created an hour ago may belong to a running reload
+    assert run_calls[:3] == [
+        call(sql="DROP TABLE IF EXISTS sales__shadow_11111111"),
+        call(sql="DROP TABLE IF EXISTS sales__shadow_20231231120000_22222222"),
+        call(sql="CREATE FACT TABLE sales__shadow_20240102120000_abcdef01 (id INT)"),
+    ]
+    # Slices are loaded in parallel, so their order is not deterministic
+    assert sorted(c.kwargs["sql"] for c in run_calls[3:5]) == [
+        "INSERT INTO sales__shadow_20240102120000_abcdef01 SELECT 1",
+        "INSERT INTO sales__shadow_20240102120000_abcdef01 SELECT 2",
+    ]
+    assert run_calls[5:] == [
+        call(
+            sql=[
+                "BEGIN TRANSACTION",
+                "ALTER TABLE sales RENAME TO sales__old_20240102120000_abcdef01",
+                "ALTER TABLE sales__shadow_20240102120000_abcdef01 RENAME TO sales",
+                "COMMIT",
+            ]
+        ),
+        call(sql="DROP TABLE IF EXISTS sales__old_20240102120000_abcdef01"),
+    ]
+    hook.get_first.assert_called_once_with(
+        "SELECT COUNT(*) > 0 FROM sales__shadow_20240102120000_abcdef01"
+    )
+
+
+def test_replace_table_validation_failure(hook: MagicMock):
+    hook.get_records.return_value = [("sales",)]
+    hook.get_first.return_value = (False,)
+
+    with pytest.raises(AirflowException):
+        FireboltReplaceTableOperator(
+            task_id="task_id",
+            table="sales",
+            create_table_sql="CREATE FACT TABLE {table} (id INT)",
+            insert_sql="INSERT INTO {table} SELECT 1",
+            validation_sql=["SELECT COUNT(*) > 0 FROM {table}"],
+        ).execute({})
+
+    hook.run.assert_called_with(
+        sql="DROP TABLE IF EXISTS sales__shadow_20240102120000_abcdef01"
+    )
+    for sql_call in hook.run.call_args_list:
+        assert "RENAME" not in str(sql_call)
@@ -0,0 +1,95 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from airflow.exceptions import AirflowException
+
+from firebolt_provider.operators.firebolt import FireboltTableCheckOperator
+
+COLUMN_CHECKS = {
+    "id": {"null_check": {"equal_to": 0}, "unique_check": {"equal_to": 0}},
+    "price": {"min": {"geq_to": 0}, "max": {"less_than": 100, "tolerance": 0.1}},
+}
+TABLE_CHECKS = {"row_count_check": {"check_statement": "COUNT(*) >= 10"}}
+
+
+def test_table_check_single_query(hook: MagicMock):
+    hook.get_first.return_value = (0, 0, 1, 105, 1)
+
+    results = FireboltTableCheckOperator(
+        task_id="task_id",
+        table="sales",
+        column_checks=COLUMN_CHECKS,
+        table_checks=TABLE_CHECKS,
+        partition_clause="day = '2021-01-01'",
+    ).execute({})
+
+    hook.get_first.assert_called_once_with(
+        "SELECT SUM(CASE WHEN id IS NULL THEN 1 ELSE 0 END), "
+        "COUNT(id) - COUNT(DISTINCT id), MIN(price), MAX(price), "
+        "CASE WHEN COUNT(*) >= 10 THEN 1 ELSE 0 END "
+        "FROM sales WHERE day = '2021-01-01'"
+    )
+    assert all(result["success"] for result in results.values())
+    assert results["price.max"] == {"result": 105, "success": True}
+
+
+def test_table_check_reports_every_failure(hook: MagicMock):
+    hook.get_first.return_value = (3, 0, -1, 50, 0)
+
+    with pytest.raises(AirflowException) as error:
+        FireboltTableCheckOperator(
+            task_id="task_id",
+            table="sales",
+            column_checks=COLUMN_CHECKS,
+            table_checks=TABLE_CHECKS,
+        ).execute({})
+
+    message = str(error.value)
+    assert "3 of 5 checks failed" in message
+    assert "id.null_check" in message
+    assert "price.min" in message
+    assert "row_count_check" in message
+
+
+def test_table_check_dates_and_decimals(hook: MagicMock):
+    hook.get_first.return_value = (date(2024, 3, 1), Decimal("95.5"), "b")
+
+    results = FireboltTableCheckOperator(
+        task_id="task_id",
+        table="sales",
+        column_checks={
+            "day": {"min": {"geq_to": date(2024, 1, 1), "tolerance": 0.1}},
+            "price": {"max": {"equal_to": 100, "tolerance": 0.05}},
+            "name": {"min": {"equal_to": "b"}},
+        },
+    ).execute({})
+
+    assert all(result["success"] for result in results.values())
+
+
+def test_table_check_incomparable_values(hook: MagicMock):
+    hook.get_first.return_value = (date(2024, 3, 1),)
+
+    with pytest.raises(AirflowException, match="day.min"):
+        FireboltTableCheckOperator(
+            task_id="task_id",
+            table="sales",
+            column_checks={"day": {"min": {"geq_to": "2024-01-01"}}},
+        ).execute({})
+
+
+@pytest.mark.parametrize(
+    "column_checks",
+    [
+        {"id": {"unknown_check": {"equal_to": 0}}},
+        {"id": {"null_check": {"equal_to": 0, "less_than": 1}}},
+        {"id": {"null_check": {"tolerance": 0.1}}},
+    ],
+)
+def test_table_check_invalid_config(column_checks):
+    with pytest.raises(ValueError):
+        FireboltTableCheckOperator(
+            task_id="task_id", table="sales", column_checks=column_checks
+        )
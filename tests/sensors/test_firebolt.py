@@ -0,0 +1,133 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from unittest.mock import MagicMock
+
+import pytest
+from airflow.exceptions import AirflowException, TaskDeferred
+from pytest_mock import MockerFixture
+
+from firebolt_provider.sensors import firebolt as sensors
+from firebolt_provider.sensors.firebolt import FireboltSqlSensor
+from firebolt_provider.triggers.firebolt import FireboltSqlTrigger
+
+
+@pytest.fixture
+def conn(mocker: MockerFixture) -> MagicMock:
+    hook = mocker.patch("firebolt_provider.sensors.firebolt.FireboltHook")
+    conn = hook.return_value.get_conn.return_value
+    conn.closed = False
+    return conn
+
+
+def test_pokes_share_connection(conn: MagicMock, mocker: MockerFixture):
+    mocker.patch("time.sleep")
+    cursor = conn.cursor.return_value
+    cursor.fetchone.side_effect = [(0,), (0,), (1,)]
+
+    FireboltSqlSensor(
+        task_id="task_id",
+        sql="SELECT COUNT(*) > 0 FROM events WHERE day = ?",
+        parameters=["2024-01-01"],
+        poke_interval=1,
+    ).execute({})
+
+    assert cursor.execute.call_count == 3
+    assert sensors.FireboltHook.return_value.get_conn.call_count == 1
+    cursor.execute.assert_called_with(
+        "SELECT COUNT(*) > 0 FROM events WHERE day = ?",
+        ["2024-01-01"],
+        timeout_seconds=None,
+    )
+    conn.close.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "record, passes",
+    [
+        (None, False),
+        ((50, "2024-01-02 00:00:00"), False),
+        ((100, "2024-01-01 00:00:00"), False),
+        ((100, "2024-01-02 00:00:00"), True),
+    ],
+)
+def test_poke_table_metadata(conn: MagicMock, record, passes):
+    cursor = conn.cursor.return_value
+    cursor.fetchone.return_value = record
+    sensor = FireboltSqlSensor(
+        task_id="task_id",
+        table="events",
+        min_rows=100,
+        modified_after="2024-01-01T12:00:00+00:00",
+    )
+
+    assert sensor.poke({}) is passes
+    cursor.execute.assert_called_once_with(
+        "SELECT number_of_rows, last_altered FROM information_schema.tables "
+        "WHERE table_name = ?",
+        ["events"],
+        timeout_seconds=None,
+    )
+
+
+def test_failed_poke_reconnects(conn: MagicMock):
+    cursor = conn.cursor.return_value
+    cursor.execute.side_effect = [RuntimeError("connection reset"), None]
+    cursor.fetchone.return_value = (1,)
+    sensor = FireboltSqlSensor(task_id="task_id", sql="SELECT 1")
+
+    with pytest.raises(RuntimeError):
+        sensor.poke({})
+    conn.close.assert_called_once()
+    assert sensor.poke({}) is True
+
+
+def test_deferrable(conn: MagicMock):
+    conn.cursor.return_value.fetchone.return_value = (0,)
+    sensor = FireboltSqlSensor(
+        task_id="task_id",
+        sql="SELECT 1",
+        deferrable=True,
+        poke_interval=10,
+        max_wait=300,
+        query_timeout=30,
+    )
+
+    with pytest.raises(TaskDeferred) as deferred:
+        sensor.execute({})
+
+    trigger = deferred.value.trigger
+    assert isinstance(trigger, FireboltSqlTrigger)
+    assert trigger.poke_interval == 10
+    assert trigger.max_interval == 300
+    assert trigger.query_timeout == 30
+    assert deferred.value.method_name == "execute_complete"
+    conn.close.assert_called_once()
+
+    sensor.execute_complete({}, {"status": "success", "message": "[1]"})
+    with pytest.raises(AirflowException, match="timeout"):
+        sensor.execute_complete({}, {"status": "error", "message": "timeout"})
+
+
+def test_deferrable_requires_airflow_2_2(mocker: MockerFixture):
+    mocker.patch.object(sensors, "airflow_version", "2.1.4")
+
+    with pytest.raises(ValueError, match="Airflow 2.2"):
+        FireboltSqlSensor(task_id="task_id", sql="SELECT 1", deferrable=True)
+    FireboltSqlSensor(task_id="task_id", sql="SELECT 1")
@@ -0,0 +1,62 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import asyncio
+from unittest import mock
+
+from pytest_mock import MockerFixture
+
+from firebolt_provider.triggers.firebolt import FireboltSqlTrigger
+
+
+async def _collect(trigger: FireboltSqlTrigger) -> list:
+    return [event async for event in trigger.run()]
+
+
+def test_serialize():
+    trigger = FireboltSqlTrigger(sql="SELECT 1", poke_interval=5, query_timeout=30)
+    path, kwargs = trigger.serialize()
+    assert path == "firebolt_provider.triggers.firebolt.FireboltSqlTrigger"
+    assert FireboltSqlTrigger(**kwargs).serialize() == (path, kwargs)
+
+
+def test_run_backs_off_until_check_passes(mocker: MockerFixture):
+    hook = mocker.patch("firebolt_provider.triggers.firebolt.FireboltAsyncHook")
+    hook = hook.return_value.__aenter__.return_value
+    hook.get_first = mock.AsyncMock(side_effect=[[0], [0], [0], [1]])
+    sleep = mocker.patch(
+        "firebolt_provider.triggers.firebolt.asyncio.sleep", new=mock.AsyncMock()
+    )
+
+    trigger = FireboltSqlTrigger(sql="SELECT 1", poke_interval=10, max_interval=30)
+    events = asyncio.run(_collect(trigger))
+
+    assert [event.payload["status"] for event in events] == ["success"]
+    assert [call.args[0] for call in sleep.await_args_list] == [10, 20, 30]
+
+
+def test_run_reports_errors(mocker: MockerFixture):
+    hook = mocker.patch("firebolt_provider.triggers.firebolt.FireboltAsyncHook")
+    hook = hook.return_value.__aenter__.return_value
+    hook.get_first = mock.AsyncMock(side_effect=RuntimeError("no engine"))
+
+    events = asyncio.run(_collect(FireboltSqlTrigger(table="events", min_rows=1)))
+
+    assert events[0].payload == {"status": "error", "message": "no engine"}
+    hook.get_first.assert_awaited_once_with(mock.ANY, ["events"])
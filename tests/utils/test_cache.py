@@ -0,0 +1,106 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import os
+import stat
+import time
+
+from firebolt_provider.utils.cache import QueryResultCache
+
+
+def test_cache_hit_and_miss(tmp_path):
+    cache = QueryResultCache(60, str(tmp_path))
+    key = cache.make_key("SELECT * FROM t;\n", None, "db")
+
+    assert cache.get(key) == (False, None)
+    cache.set(key, [(1, "a")], ["t"])
+
+    assert cache.get(cache.make_key("SELECT * FROM t", None, "db")) == (
+        True,
+        [(1, "a")],
+    )
+    assert cache.hit_rate == 0.5
+
+
+def test_cache_key_keeps_literal_whitespace():
+    assert QueryResultCache.make_key(
+        "SELECT * FROM t WHERE name = 'a  b'"
+    ) != QueryResultCache.make_key("SELECT * FROM t WHERE name = 'a b'")
+
+
+def test_cache_ttl(tmp_path):
+    cache = QueryResultCache(0.01, str(tmp_path))
+    cache.set("key", [1], [])
+    time.sleep(0.02)
+
+    assert cache.get("key") == (False, None)
+    assert os.listdir(tmp_path) == []
+
+
+def test_cache_lru_eviction(tmp_path):
+    cache = QueryResultCache(60, str(tmp_path), max_entries=2)
+    cache.set("a", 1, [])
+    cache.set("b", 2, [])
+    past = time.time() - 10
+    os.utime(tmp_path / "b.pickle", (past, past))
+    cache.get("a")
+    cache.set("c", 3, [])
+
+    assert cache.get("a") == (True, 1)
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, 3)
+
+
+def test_cache_invalidate_table(tmp_path):
+    cache = QueryResultCache(60, str(tmp_path))
+    cache.set("a", 1, ["orders", "customers"])
+    cache.set("b", 2, ["customers"])
+    cache.set("c", 3, ["items"])
+
+    assert cache.invalidate_table("Customers") == 2
+    assert cache.get("a")[0] is False
+    assert cache.get("b")[0] is False
+    assert cache.get("c")[0] is True
+
+
+def test_cache_invalidate_quoted_table(tmp_path):
+    cache = QueryResultCache(60, str(tmp_path))
+    cache.set("a", 1, ["Foo"])
+
+    assert cache.invalidate_table("Foo") == 1
+    cache.set("a", 1, ["Foo"])
+    assert cache.invalidate_table('"Foo"') == 1
+
+
+def test_cache_directory_is_private(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir(mode=0o777)
+    directory.chmod(0o777)
+
+    QueryResultCache(60, str(directory))
+
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+
+def test_cache_ignores_foreign_entries(tmp_path):
+    cache = QueryResultCache(60, str(tmp_path))
+    cache.set("a", 1, [])
+    (tmp_path / "a.pickle").chmod(0o666)
+
+    assert cache.get("a") == (False, None)
@@ -0,0 +1,82 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import os
+import threading
+import time
+
+from firebolt_provider.utils.concurrency import EngineSlotLimiter
+
+
+def test_slots_are_limited(tmp_path):
+    limiter = EngineSlotLimiter("engine", 2, lock_dir=str(tmp_path), poll_interval=0.01)
+    active, peak = [], []
+    lock = threading.Lock()
+
+    def work():
+        with limiter.slot():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+    assert os.listdir(tmp_path / "engine") == []
+
+
+def test_slots_are_granted_in_order(tmp_path):
+    limiter = EngineSlotLimiter("engine", 1, lock_dir=str(tmp_path), poll_interval=0.01)
+    order = []
+
+    def work(index):
+        with limiter.slot():
+            order.append(index)
+
+    with limiter.slot():
+        threads = []
+        for index in range(3):
+            threads.append(threading.Thread(target=work, args=(index,)))
+            threads[-1].start()
+            # Make sure tickets are created in order
+            time.sleep(0.02)
+    for thread in threads:
+        thread.join()
+
+    assert order == [0, 1, 2]
+
+
+def test_expired_lease_is_released(tmp_path):
+    limiter = EngineSlotLimiter(
+        "engine", 1, lock_dir=str(tmp_path), lease_seconds=5, poll_interval=0.01
+    )
+    os.makedirs(tmp_path / "engine")
+    stale = tmp_path / "engine" / "0-dead.lease"
+    stale.touch()
+    os.utime(stale, (time.time() - 60, time.time() - 60))
+
+    with limiter.slot():
+        assert not stale.exists()
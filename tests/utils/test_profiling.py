@@ -0,0 +1,54 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from firebolt_provider.utils.profiling import format_timings, parse_plan
+
+PLAN = """[0] [Projection] l_orderkey
+ \\_[1] [Aggregate] GroupBy: [l_orderkey] Aggregates: [count_0: count(*)]
+ |   [Execution Metrics]: output cardinality = 10, thread time = 12ms, cpu time = 7ms
+  \\_[2] [StoredTable] Name: "lineitem", used 1/16 column(s) FACT
+ [Execution Metrics]: output cardinality = 6001215, thread time = 150ms, cpu time = 98ms
+"""
+
+
+def test_parse_plan():
+    assert parse_plan(PLAN) == [
+        {"id": 0, "name": "Projection"},
+        {
+            "id": 1,
+            "name": "Aggregate",
+            "output_rows": 10,
+            "thread_time_ms": 12.0,
+            "cpu_time_ms": 7.0,
+        },
+        {
+            "id": 2,
+            "name": "StoredTable",
+            "table": "lineitem",
+            "output_rows": 6001215,
+            "thread_time_ms": 150.0,
+            "cpu_time_ms": 98.0,
+        },
+    ]
+
+
+def test_format_timings():
+    table = format_timings(parse_plan(PLAN)).splitlines()
+    assert len(table) == 4
+    assert table[3].split() == ["2", "StoredTable", "6001215", "150.0", "98.0"]
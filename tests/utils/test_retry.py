@@ -0,0 +1,63 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import httpx
+import pytest
+from firebolt.utils.exception import (
+    ConnectionClosedError,
+    ConnectionError,
+    EngineNotRunningError,
+    OperationalError,
+    ProgrammingError,
+    QueryTimeoutError,
+)
+
+from firebolt_provider.utils.retry import backoff_delay, is_transient
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://engine.firebolt.io")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    [
+        (httpx.ConnectError("connection reset"), True),
+        (httpx.ReadTimeout("timed out"), True),
+        (ConnectionError("unreachable"), True),
+        (EngineNotRunningError("engine is not running"), True),
+        (_status_error(503), True),
+        (_status_error(400), False),
+        (OperationalError("Error executing query:\n502 Bad Gateway"), True),
+        (OperationalError("Error executing query:\nUnknown column 'x'"), False),
+        (ProgrammingError("syntax error"), False),
+        (QueryTimeoutError("timeout"), False),
+        (ConnectionClosedError("closed"), False),
+        (ValueError("bad value"), False),
+    ],
+)
+def test_is_transient(error, transient):
+    assert is_transient(error) is transient
+
+
+def test_backoff_delay():
+    delays = [backoff_delay(attempt, 1.0, 5.0) for attempt in (1, 2, 3, 4, 5)]
+    assert all(0 <= delay <= cap for delay, cap in zip(delays, (1, 2, 4, 5, 5)))
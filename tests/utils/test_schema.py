@@ -0,0 +1,66 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from unittest import mock
+
+from firebolt_provider.utils.schema import (
+    Column,
+    SchemaCache,
+    parse_schema_rows,
+)
+
+
+def test_parse_schema_rows():
+    rows = [
+        ("Orders", "id", "INTEGER", "NO", "YES"),
+        ("Orders", "name", "TEXT", "YES", "NO"),
+        ("items", "id", "BIGINT", False, True),
+    ]
+    assert parse_schema_rows(rows) == {
+        "orders": [
+            Column("id", "INTEGER", False, True),
+            Column("name", "TEXT", True, False),
+        ],
+        "items": [Column("id", "BIGINT", False, True)],
+    }
+
+
+def test_schema_cache_ttl():
+    load = mock.Mock(return_value={"t": [Column("id", "INTEGER", False, True)]})
+    cache = SchemaCache(ttl=60)
+
+    assert cache.get_table("db", "T", load) == load.return_value["t"]
+    cache.get_table("db", "t", load)
+    assert load.call_count == 1
+
+    cache.get_table("db", "t", load, max_age=0)
+    assert load.call_count == 2
+
+    cache.invalidate("db")
+    cache.get_table("db", "t", load)
+    assert load.call_count == 3
+
+
+def test_schema_cache_reloads_missing_table():
+    load = mock.Mock(return_value={})
+    cache = SchemaCache()
+
+    assert cache.get_table("db", "t", load) is None
+    assert cache.get_table("db", "t", load) is None
+    assert load.call_count == 2
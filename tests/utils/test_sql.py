@@ -0,0 +1,185 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import pytest
+
+from firebolt_provider.utils.sql import (
+    insert_query,
+    is_cacheable,
+    is_idempotent,
+    is_read_only,
+    iter_statements,
+    join_statements,
+    modified_table,
+    referenced_tables,
+    statement_keyword,
+)
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("SELECT 1", True),
+        ("  -- comment\n(SELECT 1) UNION ALL (SELECT 2)", True),
+        ("WITH a AS (SELECT 1) SELECT * FROM a", True),
+        (["SELECT 1", "show tables"], True),
+        ("SELECT 1; INSERT INTO t VALUES (1)", False),
+        ("/* SELECT */ DROP TABLE t", False),
+        ("INSERT INTO t VALUES ('x; SELECT 1')", False),
+        ("EXPLAIN INSERT INTO t VALUES (1)", True),
+        ("EXPLAIN (ANALYZE) SELECT 1", True),
+        ("EXPLAIN (ANALYZE) INSERT INTO t VALUES (1)", False),
+        ("explain analyze delete from t", False),
+        ("", False),
+    ],
+)
+def test_is_read_only(sql, expected):
+    assert is_read_only(sql) is expected
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("SELECT * FROM t", True),
+        ("WITH a AS (SELECT 1) SELECT * FROM a", True),
+        ("SELECT table_name FROM information_schema.tables", False),
+        ("SELECT 1 -- information_schema.tables", True),
+        ("SELECT 1; SHOW TABLES", False),
+        ("EXPLAIN SELECT 1", False),
+        ("INSERT INTO t SELECT 1", False),
+    ],
+)
+def test_is_cacheable(sql, expected):
+    assert is_cacheable(sql) is expected
+
+
+def test_statement_keyword():
+    assert statement_keyword("/* c */ insert into t values (1)") == "INSERT"
+    assert statement_keyword(" ; ") == ""
+
+
+def test_referenced_tables():
+    sql = 'SELECT * FROM db.Orders o JOIN "Items" i ON o.id = i.id -- FROM skipped'
+    assert referenced_tables(sql) == {"orders", "Items"}
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("SELECT * FROM a, b AS x, c WHERE a.id = x.id", {"a", "b", "c"}),
+        ("SELECT f(x, y) FROM a JOIN b ON a.id = b.id, c", {"a", "b", "c"}),
+        ("SELECT * FROM (SELECT id FROM a, b) s, c", {"a", "b", "c"}),
+        ("SELECT * FROM a WHERE id IN (SELECT id FROM b), 'FROM c'", {"a", "b"}),
+        ("SELECT 1 FROM a UNION SELECT x, y FROM b", {"a", "b"}),
+    ],
+)
+def test_referenced_tables_from_list(sql, expected):
+    assert referenced_tables(sql) == expected
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("INSERT INTO orders VALUES (1)", "orders"),
+        ("delete from public.orders where id = 1", "orders"),
+        ("TRUNCATE TABLE orders", "orders"),
+        ("DROP TABLE IF EXISTS orders", "orders"),
+        ("CREATE FACT TABLE IF NOT EXISTS orders (id INT)", "orders"),
+        ("ALTER TABLE orders RENAME TO orders_old", "orders"),
+        ("SELECT * FROM orders", None),
+    ],
+)
+def test_modified_table(sql, expected):
+    assert modified_table(sql) == expected
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("SELECT 1; SELECT 2;", ["SELECT 1", "SELECT 2"]),
+        ("SELECT 'a;b'; SELECT 2", ["SELECT 'a;b'", "SELECT 2"]),
+        ("SELECT 'it''s;'", ["SELECT 'it''s;'"]),
+        ("SELECT E'\\';x'", ["SELECT E'\\';x'"]),
+        ('SELECT 1 AS "a;b"', ['SELECT 1 AS "a;b"']),
+        ("SELECT 1 -- a; b\n;", ["SELECT 1 -- a; b"]),
+        ("/* a; b */ SELECT 1; -- only comment;", ["/* a; b */ SELECT 1"]),
+        ("SELECT $$a;b$$; SELECT 2", ["SELECT $$a;b$$", "SELECT 2"]),
+        ("SELECT $fn$ $$; $fn$", ["SELECT $fn$ $$; $fn$"]),
+        ("SELECT $1; SELECT $2", ["SELECT $1", "SELECT $2"]),
+        (";;  ;", []),
+    ],
+)
+def test_iter_statements(sql, expected):
+    assert list(iter_statements(sql)) == expected
+
+
+def test_iter_statements_consumes_chunks_lazily():
+    consumed = []
+
+    def chunks():
+        for chunk in ["SELECT 'a", ";b'; SEL", "ECT 2;", " SELECT 3"]:
+            consumed.append(chunk)
+            yield chunk
+
+    statements = iter_statements(chunks())
+    assert next(statements) == "SELECT 'a;b'"
+    assert len(consumed) == 2
+    assert list(statements) == ["SELECT 2", "SELECT 3"]
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("SELECT 1", True),
+        ("SET time_zone = 'UTC'", True),
+        ("TRUNCATE TABLE t", True),
+        ("DROP TABLE IF EXISTS t", True),
+        ("CREATE FACT TABLE IF NOT EXISTS t (id INT)", True),
+        ("CREATE OR REPLACE VIEW v AS SELECT 1", True),
+        ("DROP TABLE t", False),
+        ("CREATE TABLE t (id INT)", False),
+        ("INSERT INTO t VALUES (1)", False),
+        ("EXPLAIN (ANALYZE) INSERT INTO t VALUES (1)", False),
+    ],
+)
+def test_is_idempotent(sql, expected):
+    assert is_idempotent(sql) is expected
+
+
+def test_join_statements_with_line_comment():
+    statements = ["INSERT INTO t VALUES (1) -- first row", "INSERT INTO t VALUES (2)"]
+
+    assert list(iter_statements(join_statements(statements))) == statements
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("INSERT INTO t SELECT * FROM s", "SELECT * FROM s"),
+        ('INSERT INTO "T" (a, b)\n(SELECT a, b FROM s)', "(SELECT a, b FROM s)"),
+        (
+            "insert into db.t WITH x AS (SELECT 1) SELECT * FROM x",
+            "WITH x AS (SELECT 1) SELECT * FROM x",
+        ),
+        ("INSERT INTO t VALUES (1)", None),
+        ("SELECT 1", None),
+    ],
+)
+def test_insert_query(sql, expected):
+    assert insert_query(sql) == expected
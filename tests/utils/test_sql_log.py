@@ -0,0 +1,63 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from firebolt_provider.utils.sql_log import (
+    StatementTimings,
+    compress,
+    decompress,
+    fingerprint,
+    preview,
+)
+
+
+def test_fingerprint():
+    assert fingerprint("SELECT * FROM t WHERE id = 1") == fingerprint(
+        "select *\n  from t where id = 42"
+    )
+    assert fingerprint("SELECT 'a'") == fingerprint("SELECT 'it''s'")
+    assert fingerprint("SELECT a FROM t") != fingerprint("SELECT b FROM t")
+
+
+def test_preview():
+    assert preview("SELECT\n   1") == "SELECT 1"
+    assert preview("x" * 300, 10) == "xxxxxxxxxx... (300 chars)"
+    assert preview([1, 2]) == "[1, 2]"
+
+
+def test_compress():
+    sql = "INSERT INTO t VALUES (1);\n" * 1000
+
+    artifact = compress(sql)
+
+    assert artifact is not None and len(artifact) < len(sql) / 10
+    assert decompress(artifact) == sql
+    assert compress(sql, max_bytes=10) is None
+
+
+def test_statement_timings():
+    timings = StatementTimings()
+    timings.add(1, 0.5, 10, "INSERT INTO t SELECT * FROM s")
+    timings.add(2, 2.0, -1, "CREATE TABLE u (id INT)")
+    timings.add(3, 0.1, 1, "SELECT 1")
+
+    lines = timings.format(limit=2).splitlines()
+    assert lines[0] == "3 statements took 2.600s, slowest 2:"
+    assert lines[2].split()[:3] == ["2", "2.000", "-"]
+    assert lines[3].split()[:3] == ["1", "0.500", "10"]
+    assert len(lines) == 4
@@ -0,0 +1,97 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import ssl
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from firebolt_provider.utils.transport import (
+    SharedTransport,
+    client_verify,
+    get_transport,
+    share_transport,
+)
+
+
+@patch.dict("firebolt_provider.utils.transport._pools", {}, clear=True)
+def test_get_transport_per_account():
+    pool = get_transport("api.app.firebolt.io", "account")
+
+    assert get_transport("api.app.firebolt.io", "account") is pool
+    assert get_transport("api.app.firebolt.io", "other") is not pool
+    assert get_transport("api.app.firebolt.io", "account", http2=True) is not pool
+
+
+@patch.dict("firebolt_provider.utils.transport._pools", {}, clear=True)
+def test_get_transport_per_verify_setting():
+    default = client_verify(httpx.Client(trust_env=False))
+    pool = get_transport("api.app.firebolt.io", "account", verify=default)
+
+    assert isinstance(default, ssl.SSLContext)
+    assert (
+        get_transport(
+            "api.app.firebolt.io",
+            "account",
+            verify=client_verify(httpx.Client(trust_env=False)),
+        )
+        is pool
+    )
+    assert (
+        get_transport(
+            "api.app.firebolt.io",
+            "account",
+            verify=client_verify(httpx.Client(trust_env=False, verify=False)),
+        )
+        is not pool
+    )
+    assert get_transport("api.app.firebolt.io", "account", verify=False) is not pool
+
+
+def test_shared_transport_keeps_pool_open():
+    pool = MagicMock()
+    pool.handle_request.return_value = httpx.Response(200)
+    client = httpx.Client(trust_env=False)
+
+    share_transport(client, SharedTransport(pool))
+    client.get("https://api.app.firebolt.io/")
+    client.close()
+
+    pool.handle_request.assert_called_once()
+    pool.close.assert_not_called()
+
+
+def test_shared_transport_compression():
+    pool = MagicMock()
+    request = httpx.Request(
+        "GET", "https://api.app.firebolt.io/", headers={"Accept-Encoding": "gzip"}
+    )
+
+    SharedTransport(pool, compression=False).handle_request(request)
+
+    assert request.headers["Accept-Encoding"] == "identity"
+
+
+def test_share_transport_skips_proxied_clients():
+    client = httpx.Client(mounts={"https://": httpx.HTTPTransport()})
+    own_transport = client._transport
+
+    share_transport(client, SharedTransport(MagicMock()))
+
+    assert client._transport is own_transport